@@ -0,0 +1,237 @@
+# core/clustering.py
+
+import numpy as np
+
+from .skills import parse_skill_names
+
+UNCLASSIFIED = "Unclassified"
+
+# Profile fields the cluster assignment depends on
+CLUSTER_INPUT_FIELDS = ('cgpa', 'backlogs', 'skills', 'placement_readiness_score')
+NUMERIC_FEATURES = ('cgpa', 'backlogs', 'placement_readiness_score')
+
+# Most common skills used as binary features, and their weight relative to
+# one standard deviation of a numeric feature
+SKILL_VOCABULARY_SIZE = 30
+SKILL_WEIGHT = 0.5
+
+DEFAULT_CLUSTERS = 4
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_ITERATIONS = 100
+
+
+def cluster_label(rank):
+    """Labels are ranked by centroid readiness: C1 is the strongest cohort."""
+    return f"C{rank + 1}"
+
+
+class StudentFeatures:
+    """
+    Turns profile rows (cgpa, backlogs, placement_readiness_score, skills)
+    into the standardized feature matrix the clusters live in.
+    """
+
+    def __init__(self, vocabulary, mean, scale):
+        self.vocabulary = list(vocabulary)
+        self.mean = np.asarray(mean, dtype=float)
+        self.scale = np.asarray(scale, dtype=float)
+        self._skill_index = {name: i for i, name in enumerate(self.vocabulary)}
+
+    @staticmethod
+    def numeric_matrix(rows):
+        return np.array(
+            [[np.nan if value is None else float(value) for value in row[:len(NUMERIC_FEATURES)]] for row in rows],
+            dtype=float,
+        ).reshape(len(rows), len(NUMERIC_FEATURES))
+
+    @classmethod
+    def fit(cls, rows, vocabulary):
+        numeric = cls.numeric_matrix(rows)
+        mean = np.nanmean(numeric, axis=0) if len(rows) else np.zeros(len(NUMERIC_FEATURES))
+        scale = np.nanstd(numeric, axis=0) if len(rows) else np.ones(len(NUMERIC_FEATURES))
+        mean = np.nan_to_num(mean)
+        scale = np.where(np.nan_to_num(scale) > 0, np.nan_to_num(scale), 1.0)
+        return cls(vocabulary, mean, scale)
+
+    def transform(self, rows):
+        # Missing values are imputed with the mean, i.e. 0 once standardized
+        numeric = np.nan_to_num((self.numeric_matrix(rows) - self.mean) / self.scale)
+        skills = np.zeros((len(rows), len(self.vocabulary)), dtype=float)
+        for i, row in enumerate(rows):
+            for name in parse_skill_names(row[-1]):
+                j = self._skill_index.get(name)
+                if j is not None:
+                    skills[i, j] = SKILL_WEIGHT
+        return np.hstack([numeric, skills])
+
+
+class MiniBatchKMeans:
+    """
+    Mini-batch k-means (Sculley, 2010): each step assigns a random batch to
+    its nearest centroids and moves each centroid towards its points with a
+    per-centroid learning rate of 1 / points seen, so centroids can keep
+    learning from new batches via partial_fit without a full refit.
+    """
+
+    def __init__(self, n_clusters=DEFAULT_CLUSTERS, centroids=None, counts=None, seed=0):
+        self.n_clusters = n_clusters
+        self.centroids = None if centroids is None else np.asarray(centroids, dtype=float)
+        self.counts = (
+            np.zeros(n_clusters) if counts is None else np.asarray(counts, dtype=float)
+        )
+        self.rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def _squared_distances(X, centroids):
+        return (
+            (X * X).sum(axis=1)[:, None]
+            - 2.0 * X @ centroids.T
+            + (centroids * centroids).sum(axis=1)[None, :]
+        )
+
+    def _init_centroids(self, X):
+        """k-means++ seeding on the first batch."""
+        k = min(self.n_clusters, len(X))
+        centroids = [X[self.rng.integers(len(X))]]
+        for _ in range(1, k):
+            d = np.maximum(self._squared_distances(X, np.array(centroids)).min(axis=1), 0.0)
+            total = d.sum()
+            p = d / total if total > 0 else None
+            centroids.append(X[self.rng.choice(len(X), p=p)])
+        self.n_clusters = k
+        self.centroids = np.array(centroids)
+        self.counts = np.zeros(k)
+
+    def predict(self, X):
+        if self.centroids is None or not len(X):
+            return np.zeros(len(X), dtype=int)
+        return self._squared_distances(X, self.centroids).argmin(axis=1)
+
+    def partial_fit(self, X):
+        if not len(X):
+            return self
+        if self.centroids is None:
+            self._init_centroids(X)
+        nearest = self.predict(X)
+        for c in np.unique(nearest):
+            points = X[nearest == c]
+            # Equivalent to moving towards each point with rate 1 / count
+            self.counts[c] += len(points)
+            rate = len(points) / self.counts[c]
+            self.centroids[c] += rate * (points.mean(axis=0) - self.centroids[c])
+        return self
+
+    def fit(self, X, batch_size=DEFAULT_BATCH_SIZE, iterations=DEFAULT_ITERATIONS):
+        self.centroids = None
+        for _ in range(iterations):
+            if len(X) <= batch_size:
+                batch = X
+            else:
+                batch = X[self.rng.choice(len(X), batch_size, replace=False)]
+            self.partial_fit(batch)
+        return self
+
+    def inertia(self, X):
+        if self.centroids is None or not len(X):
+            return 0.0
+        return float(np.maximum(self._squared_distances(X, self.centroids).min(axis=1), 0.0).sum())
+
+
+# --- FITTING AND ASSIGNMENT (refit command and StudentProfile.save) ---
+PROFILE_COLUMNS = NUMERIC_FEATURES + ('skills',)
+ASSIGN_CHUNK_SIZE = 1000
+
+
+def profile_row(student_profile):
+    return tuple(getattr(student_profile, field) for field in PROFILE_COLUMNS)
+
+
+def skill_vocabulary(limit=SKILL_VOCABULARY_SIZE):
+    """The `limit` skills held by the most students."""
+    from django.db.models import Count
+    from .models import Skill
+    return list(
+        Skill.objects.annotate(num_students=Count('students'))
+        .filter(num_students__gt=0)
+        .order_by('-num_students', 'name')
+        .values_list('name', flat=True)[:limit]
+    )
+
+
+def refit_clusters(n_clusters=DEFAULT_CLUSTERS, batch_size=DEFAULT_BATCH_SIZE,
+                   iterations=DEFAULT_ITERATIONS, seed=0):
+    """
+    Fits a new clustering over every student, activates it and re-labels
+    every profile. Returns the new StudentClusterModel (None without students).
+    """
+    from django.db import transaction
+    from .models import StudentClusterModel, StudentProfile
+
+    rows = list(StudentProfile.objects.values_list(*PROFILE_COLUMNS).iterator(chunk_size=ASSIGN_CHUNK_SIZE))
+    if not rows:
+        return None
+    features = StudentFeatures.fit(rows, skill_vocabulary())
+    X = features.transform(rows)
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, seed=seed).fit(X, batch_size=batch_size, iterations=iterations)
+
+    # Rank clusters by their readiness centroid so labels read strongest-first
+    readiness_column = NUMERIC_FEATURES.index('placement_readiness_score')
+    ranks = np.argsort(np.argsort(-kmeans.centroids[:, readiness_column], kind='stable'))
+
+    with transaction.atomic():
+        StudentClusterModel.objects.filter(is_active=True).update(is_active=False)
+        cluster_model = StudentClusterModel.objects.create(
+            is_active=True,
+            vocabulary=features.vocabulary,
+            feature_mean=features.mean.tolist(),
+            feature_scale=features.scale.tolist(),
+            centroids=kmeans.centroids.tolist(),
+            counts=kmeans.counts.tolist(),
+            labels=[cluster_label(rank) for rank in ranks.tolist()],
+            n_samples=len(rows),
+            inertia=kmeans.inertia(X),
+        )
+        assign_clusters(StudentProfile.objects.all(), cluster_model)
+    return cluster_model
+
+
+def partial_fit_clusters(students, cluster_model):
+    """
+    Moves the active centroids towards the given students (e.g. the ones
+    added since the last refit) and labels them, without a full refit.
+    """
+    rows = list(students.values_list(*PROFILE_COLUMNS))
+    if not rows:
+        return 0
+    kmeans = cluster_model.kmeans()
+    kmeans.partial_fit(cluster_model.features().transform(rows))
+    cluster_model.centroids = kmeans.centroids.tolist()
+    cluster_model.counts = kmeans.counts.tolist()
+    cluster_model.n_samples += len(rows)
+    cluster_model.save(update_fields=['centroids', 'counts', 'n_samples'])
+    return assign_clusters(students, cluster_model)
+
+
+def assign_clusters(students, cluster_model):
+    """Labels every profile in the queryset with its nearest centroid; returns rows changed."""
+    changed = 0
+    chunk = []
+    for row in students.order_by('pk').values_list('pk', 'cluster_id', *PROFILE_COLUMNS).iterator(chunk_size=ASSIGN_CHUNK_SIZE):
+        chunk.append(row)
+        if len(chunk) == ASSIGN_CHUNK_SIZE:
+            changed += _assign_chunk(students.model, chunk, cluster_model)
+            chunk = []
+    if chunk:
+        changed += _assign_chunk(students.model, chunk, cluster_model)
+    return changed
+
+
+def _assign_chunk(model, rows, cluster_model):
+    labels = cluster_model.assign([row[2:] for row in rows])
+    stale = [
+        model(pk=row[0], cluster_id=label)
+        for row, label in zip(rows, labels)
+        if row[1] != label
+    ]
+    model.objects.bulk_update(stale, ['cluster_id'])
+    return len(stale)
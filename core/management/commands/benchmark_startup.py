@@ -0,0 +1,41 @@
+# core/management/commands/benchmark_startup.py
+
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Each scenario runs in a fresh interpreter, like a newly started worker
+SCENARIOS = (
+    ("import views (lazy NLP)", "import core.views, placement.views"),
+    ("import views + warm_up()", "import core.views, placement.views\nfrom core.nlp import warm_up\nwarm_up()"),
+)
+
+
+class Command(BaseCommand):
+    help = "Measures cold-start time of a worker process with and without loading the NLP resources."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5)
+
+    def handle(self, *args, **options):
+        settings_module = settings.SETTINGS_MODULE
+        for label, code in SCENARIOS:
+            script = (
+                "import os, django\n"
+                f"os.environ.setdefault('DJANGO_SETTINGS_MODULE', {settings_module!r})\n"
+                "django.setup()\n"
+                f"{code}\n"
+            )
+            timings = []
+            for _ in range(options['runs']):
+                started = time.perf_counter()
+                subprocess.run([sys.executable, '-c', script], check=True, capture_output=True)
+                timings.append(time.perf_counter() - started)
+            self.stdout.write(
+                f"{label:<28} median {statistics.median(timings) * 1000:8.1f} ms   "
+                f"min {min(timings) * 1000:8.1f} ms   ({options['runs']} runs)"
+            )
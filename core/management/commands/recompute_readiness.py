@@ -0,0 +1,35 @@
+# core/management/commands/recompute_readiness.py
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from core.models import StudentProfile
+from core.readiness import READINESS_BATCH_SIZE, recompute_readiness_scores
+
+
+class Command(BaseCommand):
+    help = "Recomputes placement readiness scores in batches (e.g. after a bulk import that bypassed save())."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--branch', help="Only students whose branch contains this text.")
+        parser.add_argument('--min-cgpa', type=float, help="Only students with at least this CGPA.")
+        parser.add_argument('--max-backlogs', type=int, help="Only students with at most this many backlogs.")
+        parser.add_argument('--unscored', action='store_true', help="Only students whose score is still 0.")
+        parser.add_argument('--chunk-size', type=int, default=READINESS_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        students = StudentProfile.objects.all()
+        if options['branch']:
+            students = students.filter(branch__icontains=options['branch'])
+        if options['min_cgpa'] is not None:
+            students = students.filter(cgpa__gte=options['min_cgpa'])
+        if options['max_backlogs'] is not None:
+            students = students.filter(backlogs__lte=options['max_backlogs'])
+        if options['unscored']:
+            students = students.filter(Q(placement_readiness_score=0.0) | Q(placement_readiness_score__isnull=True))
+
+        scanned, updated, seconds = recompute_readiness_scores(students, chunk_size=options['chunk_size'])
+        rate = scanned / seconds if seconds else scanned
+        self.stdout.write(self.style.SUCCESS(
+            f"Scanned {scanned} profiles, updated {updated} in {seconds:.2f}s ({rate:.0f} rows/s)."
+        ))
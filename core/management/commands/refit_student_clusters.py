@@ -0,0 +1,52 @@
+# core/management/commands/refit_student_clusters.py
+
+from django.core.management.base import BaseCommand
+
+from core.clustering import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CLUSTERS,
+    DEFAULT_ITERATIONS,
+    UNCLASSIFIED,
+    partial_fit_clusters,
+    refit_clusters,
+)
+from core.models import StudentClusterModel, StudentProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "Refits the student clusters with mini-batch k-means and re-labels every profile. "
+        "Meant to run periodically (e.g. nightly from cron); new profiles are assigned to "
+        "the existing centroids on save in between."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clusters', type=int, default=DEFAULT_CLUSTERS)
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--incremental', action='store_true',
+            help="Only update the active centroids with unclassified students instead of refitting.",
+        )
+
+    def handle(self, *args, **options):
+        active = StudentClusterModel.get_active()
+        if options['incremental'] and active is not None:
+            labelled = partial_fit_clusters(StudentProfile.objects.filter(cluster_id=UNCLASSIFIED), active)
+            self.stdout.write(self.style.SUCCESS(f"Updated clustering #{active.pk}; labelled {labelled} students."))
+            return
+
+        cluster_model = refit_clusters(
+            n_clusters=options['clusters'],
+            batch_size=options['batch_size'],
+            iterations=options['iterations'],
+            seed=options['seed'],
+        )
+        if cluster_model is None:
+            self.stdout.write(self.style.WARNING("No students to cluster."))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"Fitted clustering #{cluster_model.pk}: {len(cluster_model.labels)} clusters over "
+            f"{cluster_model.n_samples} students (inertia {cluster_model.inertia:.2f})."
+        ))
@@ -0,0 +1,135 @@
+# core/management/commands/reparse_resumes.py
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.clustering import assign_clusters
+from core.models import StudentClusterModel, StudentProfile
+from core.readiness import recompute_readiness_scores
+from core.resume_parser import (
+    PARSED_RESUME_FIELDS,
+    RESUME_PIPE_BATCH_SIZE,
+    apply_parsed_resume,
+    cached_parse_results,
+    parse_resume_texts,
+    read_resume_text,
+    resume_content_hash,
+    store_parse_results,
+)
+from core.search import index_resumes
+from core.skills import sync_skill_sets
+from placement.match_table import refresh_student_matches
+
+
+def _hash(path):
+    try:
+        return resume_content_hash(path)
+    except OSError:
+        return None
+
+
+def _extract(path):
+    # Runs in a pool process: file I/O and PDF/DOCX decoding only, no ORM.
+    # Returns (text, whether the result may be cached)
+    try:
+        extracted = read_resume_text(path)
+    except Exception:
+        return None, False
+    if extracted is None or extracted.stopped_by == 'error':
+        return None, False
+    return extracted.text, extracted.cacheable
+
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-parses every stored resume (e.g. after the skill list or extraction rules change): "
+        "files already parsed by the current parser version come from the parse cache, the rest "
+        "are extracted in a process pool and run through nlp.pipe, and results are written back "
+        "with bulk_update."
+    )
+
+    def add_arguments(self, parser):
+        cpus = os.cpu_count() or 1
+        parser.add_argument('--processes', type=int, default=cpus, help="Text extraction processes.")
+        parser.add_argument('--nlp-processes', type=int, default=1, help="n_process for nlp.pipe.")
+        parser.add_argument('--batch-size', type=int, default=RESUME_PIPE_BATCH_SIZE, help="nlp.pipe batch size.")
+        parser.add_argument('--chunk-size', type=int, default=500, help="Profiles written per bulk_update.")
+
+    def handle(self, *args, **options):
+        storage = StudentProfile._meta.get_field('resume_file').storage
+        with_resume = StudentProfile.objects.exclude(resume_file='').exclude(resume_file__isnull=True)
+        # Ids first, so no cursor stays open over the table while chunks are written
+        ids = list(with_resume.order_by('pk').values_list('pk', flat=True))
+        chunk_size = options['chunk_size']
+        started = time.monotonic()
+        total = 0
+
+        with ProcessPoolExecutor(max_workers=options['processes']) as pool:
+            for start in range(0, len(ids), chunk_size):
+                rows = list(
+                    StudentProfile.objects.filter(pk__in=ids[start:start + chunk_size])
+                    .order_by('pk').values_list('pk', 'resume_file', 'cgpa', 'backlogs')
+                )
+                total += self._reparse_chunk(rows, pool, storage, options)
+
+        seconds = time.monotonic() - started
+        rate = total / seconds if seconds else total
+        self.stdout.write(self.style.SUCCESS(f"Re-parsed {total} resumes in {seconds:.1f}s ({rate:.1f}/s)."))
+
+    def _reparse_chunk(self, rows, pool, storage, options):
+        paths = [storage.path(name) for _, name, _, _ in rows]
+        chunksize = max(1, len(paths) // (options['processes'] * 4))
+        hashes = list(pool.map(_hash, paths, chunksize=chunksize))
+        results = cached_parse_results([h for h in hashes if h is not None])
+
+        # Only files the current parser version has not seen are extracted and parsed
+        misses = {}
+        for path, content_hash in zip(paths, hashes):
+            if content_hash is not None and content_hash not in results:
+                misses.setdefault(content_hash, path)
+        extracted = list(pool.map(_extract, misses.values(), chunksize=chunksize))
+        # Unsupported or unreadable files keep their current profile data
+        parseable = [
+            (content_hash, text, cacheable)
+            for content_hash, (text, cacheable) in zip(misses, extracted) if text is not None
+        ]
+        parsed = dict(zip(
+            [content_hash for content_hash, _, _ in parseable],
+            parse_resume_texts(
+                [text for _, text, _ in parseable], batch_size=options['batch_size'], n_process=options['nlp_processes'],
+            ),
+        ))
+        store_parse_results({
+            content_hash: parsed[content_hash] for content_hash, _, cacheable in parseable if cacheable
+        })
+        results.update(parsed)
+
+        profiles = []
+        for (pk, _, cgpa, backlogs), content_hash in zip(rows, hashes):
+            parsed_data = results.get(content_hash)
+            if parsed_data is None:
+                continue
+            profile = StudentProfile(pk=pk, cgpa=cgpa, backlogs=backlogs, resume_parse_status='done')
+            apply_parsed_resume(profile, parsed_data)
+            profiles.append(profile)
+        if not profiles:
+            return 0
+
+        ids = [profile.pk for profile in profiles]
+        with transaction.atomic():
+            StudentProfile.objects.bulk_update(profiles, PARSED_RESUME_FIELDS + ['resume_parse_status'])
+            # bulk_update skips save(): refresh the state derived from these fields in bulk
+            sync_skill_sets({profile.pk: profile.skills for profile in profiles})
+            recompute_readiness_scores(StudentProfile.objects.filter(pk__in=ids))
+            cluster_model = StudentClusterModel.get_active()
+            if cluster_model is not None:
+                assign_clusters(StudentProfile.objects.filter(pk__in=ids), cluster_model)
+            refresh_student_matches(ids)
+            index_resumes(ids)
+        self.stdout.write(f"  {len(profiles)} profiles updated ({len(parsed)} parsed, the rest from the parse cache)")
+        return len(profiles)
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:19
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of core.skills.parse_skill_names as it was when this migration
+# was written, so later changes can't alter the backfill.
+SKILL_SEPARATORS = re.compile(r'[,\n\r;|]+')
+WHITESPACE = re.compile(r'\s+')
+
+
+def parse_skill_names(skills_text):
+    names = []
+    for part in SKILL_SEPARATORS.split(skills_text or ''):
+        name = WHITESPACE.sub(' ', part.strip()).lower()[:100]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def index_existing_skills(apps, schema_editor):
+    Skill = apps.get_model('core', 'Skill')
+    StudentProfile = apps.get_model('core', 'StudentProfile')
+    Link = StudentProfile.skill_set.through
+    names_by_student = {
+        profile_id: parse_skill_names(skills)
+        for profile_id, skills in StudentProfile.objects.exclude(skills__isnull=True).values_list('pk', 'skills')
+    }
+    all_names = sorted({name for names in names_by_student.values() for name in names})
+    Skill.objects.bulk_create([Skill(name=name) for name in all_names], batch_size=1000, ignore_conflicts=True)
+    skill_ids = dict(Skill.objects.values_list('name', 'pk'))
+    Link.objects.bulk_create([
+        Link(studentprofile_id=profile_id, skill_id=skill_ids[name])
+        for profile_id, names in names_by_student.items()
+        for name in names
+    ], batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_studentprofile_cluster_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='skill_set',
+            field=models.ManyToManyField(blank=True, related_name='students', to='core.skill'),
+        ),
+        migrations.RunPython(index_existing_skills, migrations.RunPython.noop),
+    ]
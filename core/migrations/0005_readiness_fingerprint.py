@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:21
+
+import hashlib
+
+from django.db import migrations, models
+
+# Frozen copy of core.readiness (READINESS_VERSION 1) as it was when this
+# migration was written, so later changes can't alter the backfill.
+READINESS_VERSION = 1
+
+
+def readiness_fingerprint(inputs):
+    return hashlib.sha1(repr((READINESS_VERSION,) + tuple(inputs)).encode()).hexdigest()
+
+
+def compute_readiness_score(cgpa, backlogs, has_skills, has_resume, has_experience):
+    score = 0
+    if cgpa is not None:
+        score += min(cgpa / 10.0 * 30, 30)
+    if backlogs is not None:
+        if backlogs == 0:
+            score += 30
+        elif backlogs == 1:
+            score += 30 * 0.5
+        else:
+            score += 30 * 0.1
+    if has_skills:
+        score += 20
+    if has_resume:
+        score += 10
+    if has_experience:
+        score += 10
+    return round(min(score, 100), 2)
+
+
+def fingerprint_existing_scores(apps, schema_editor):
+    StudentProfile = apps.get_model('core', 'StudentProfile')
+    profiles = []
+    rows = StudentProfile.objects.values_list('pk', 'cgpa', 'backlogs', 'skills', 'resume_file', 'experience')
+    for pk, cgpa, backlogs, skills, resume_file, experience in rows.iterator():
+        inputs = (None if cgpa is None else float(cgpa), backlogs, bool(skills), bool(resume_file), bool(experience))
+        profiles.append(StudentProfile(
+            pk=pk,
+            placement_readiness_score=compute_readiness_score(*inputs),
+            readiness_fingerprint=readiness_fingerprint(inputs),
+        ))
+    StudentProfile.objects.bulk_update(profiles, ['placement_readiness_score', 'readiness_fingerprint'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_skill_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='readiness_fingerprint',
+            field=models.CharField(blank=True, default='', editable=False, max_length=40),
+        ),
+        migrations.RunPython(fingerprint_existing_scores, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_readiness_fingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentClusterModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('is_active', models.BooleanField(db_index=True, default=False)),
+                ('vocabulary', models.JSONField(default=list)),
+                ('feature_mean', models.JSONField(default=list)),
+                ('feature_scale', models.JSONField(default=list)),
+                ('centroids', models.JSONField(default=list)),
+                ('counts', models.JSONField(default=list)),
+                ('labels', models.JSONField(default=list)),
+                ('n_samples', models.PositiveIntegerField(default=0)),
+                ('inertia', models.FloatField(default=0.0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_studentclustermodel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='resume_parse_status',
+            field=models.CharField(choices=[('idle', 'Not Parsed'), ('queued', 'Queued'), ('running', 'Parsing'), ('done', 'Parsed'), ('failed', 'Failed')], default='idle', editable=False, max_length=10),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:38
+
+from django.db import migrations, models
+
+
+def create_resume_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS core_resume_fts USING fts5("
+        "resume_text, tokenize='unicode61')"
+    )
+
+
+def drop_resume_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS core_resume_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_resumeparsecache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='resume_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        # Filled as resumes are parsed; `manage.py reparse_resumes` backfills existing ones
+        migrations.RunPython(create_resume_fts, drop_resume_fts),
+    ]
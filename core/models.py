@@ -2,6 +2,55 @@
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.fields.files import FieldFile
+
+from .clustering import CLUSTER_INPUT_FIELDS, UNCLASSIFIED, MiniBatchKMeans, StudentFeatures, profile_row
+from .readiness import READINESS_INPUT_FIELDS, compute_readiness_score, readiness_fingerprint, readiness_inputs
+from .skills import get_or_create_skills, parse_skill_names
+
+
+class TrackedFieldsMixin:
+    """
+    Remembers the values of `tracked_fields` as they were loaded from (or last
+    saved to) the database, so save hooks can tell which inputs changed.
+    """
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def _tracked_value(self, name):
+        value = self.__dict__.get(self._meta.get_field(name).attname, models.DEFERRED)
+        if isinstance(value, FieldFile):
+            return value.name or None
+        # Treat blank and NULL text as the same value
+        return None if value == "" else value
+
+    def _snapshot_tracked_fields(self):
+        self._tracked_snapshot = {
+            name: self._tracked_value(name)
+            for name in self.tracked_fields
+            if self._tracked_value(name) is not models.DEFERRED
+        }
+
+    def changed_fields(self):
+        """Tracked fields whose value differs from the last loaded/saved state."""
+        snapshot = getattr(self, '_tracked_snapshot', None)
+        if snapshot is None or self._state.adding:
+            return set(self.tracked_fields)
+        return {
+            name for name in self.tracked_fields
+            if self._tracked_value(name) is not models.DEFERRED
+            and (name not in snapshot or self._tracked_value(name) != snapshot[name])
+        }
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._snapshot_tracked_fields()
+
 
 class User(AbstractUser):
     USER_TYPE_CHOICES = (
@@ -14,7 +63,68 @@ class User(AbstractUser):
     def __str__(self):
         return self.username
 
-class StudentProfile(models.Model):
+class Skill(models.Model):
+    # Normalized name (see core.skills.normalize_skill), e.g. "machine learning"
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class ResumeParseCache(models.Model):
+    """Parsed resume fields keyed by the file's SHA-256 and the parser version (see core.resume_parser)."""
+    content_hash = models.CharField(max_length=64)
+    parser_version = models.CharField(max_length=200)
+    result = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('content_hash', 'parser_version')
+
+    def __str__(self):
+        return f"{self.content_hash[:12]} ({self.parser_version})"
+
+
+class StudentClusterModel(models.Model):
+    """A fitted student clustering (see core.clustering); only one is active at a time."""
+    created_at = models.DateTimeField(auto_now_add=True)
+    is_active = models.BooleanField(default=False, db_index=True)
+    vocabulary = models.JSONField(default=list)
+    feature_mean = models.JSONField(default=list)
+    feature_scale = models.JSONField(default=list)
+    centroids = models.JSONField(default=list)
+    # Points each centroid has learned from, for mini-batch learning rates
+    counts = models.JSONField(default=list)
+    labels = models.JSONField(default=list)
+    n_samples = models.PositiveIntegerField(default=0)
+    inertia = models.FloatField(default=0.0)
+
+    def __str__(self):
+        return f"Clustering #{self.pk} ({len(self.labels)} clusters, {self.n_samples} students)"
+
+    @classmethod
+    def get_active(cls):
+        return cls.objects.filter(is_active=True).order_by('-pk').first()
+
+    def features(self):
+        return StudentFeatures(self.vocabulary, self.feature_mean, self.feature_scale)
+
+    def kmeans(self):
+        return MiniBatchKMeans(n_clusters=len(self.centroids), centroids=self.centroids, counts=self.counts)
+
+    def assign(self, rows):
+        """Cluster labels for profile rows (see core.clustering.PROFILE_COLUMNS)."""
+        if not rows:
+            return []
+        nearest = self.kmeans().predict(self.features().transform(rows))
+        return [self.labels[i] for i in nearest.tolist()]
+
+
+class StudentProfile(TrackedFieldsMixin, models.Model):
+    # Inputs to the per-job match rows kept in placement.StudentJobMatch
+    MATCH_INPUT_FIELDS = ('cgpa', 'backlogs', 'branch')
+    tracked_fields = MATCH_INPUT_FIELDS + ('skills', 'resume_file', 'experience', 'resume_text')
+
     user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='student_profile')
     roll_number = models.CharField(max_length=20, unique=True) # This MUST be unique=True here (model field)
     branch = models.CharField(max_length=50)
@@ -22,6 +132,8 @@ class StudentProfile(models.Model):
     backlogs = models.IntegerField(default=0)
     # Store parsed resume data here or a reference to it
     skills = models.TextField(blank=True, null=True)
+    # Indexed copy of `skills`, re-synced whenever the text changes
+    skill_set = models.ManyToManyField(Skill, blank=True, related_name='students')
     education = models.TextField(blank=True, null=True)
     experience = models.TextField(blank=True, null=True)
     phone_number = models.CharField(max_length=15, blank=True, null=True)
@@ -29,13 +141,79 @@ class StudentProfile(models.Model):
 
     # Field to store the actual resume file
     resume_file = models.FileField(upload_to='resumes/', blank=True, null=True)
+    # Progress of the background resume parse (see core.tasks.parse_resume)
+    RESUME_PARSE_STATUS_CHOICES = (
+        ('idle', 'Not Parsed'),
+        ('queued', 'Queued'),
+        ('running', 'Parsing'),
+        ('done', 'Parsed'),
+        ('failed', 'Failed'),
+    )
+    resume_parse_status = models.CharField(max_length=10, choices=RESUME_PARSE_STATUS_CHOICES, default='idle', editable=False)
+    # Extracted resume text, also indexed for the admin resume search (see core.search)
+    resume_text = models.TextField(blank=True, default='', editable=False)
 
     # --- NEW FIELD FOR ML/READINESS SCORE ---
     placement_readiness_score = models.DecimalField(max_digits=5, decimal_places=2, default=0.0, verbose_name='Readiness Score')
+    # Hash of the inputs the stored score was computed from (see core.readiness)
+    readiness_fingerprint = models.CharField(max_length=40, blank=True, default='', editable=False)
     # ----------------------------------------
 
+    # Cohort label from the active StudentClusterModel, assigned on save
+    cluster_id = models.CharField(max_length=50, default=UNCLASSIFIED, verbose_name="ML Cluster")
+
     def __str__(self):
         return f"{self.user.username} - {self.roll_number}"
 
+    def save(self, *args, **kwargs):
+        changed = self.changed_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            changed &= set(update_fields)
+
+        # Readiness is derived state: only recompute it when one of its inputs changed
+        score_changed = False
+        if changed & set(READINESS_INPUT_FIELDS) or not self.readiness_fingerprint:
+            score_changed = self.refresh_readiness_score()
+            if score_changed and update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'placement_readiness_score', 'readiness_fingerprint'}
+
+        # New or changed profiles join the nearest existing cluster (no refit)
+        if changed & set(CLUSTER_INPUT_FIELDS) or score_changed:
+            if self.assign_cluster() and kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = set(kwargs['update_fields']) | {'cluster_id'}
+
+        super().save(*args, **kwargs)
+        if 'skills' in changed:
+            self.sync_skill_set()
+
+    def refresh_readiness_score(self):
+        """
+        Recomputes placement_readiness_score if its fingerprint is stale.
+        Returns True when the score fields were updated (the caller saves them).
+        """
+        inputs = readiness_inputs(self)
+        fingerprint = readiness_fingerprint(inputs)
+        if fingerprint == self.readiness_fingerprint:
+            return False
+        self.placement_readiness_score = compute_readiness_score(*inputs)
+        self.readiness_fingerprint = fingerprint
+        return True
+
+    def assign_cluster(self):
+        """Sets cluster_id from the active clustering. Returns True if it changed."""
+        cluster_model = StudentClusterModel.get_active()
+        if cluster_model is None:
+            return False
+        label = cluster_model.assign([profile_row(self)])[0]
+        if label == self.cluster_id:
+            return False
+        self.cluster_id = label
+        return True
+
+    def sync_skill_set(self):
+        """Rebuilds the skill_set links from the free-text `skills` field."""
+        self.skill_set.set(get_or_create_skills(parse_skill_names(self.skills)))
+
 # Admin doesn't need a separate profile model unless you have specific admin-only fields
 # that are not covered by the default AbstractUser.
\ No newline at end of file
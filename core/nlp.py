@@ -0,0 +1,62 @@
+# core/nlp.py
+
+import importlib.metadata
+import logging
+import os
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """
+    The process-wide spaCy pipeline, loaded on first use (None if spaCy or
+    the SPACY_MODEL package is not installed). Importing this module is
+    cheap; only the first call pays for `import spacy` and the model load.
+    """
+    global _nlp, _nlp_loaded
+    if _nlp_loaded:
+        return _nlp
+    with _nlp_lock:
+        if not _nlp_loaded:
+            model = getattr(settings, 'SPACY_MODEL', DEFAULT_SPACY_MODEL)
+            try:
+                import spacy
+                _nlp = spacy.load(model)
+            except (ImportError, OSError):
+                logger.error("spaCy model %r not found. Please run 'python -m spacy download %s'", model, model)
+                _nlp = None
+            _nlp_loaded = True
+    return _nlp
+
+
+def warm_up():
+    """
+    Loads the NLP pipeline and the document readers up front, e.g. in a web
+    worker before it takes traffic (see NLP_WARM_UP in settings).
+    """
+    import docx  # noqa: F401
+    import PyPDF2  # noqa: F401
+    return get_nlp()
+
+
+def nlp_model_id():
+    """
+    Identifies the configured spaCy model (name plus installed version, or
+    "missing") without loading it, for parse-result cache keys.
+    """
+    model = getattr(settings, 'SPACY_MODEL', DEFAULT_SPACY_MODEL)
+    if os.path.isdir(model):
+        return f"{model}@{os.path.getmtime(model):.0f}"
+    try:
+        return f"{model}@{importlib.metadata.version(model)}"
+    except importlib.metadata.PackageNotFoundError:
+        return f"{model}@missing"
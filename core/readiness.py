@@ -0,0 +1,143 @@
+# core/readiness.py
+
+import hashlib
+import time
+
+import numpy as np
+
+# Bump when the weights or rules below change so stored scores are seen as stale
+READINESS_VERSION = 1
+
+READINESS_INPUT_FIELDS = ('cgpa', 'backlogs', 'skills', 'resume_file', 'experience')
+
+# Weights for different factors
+READINESS_WEIGHTS = {
+    'cgpa': 30,
+    'backlogs': 30,
+    'skills': 20,
+    'resume_file': 10,
+    'experience': 10,
+}
+
+
+def readiness_inputs(student_profile):
+    """The values the readiness score actually depends on."""
+    return (
+        None if student_profile.cgpa is None else float(student_profile.cgpa),
+        student_profile.backlogs,
+        bool(student_profile.skills),
+        bool(student_profile.resume_file),
+        bool(student_profile.experience),
+    )
+
+
+def readiness_fingerprint(inputs):
+    """Short hash of the scoring version and inputs, stored next to the score."""
+    return hashlib.sha1(repr((READINESS_VERSION,) + tuple(inputs)).encode()).hexdigest()
+
+
+def compute_readiness_score(cgpa, backlogs, has_skills, has_resume, has_experience):
+    """Calculates a simple readiness score (0-100) based on profile completeness and metrics."""
+    score = 0
+    max_score = 100
+    weights = READINESS_WEIGHTS
+
+    # 1. CGPA Score (Max 30)
+    if cgpa is not None:
+        # Assuming max CGPA is 10.0, scale to 30. Example: CGPA 9.0 -> 27/30
+        score += min(cgpa / 10.0 * weights['cgpa'], weights['cgpa'])
+
+    # 2. Backlogs Score (Max 30) - Inverse correlation
+    if backlogs is not None:
+        if backlogs == 0:
+            score += weights['backlogs']  # Perfect score for 0 backlogs
+        elif backlogs == 1:
+            score += weights['backlogs'] * 0.5  # 50% penalty for 1 backlog
+        else:
+            score += weights['backlogs'] * 0.1  # Heavy penalty for >1 backlog
+
+    # 3. Skills (Max 20) - Simple check for presence
+    if has_skills:
+        score += weights['skills']
+
+    # 4. Resume File (Max 10)
+    if has_resume:
+        score += weights['resume_file']
+
+    # 5. Experience/Projects (Max 10)
+    if has_experience:
+        score += weights['experience']
+
+    # Cap score at 100 just in case
+    return round(min(score, max_score), 2)
+
+
+# --- BULK RECOMPUTATION (management command and admin action) ---
+READINESS_BATCH_SIZE = 1000
+READINESS_BATCH_COLUMNS = ('pk', 'cgpa', 'backlogs', 'skills', 'resume_file', 'experience', 'readiness_fingerprint')
+
+
+def readiness_score_columns(cgpa, backlogs, has_skills, has_resume, has_experience):
+    """
+    Vectorized compute_readiness_score over parallel arrays: `cgpa` is a
+    float array (NaN when missing), `backlogs` a float array (NaN when
+    missing) and the rest boolean arrays. Returns unrounded scores.
+    """
+    weights = READINESS_WEIGHTS
+    score = np.where(np.isnan(cgpa), 0.0, np.minimum(cgpa / 10.0 * weights['cgpa'], weights['cgpa']))
+    score += np.select(
+        [backlogs == 0, backlogs == 1, backlogs > 1],
+        [weights['backlogs'], weights['backlogs'] * 0.5, weights['backlogs'] * 0.1],
+        default=0.0,
+    )
+    score += np.where(has_skills, weights['skills'], 0)
+    score += np.where(has_resume, weights['resume_file'], 0)
+    score += np.where(has_experience, weights['experience'], 0)
+    return np.minimum(score, 100)
+
+
+def _recompute_chunk(model, rows):
+    pks, cgpa, backlogs, skills, resume_file, experience, fingerprints = zip(*rows)
+    cgpa = [None if value is None else float(value) for value in cgpa]
+    has_skills = [bool(value) for value in skills]
+    has_resume = [bool(value) for value in resume_file]
+    has_experience = [bool(value) for value in experience]
+
+    scores = readiness_score_columns(
+        np.array([np.nan if value is None else value for value in cgpa], dtype=float),
+        np.array([np.nan if value is None else value for value in backlogs], dtype=float),
+        np.array(has_skills, dtype=bool),
+        np.array(has_resume, dtype=bool),
+        np.array(has_experience, dtype=bool),
+    ).tolist()
+
+    stale = []
+    for i, pk in enumerate(pks):
+        fingerprint = readiness_fingerprint((cgpa[i], backlogs[i], has_skills[i], has_resume[i], has_experience[i]))
+        if fingerprint != fingerprints[i]:
+            stale.append(model(pk=pk, placement_readiness_score=round(scores[i], 2), readiness_fingerprint=fingerprint))
+    model.objects.bulk_update(stale, ['placement_readiness_score', 'readiness_fingerprint'])
+    return len(stale)
+
+
+def recompute_readiness_scores(students, chunk_size=READINESS_BATCH_SIZE):
+    """
+    Recomputes the readiness score of every StudentProfile in the queryset,
+    scoring `chunk_size` rows at a time and writing only the rows whose
+    fingerprint is stale with one bulk_update per chunk.
+
+    Returns (rows_scanned, rows_updated, seconds).
+    """
+    started = time.monotonic()
+    scanned = updated = 0
+    chunk = []
+    for row in students.order_by('pk').values_list(*READINESS_BATCH_COLUMNS).iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            updated += _recompute_chunk(students.model, chunk)
+            scanned += len(chunk)
+            chunk = []
+    if chunk:
+        updated += _recompute_chunk(students.model, chunk)
+        scanned += len(chunk)
+    return scanned, updated, time.monotonic() - started
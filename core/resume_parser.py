@@ -0,0 +1,362 @@
+# core/resume_parser.py
+
+import hashlib
+import logging
+import os
+import re
+import time
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+
+from .nlp import get_nlp, nlp_model_id
+from .skill_dictionary import extract_skills, skill_dictionary_version
+
+logger = logging.getLogger(__name__)
+
+EMPTY_PARSE = {'skills': '', 'education': '', 'experience': '', 'phone_number': '', 'cgpa': None, 'backlogs': None, 'resume_text': ''}
+PARSED_RESUME_FIELDS = ['skills', 'education', 'experience', 'phone_number', 'cgpa', 'backlogs', 'resume_text']
+
+# The extraction only reads entities (ner) and sentences (parser)
+RESUME_PIPE_DISABLE = ('tagger', 'attribute_ruler', 'lemmatizer')
+RESUME_PIPE_BATCH_SIZE = 64
+
+# Bump whenever the extraction rules below change, so cached results from
+# the old rules stop matching (see resume_parser_version)
+PARSER_VERSION = 3
+
+# --- BOUNDED TEXT EXTRACTION ---
+# Defaults for the RESUME_MAX_PAGES, RESUME_MAX_TEXT_BYTES and
+# RESUME_EXTRACT_TIMEOUT settings; RESUME_EXTRACT_STOP_EARLY stops reading
+# once CGPA, backlogs and phone number have all been seen
+DEFAULT_MAX_PAGES = 10
+DEFAULT_MAX_TEXT_BYTES = 200_000
+DEFAULT_EXTRACT_TIMEOUT = 10.0
+
+CGPA_RE = re.compile(r'(cgpa|gpa|score|percentage)\D*(\d\.\d{1,2}|\d{2,3})', re.IGNORECASE)
+BACKLOGS_RE = re.compile(r'(backlogs|arrears|backlog|arrear)\D*(\d+)', re.IGNORECASE)
+INDIAN_PHONE_RE = re.compile(r'\b(?:\+91[\s-]?)?[6789]\d{9}\b')
+PHONE_RE = re.compile(r'\b(?:\+?\d{1,3}[-. ]?)?\(?\d{3}\)?[-. ]?\d{3}[-. ]?\d{4}\b')
+
+
+class ResumeParseError(Exception):
+    """The resume file can't be parsed (unsupported type or unreadable); retrying won't help."""
+
+
+class ResumeText(NamedTuple):
+    text: str
+    pages: int  # pages (PDF) or paragraphs (DOCX) read
+    # None when the whole document was read, else 'pages', 'bytes', 'time',
+    # 'fields' or 'error' (the file could not be decoded past this point)
+    stopped_by: Optional[str]
+
+    @property
+    def cacheable(self):
+        # A time-limited read depends on load, and a failed one may be transient
+        return self.stopped_by not in ('time', 'error')
+
+
+def extraction_limits():
+    return {
+        'max_pages': getattr(settings, 'RESUME_MAX_PAGES', DEFAULT_MAX_PAGES),
+        'max_bytes': getattr(settings, 'RESUME_MAX_TEXT_BYTES', DEFAULT_MAX_TEXT_BYTES),
+        'timeout': getattr(settings, 'RESUME_EXTRACT_TIMEOUT', DEFAULT_EXTRACT_TIMEOUT),
+        'stop_early': getattr(settings, 'RESUME_EXTRACT_STOP_EARLY', False),
+    }
+
+
+def iter_pdf_pages(pdf_path):
+    """Yields the text of each page; PyPDF2 only decodes a page when it is read."""
+    import PyPDF2
+
+    with open(pdf_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        for page in reader.pages:
+            yield page.extract_text() or ""
+
+
+def iter_docx_paragraphs(docx_path):
+    """Yields the text of each paragraph (python-docx parses the document XML up front)."""
+    from docx import Document
+
+    for paragraph in Document(docx_path).paragraphs:
+        yield paragraph.text
+
+
+def iter_resume_text(file_path):
+    """Page/paragraph generator for a PDF/DOCX resume, or None for unsupported file types."""
+    file_extension = os.path.splitext(file_path)[1].lower()
+    if file_extension == '.pdf':
+        return iter_pdf_pages(file_path)
+    if file_extension == '.docx':
+        return iter_docx_paragraphs(file_path)
+    return None
+
+
+def _structured_fields_in(text):
+    found = set()
+    if CGPA_RE.search(text):
+        found.add('cgpa')
+    if BACKLOGS_RE.search(text):
+        found.add('backlogs')
+    if INDIAN_PHONE_RE.search(text) or PHONE_RE.search(text):
+        found.add('phone_number')
+    return found
+
+
+def read_resume_text(file_path, max_pages=None, max_bytes=None, timeout=None, stop_early=None):
+    """
+    Reads a resume a page (PDF) or paragraph (DOCX) at a time, stopping at
+    the page, text-size or time limit (defaults from settings). The time
+    limit is checked between pages, so a single page can still overrun it.
+    Returns a ResumeText, or None for unsupported file types.
+    """
+    limits = extraction_limits()
+    max_pages = limits['max_pages'] if max_pages is None else max_pages
+    max_bytes = limits['max_bytes'] if max_bytes is None else max_bytes
+    timeout = limits['timeout'] if timeout is None else timeout
+    stop_early = limits['stop_early'] if stop_early is None else stop_early
+
+    pieces = iter_resume_text(file_path)
+    if pieces is None:
+        return None
+    is_pdf = file_path.lower().endswith('.pdf')
+    deadline = time.monotonic() + timeout
+    parts = []
+    size = pages = 0
+    seen_fields = set()
+    stopped_by = None
+    try:
+        for piece in pieces:
+            encoded = piece.encode('utf-8')
+            # The "\n" join puts one byte before every piece but the first
+            separator = 1 if parts else 0
+            if size + separator + len(encoded) > max_bytes:
+                room = max(0, max_bytes - size - separator)
+                if room:
+                    parts.append(encoded[:room].decode('utf-8', errors='ignore'))
+                stopped_by = 'bytes'
+                break
+            parts.append(piece)
+            size += separator + len(encoded)
+            pages += 1
+            # Paragraphs are not pages: only PDFs count against max_pages
+            if is_pdf and pages >= max_pages:
+                stopped_by = 'pages'
+                break
+            if stop_early:
+                seen_fields |= _structured_fields_in(piece)
+                if len(seen_fields) == 3:
+                    stopped_by = 'fields'
+                    break
+            if time.monotonic() > deadline:
+                stopped_by = 'time'
+                break
+    except Exception:
+        logger.warning("Could not extract text from %s", os.path.basename(file_path), exc_info=True)
+        stopped_by = 'error'
+    finally:
+        pieces.close()
+    return ResumeText("\n".join(parts), pages, stopped_by)
+
+
+def extract_text_from_pdf(pdf_path):
+    return read_resume_text(pdf_path).text
+
+
+def extract_text_from_docx(docx_path):
+    return read_resume_text(docx_path).text
+
+
+def extract_resume_text(file_path):
+    """Text of a PDF/DOCX resume (within the extraction limits), or None for unsupported file types."""
+    result = read_resume_text(file_path)
+    return None if result is None else result.text
+
+
+def parse_resume_text(text, doc=None):
+    """Extracts profile fields from resume text; `doc` is the spaCy Doc if already computed."""
+    if doc is None:
+        nlp = get_nlp()
+        if not nlp:
+            return dict(EMPTY_PARSE, resume_text=text)
+        doc = nlp(text)
+    
+    education = []
+    experience = []
+    phone_number = ""
+    cgpa = None
+    backlogs = None
+    
+    # --- CGPA Extraction ---
+    # Looks for 'CGPA' or 'GPA' followed by a number format X.X or X.XX
+    # Use a broad search and extract the first match
+    cgpa_match = CGPA_RE.search(text)
+    if cgpa_match:
+        try:
+            # Clean and convert the matched number to a float
+            cgpa_str = cgpa_match.group(2).replace(',', '.')
+            if '.' not in cgpa_str and len(cgpa_str) > 2: # Handle 85 (for 8.5/10 or 85%)
+                cgpa_value = float(cgpa_str) / 10.0 # Arbitrary guess for 85 -> 8.5
+            else:
+                cgpa_value = float(cgpa_str)
+            
+            # Simple validation: CGPA should be between 0.00 and 10.00
+            if 0.0 <= cgpa_value <= 10.0:
+                cgpa = round(cgpa_value, 2)
+        except ValueError:
+            pass
+            
+    # --- Backlogs Extraction ---
+    # Looks for 'backlog' or 'arrear' followed by a number (0, 1, 2, etc.)
+    backlogs_match = BACKLOGS_RE.search(text)
+    if backlogs_match:
+        try:
+            backlogs = int(backlogs_match.group(2))
+        except ValueError:
+            pass
+
+    # --- SKILLS: single pass over the compiled skill dictionary (core/data/skills.txt) ---
+    skills = extract_skills(text)
+
+    for ent in doc.ents:
+        if ent.label_ == "ORG" and ("university" in ent.text.lower() or "college" in ent.text.lower()):
+            education.append(ent.text)
+        elif ent.label_ == "ORG" and re.search(r'\b(b\.?tech|m\.?tech|bachelor|master|ph\.?d)\b', ent.text, re.IGNORECASE):
+             education.append(ent.text)
+
+    for sent in doc.sents:
+        if "experience" in sent.text.lower() or "worked at" in sent.text.lower() or "software engineer" in sent.text.lower() or "project" in sent.text.lower():
+            experience.append(sent.text)
+
+    phone_match = INDIAN_PHONE_RE.search(text)
+    if not phone_match:
+        phone_match = PHONE_RE.search(text)
+
+    if phone_match:
+        phone_number = phone_match.group(0)
+
+
+    parsed_data = {
+        'skills': ", ".join(skills),
+        'education': "\n".join(list(set(education))),
+        'experience': "\n".join(list(set(experience))),
+        'phone_number': phone_number,
+        'cgpa': cgpa,      # NEW FIELD
+        'backlogs': backlogs, # NEW FIELD
+        'resume_text': text,
+    }
+    return parsed_data
+
+def parse_resume_for_student(student_profile):
+    if student_profile.resume_file:
+        file_path = student_profile.resume_file.path
+        content_hash = resume_content_hash(file_path)
+        parsed_data = cached_parse_results([content_hash]).get(content_hash)
+        if parsed_data is None:
+            extracted = read_resume_text(file_path)
+            if extracted is None:
+                file_extension = os.path.splitext(file_path)[1].lower()
+                raise ResumeParseError(f"Unsupported file type: {file_extension}. Only PDF and DOCX are supported.")
+            if extracted.stopped_by == 'error':
+                raise ResumeParseError(f"Could not read {os.path.basename(file_path)}.")
+
+            parsed_data = parse_resume_text(extracted.text)
+            if extracted.cacheable:
+                store_parse_results({content_hash: parsed_data})
+        apply_parsed_resume(student_profile, parsed_data)
+        # Only the parsed fields (and what save() derives from them), so
+        # edits made while the resume was parsing are kept
+        student_profile.save(update_fields=PARSED_RESUME_FIELDS)
+        logger.info("Resume parsed and profile updated for %s", student_profile.user.username)
+    else:
+        logger.info("No resume file found for %s", student_profile.user.username)
+
+
+def apply_parsed_resume(student_profile, parsed_data):
+    """Copies parsed resume fields onto the profile (without saving)."""
+    student_profile.skills = parsed_data.get('skills', student_profile.skills)
+    student_profile.education = parsed_data.get('education', student_profile.education)
+    student_profile.experience = parsed_data.get('experience', student_profile.experience)
+    student_profile.phone_number = parsed_data.get('phone_number', student_profile.phone_number)
+    student_profile.resume_text = parsed_data.get('resume_text', student_profile.resume_text)
+
+    # --- UPDATE CGPA/BACKLOGS ONLY IF A VALID VALUE WAS FOUND ---
+    if parsed_data.get('cgpa') is not None:
+        student_profile.cgpa = parsed_data.get('cgpa')
+    if parsed_data.get('backlogs') is not None:
+        student_profile.backlogs = parsed_data.get('backlogs')
+    # -----------------------------------------------------------
+
+
+# --- PARSE RESULT CACHE ---
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def resume_content_hash(file_path):
+    """SHA-256 of the resume file's bytes."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def resume_parser_version():
+    """
+    Everything a parse result depends on besides the file: the extraction
+    rules, the extraction limits, the skill dictionary and the spaCy model.
+    Computed without loading spaCy, so a cache hit never pays for it.
+    """
+    limits = extraction_limits()
+    limits = f"{limits['max_pages']}p{limits['max_bytes']}b{'e' if limits['stop_early'] else ''}"
+    return f"{PARSER_VERSION}:{limits}:{skill_dictionary_version()}:{nlp_model_id()}"
+
+
+def cached_parse_results(content_hashes):
+    """{content hash: parsed dict} for the hashes parsed before by the current parser version."""
+    from .models import ResumeParseCache
+
+    found = {}
+    hashes = list(set(content_hashes))
+    version = resume_parser_version()
+    # Chunked to stay under the database's query parameter limit
+    for start in range(0, len(hashes), 500):
+        found.update(
+            ResumeParseCache.objects.filter(
+                parser_version=version, content_hash__in=hashes[start:start + 500],
+            ).values_list('content_hash', 'result')
+        )
+    return found
+
+
+def store_parse_results(results):
+    """Caches {content hash: parsed dict} under the current parser version."""
+    from .models import ResumeParseCache
+
+    version = resume_parser_version()
+    ResumeParseCache.objects.bulk_create(
+        [
+            ResumeParseCache(content_hash=content_hash, parser_version=version, result=parsed_data)
+            for content_hash, parsed_data in results.items()
+        ],
+        ignore_conflicts=True,
+    )
+
+
+# --- BATCH PARSING (manage.py reparse_resumes) ---
+def parse_resume_texts(texts, batch_size=RESUME_PIPE_BATCH_SIZE, n_process=1):
+    """
+    Parses many resume texts with one nlp.pipe() stream, skipping the
+    pipeline components the extraction does not read. Yields one parsed
+    dict per text, in order.
+    """
+    nlp = get_nlp()
+    if not nlp:
+        for text in texts:
+            yield dict(EMPTY_PARSE, resume_text=text)
+        return
+    disable = [name for name in RESUME_PIPE_DISABLE if name in nlp.pipe_names]
+    docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disable)
+    for text, doc in zip(texts, docs):
+        yield parse_resume_text(text, doc)
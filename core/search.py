@@ -0,0 +1,154 @@
+# core/search.py
+
+import re
+
+from django.db import connection
+from django.db.models import Q, Value
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+RESUME_FTS_TABLE = 'core_resume_fts'
+
+# snippet() wraps matches in these; render_snippet turns them into <mark>
+# after escaping the resume text
+SNIPPET_START = '\x02'
+SNIPPET_END = '\x03'
+SNIPPET_TOKENS = 16
+
+# "quoted phrases", bare words, and the FTS5 operators recruiters may type
+_QUERY_TOKEN_RE = re.compile(r'"([^"]*)"|(\w+)')
+_TERM_RE = re.compile(r'\w+')
+_OPERATORS = {'OR': 'OR', 'NOT': 'NOT'}
+# Implicit in FTS5; "kafka and internship" means both words
+_CONNECTORS = {'and'}
+
+
+class ResumeQueryError(ValueError):
+    """A query FTS5 can't express, e.g. NOT without a term to exclude from."""
+
+
+def fts_enabled():
+    """FTS5 search is only available on SQLite, where the migration creates the index."""
+    return connection.vendor == 'sqlite'
+
+
+def build_resume_match_query(search_query):
+    """
+    Turns a recruiter's query into an FTS5 MATCH expression. Every word must
+    appear (as a word prefix) unless joined by OR / excluded by NOT, and
+    "quoted text" must appear as an exact phrase. Terms are quoted so other
+    input is never parsed as FTS5 syntax.
+
+    NOT only narrows the terms before it, so NOT at the start (or after OR)
+    raises ResumeQueryError instead of searching for the excluded word.
+    """
+    parts = []
+    pending_operator = None
+    for phrase, word in _QUERY_TOKEN_RE.findall(search_query):
+        if word in _OPERATORS:
+            if word == 'NOT' and (not parts or pending_operator):
+                raise ResumeQueryError('NOT must follow a search term, e.g. python NOT kafka.')
+            pending_operator = _OPERATORS[word]
+            continue
+        if word.lower() in _CONNECTORS:
+            continue
+        if phrase:
+            terms = _TERM_RE.findall(phrase.lower())
+            if not terms:
+                continue
+            term = '"' + ' '.join(terms) + '"'
+        else:
+            term = f'"{word.lower()}"*'
+        # Operators only count between two terms
+        if pending_operator and parts:
+            parts.append(pending_operator)
+        pending_operator = None
+        parts.append(term)
+    return ' '.join(parts)
+
+
+def index_resume(student_id, resume_text):
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {RESUME_FTS_TABLE} WHERE rowid = %s', [student_id])
+        if resume_text:
+            cursor.execute(
+                f'INSERT INTO {RESUME_FTS_TABLE} (rowid, resume_text) VALUES (%s, %s)',
+                [student_id, resume_text],
+            )
+
+
+def unindex_resume(student_id):
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {RESUME_FTS_TABLE} WHERE rowid = %s', [student_id])
+
+
+def index_resumes(student_ids):
+    """Re-indexes the given students' stored resume text (after a bulk_update)."""
+    if not fts_enabled() or not student_ids:
+        return
+    student_ids = list(student_ids)
+    with connection.cursor() as cursor:
+        for start in range(0, len(student_ids), 500):
+            chunk = student_ids[start:start + 500]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            cursor.execute(f'DELETE FROM {RESUME_FTS_TABLE} WHERE rowid IN ({placeholders})', chunk)
+            cursor.execute(
+                f'INSERT INTO {RESUME_FTS_TABLE} (rowid, resume_text) '
+                f"SELECT user_id, resume_text FROM core_studentprofile "
+                f"WHERE user_id IN ({placeholders}) AND resume_text != ''",
+                chunk,
+            )
+
+
+def rebuild_resume_index():
+    """Re-populates the FTS table from core_studentprofile in one statement."""
+    if not fts_enabled():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {RESUME_FTS_TABLE}')
+        cursor.execute(
+            f'INSERT INTO {RESUME_FTS_TABLE} (rowid, resume_text) '
+            f"SELECT user_id, resume_text FROM core_studentprofile WHERE resume_text != ''"
+        )
+        return cursor.rowcount
+
+
+def search_resumes(students, search_query):
+    """
+    Restricts a StudentProfile queryset to resumes matching `search_query`
+    and annotates them with `search_rank` (BM25, lower is more relevant) and
+    `resume_snippet` (an excerpt around the matches, see render_snippet).
+
+    Without FTS5 this falls back to icontains on the resume text with a
+    constant rank and no snippet.
+    """
+    match_query = build_resume_match_query(search_query)
+    if not match_query:
+        return students.none()
+
+    if not fts_enabled():
+        return students.filter(Q(resume_text__icontains=search_query)).annotate(
+            search_rank=Value(0.0), resume_snippet=Value(''),
+        )
+
+    matching_row = f'FROM {RESUME_FTS_TABLE} WHERE {RESUME_FTS_TABLE} MATCH %s AND rowid = core_studentprofile.user_id'
+    return students.filter(
+        user_id__in=RawSQL(f'SELECT rowid FROM {RESUME_FTS_TABLE} WHERE {RESUME_FTS_TABLE} MATCH %s', [match_query])
+    ).annotate(
+        search_rank=RawSQL(f'SELECT bm25({RESUME_FTS_TABLE}) {matching_row}', [match_query]),
+        resume_snippet=RawSQL(
+            f"SELECT snippet({RESUME_FTS_TABLE}, 0, %s, %s, '...', {SNIPPET_TOKENS}) {matching_row}",
+            [SNIPPET_START, SNIPPET_END, match_query],
+        ),
+    )
+
+
+def render_snippet(snippet):
+    """HTML for a resume_snippet: the text escaped, the matched terms in <mark>."""
+    html = escape(snippet or '')
+    return mark_safe(html.replace(SNIPPET_START, '<mark>').replace(SNIPPET_END, '</mark>'))
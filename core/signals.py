@@ -0,0 +1,21 @@
+# core/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import StudentProfile
+from .search import index_resume, unindex_resume
+
+
+@receiver(post_save, sender=StudentProfile)
+def index_resume_for_search(sender, instance, created, raw=False, **kwargs):
+    """Keeps the student's row in the resume FTS5 index in sync with the stored resume text."""
+    if raw:
+        return
+    if created or 'resume_text' in instance.changed_fields():
+        index_resume(instance.pk, instance.resume_text)
+
+
+@receiver(post_delete, sender=StudentProfile)
+def unindex_deleted_resume(sender, instance, **kwargs):
+    unindex_resume(instance.pk)
@@ -0,0 +1,115 @@
+# core/skill_dictionary.py
+
+import hashlib
+import os
+import re
+import threading
+
+from django.conf import settings
+
+DEFAULT_DICTIONARY_FILE = os.path.join(os.path.dirname(__file__), 'data', 'skills.txt')
+
+# Words keep the characters that are part of skill names (c++, c#, node.js,
+# .net); anything else, including "/" and "-", is a word break
+_TOKEN_RE = re.compile(r'[a-z0-9+#]+(?:\.[a-z0-9+#]+)*|(?<![a-z0-9])\.[a-z0-9]+')
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall((text or '').lower())
+
+
+def dictionary_files():
+    return [DEFAULT_DICTIONARY_FILE] + list(getattr(settings, 'SKILL_DICTIONARY_FILES', []))
+
+
+def load_dictionary(paths):
+    """
+    Reads `Display Name | synonym | ...` lines into (display name, phrases)
+    pairs. The display name is itself one of the phrases.
+    """
+    entries = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                names = [name.strip() for name in line.split('|') if name.strip()]
+                entries.append((names[0], names))
+    return entries
+
+
+class SkillMatcher:
+    """
+    The skill dictionary compiled into a trie over word tokens. One
+    left-to-right pass over the resume's tokens finds the longest phrase
+    starting at each position, so the cost depends on the text length and
+    the longest phrase, not on how many skills the dictionary holds.
+    """
+    _END = object()
+
+    def __init__(self, entries):
+        self.root = {}
+        self.size = len(entries)
+        for display, phrases in entries:
+            for phrase in phrases:
+                tokens = tokenize(phrase)
+                if not tokens:
+                    continue
+                node = self.root
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                # First entry wins when two skills list the same phrase
+                node.setdefault(self._END, display)
+
+    def find(self, text):
+        """Display names of the skills mentioned in `text`, in order of first mention."""
+        tokens = tokenize(text)
+        found = {}
+        i = 0
+        while i < len(tokens):
+            node = self.root
+            match, match_end = None, i
+            j = i
+            while j < len(tokens) and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if self._END in node:
+                    match, match_end = node[self._END], j
+            if match is None:
+                i += 1
+            else:
+                found.setdefault(match, None)
+                i = match_end
+        return list(found)
+
+
+_matcher = None
+_matcher_version = None
+_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher():
+    """The compiled matcher for this process, built on first use."""
+    global _matcher, _matcher_version
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                paths = dictionary_files()
+                digest = hashlib.sha256()
+                for path in paths:
+                    with open(path, 'rb') as f:
+                        digest.update(f.read())
+                _matcher_version = digest.hexdigest()[:12]
+                _matcher = SkillMatcher(load_dictionary(paths))
+    return _matcher
+
+
+def skill_dictionary_version():
+    """Short hash of the dictionary files, so results from an older dictionary can be told apart."""
+    get_skill_matcher()
+    return _matcher_version
+
+
+def extract_skills(text):
+    return get_skill_matcher().find(text)
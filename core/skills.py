@@ -0,0 +1,73 @@
+# core/skills.py
+
+import re
+
+from django.db.models import Count
+
+_SKILL_SEPARATORS = re.compile(r'[,\n\r;|]+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_skill(name):
+    """Canonical lookup key for a skill: trimmed, lower-cased, single-spaced."""
+    return _WHITESPACE.sub(' ', (name or '').strip()).lower()[:100]
+
+
+def parse_skill_names(skills_text):
+    """
+    Splits the free-text StudentProfile.skills value (comma/line separated,
+    as written by the profile form or parse_resume_text) into unique
+    normalized skill names, keeping their original order.
+    """
+    names = []
+    for part in _SKILL_SEPARATORS.split(skills_text or ''):
+        name = normalize_skill(part)
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def get_or_create_skills(names, skill_model=None):
+    """Returns Skill rows for the given normalized names, creating missing ones in bulk."""
+    if skill_model is None:
+        from .models import Skill as skill_model
+    if not names:
+        return []
+    skill_model.objects.bulk_create([skill_model(name=name) for name in names], ignore_conflicts=True)
+    return list(skill_model.objects.filter(name__in=names))
+
+
+def sync_skill_sets(skills_by_student):
+    """
+    Bulk version of StudentProfile.sync_skill_set for profiles updated
+    without save(): maps student id -> skills text and rewrites their links.
+    """
+    from .models import StudentProfile
+    if not skills_by_student:
+        return
+    names_by_student = {pk: parse_skill_names(text) for pk, text in skills_by_student.items()}
+    all_names = sorted({name for names in names_by_student.values() for name in names})
+    skill_ids = {skill.name: skill.pk for skill in get_or_create_skills(all_names)}
+
+    links = StudentProfile.skill_set.through
+    links.objects.filter(studentprofile_id__in=list(names_by_student)).delete()
+    links.objects.bulk_create([
+        links(studentprofile_id=pk, skill_id=skill_ids[name])
+        for pk, names in names_by_student.items()
+        for name in names
+    ], batch_size=1000)
+
+
+def students_with_skills(names, match_all=True):
+    """
+    Subquery of StudentProfile ids linked to the given normalized skill names:
+    all of them when match_all is set, otherwise any of them. Both forms are
+    indexed joins over the skill link table.
+    """
+    from .models import StudentProfile
+    links = StudentProfile.skill_set.through.objects.filter(skill__name__in=names)
+    if match_all:
+        links = links.values('studentprofile_id').annotate(
+            matched_skills=Count('skill_id')
+        ).filter(matched_skills=len(set(names)))
+    return links.values('studentprofile_id')
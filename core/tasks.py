@@ -0,0 +1,57 @@
+# core/tasks.py
+
+import logging
+
+from taskqueue.registry import task
+
+from .models import StudentProfile
+from .readiness import recompute_readiness_scores
+from .resume_parser import ResumeParseError, parse_resume_for_student
+
+logger = logging.getLogger(__name__)
+
+
+# --- RESUME PARSING ---
+def mark_resume_parse_failed(student_id):
+    StudentProfile.objects.filter(pk=student_id).update(resume_parse_status='failed')
+
+
+@task(name='core.parse_resume', priority=10, timeout=600, on_failure=mark_resume_parse_failed)
+def parse_resume(student_id):
+    """Parses the student's uploaded resume and fills in their profile."""
+    profile = StudentProfile.objects.filter(pk=student_id).first()
+    if profile is None:
+        return
+    StudentProfile.objects.filter(pk=student_id).update(resume_parse_status='running')
+    try:
+        parse_resume_for_student(profile)
+    except ResumeParseError as e:
+        # The file itself is the problem, so there is nothing to retry
+        logger.warning("Resume parse failed for student %s: %s", student_id, e)
+        mark_resume_parse_failed(student_id)
+        return
+    except Exception:
+        # Waiting for a retry; mark_resume_parse_failed runs after the last attempt
+        StudentProfile.objects.filter(pk=student_id).update(resume_parse_status='queued')
+        raise
+    StudentProfile.objects.filter(pk=student_id).update(resume_parse_status='done')
+
+
+def queue_resume_parse(student_profile):
+    """Marks the profile's resume as queued for parsing and enqueues the task."""
+    StudentProfile.objects.filter(pk=student_profile.pk).update(resume_parse_status='queued')
+    student_profile.resume_parse_status = 'queued'
+    parse_resume.delay(student_profile.pk)
+
+
+# --- READINESS RECOMPUTATION ---
+@task(name='core.recompute_readiness', priority=-10, timeout=3600)
+def recompute_readiness(filters):
+    """Recomputes readiness for the students matching the admin list filters."""
+    from .views import filter_students
+
+    scanned, updated, seconds = recompute_readiness_scores(filter_students(StudentProfile.objects.all(), filters))
+    logger.info(
+        "Readiness recompute: %s scanned, %s updated in %.2fs (%.0f rows/s)",
+        scanned, updated, seconds, scanned / seconds if seconds else scanned,
+    )
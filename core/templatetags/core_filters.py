@@ -58,4 +58,13 @@ def recommendation_slugify(value):
     value = value.lower()
     value = value.replace(' fit', '')
     value = value.replace(' match', '')
-    return value
\ No newline at end of file
+    return value
+
+@register.filter
+def resume_snippet(value):
+    """
+    Renders a resume search excerpt with the matched terms highlighted.
+    Usage: {{ student.resume_snippet|resume_snippet }}
+    """
+    from core.search import render_snippet
+    return render_snippet(value)
@@ -1,3 +1,508 @@
-from django.test import TestCase
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+import docx
+import spacy
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from taskqueue.models import Task
+from taskqueue.worker import claim_task, run_task
+from .clustering import UNCLASSIFIED, refit_clusters
+from .models import ResumeParseCache, Skill, StudentClusterModel, StudentProfile, User
+from .readiness import compute_readiness_score, readiness_fingerprint, readiness_inputs
+from . import nlp, skill_dictionary
+from .resume_parser import EMPTY_PARSE, ResumeText, parse_resume_for_student, read_resume_text
+from .search import ResumeQueryError, build_resume_match_query, rebuild_resume_index, search_resumes
+from .skill_dictionary import SkillMatcher, extract_skills, skill_dictionary_version, tokenize
+from .skills import students_with_skills
+from .tasks import parse_resume
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
+class StudentTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        os.makedirs(MEDIA_ROOT, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def create_student(self, username, branch="CSE", cgpa=8.0, backlogs=0, skills="", **fields):
+        user = User.objects.create_user(username, f"{username}@example.com", "pw")
+        return StudentProfile.objects.create(
+            user=user, roll_number=username.upper(), branch=branch, cgpa=cgpa, backlogs=backlogs, skills=skills,
+            **fields,
+        )
+
+
+class ResumeParseTaskTests(StudentTestCase):
+    def setUp(self):
+        self.student = self.create_student("s1", skills="Java")
+        with open(f"{MEDIA_ROOT}/cv.pdf", "wb") as f:
+            f.write(b"%PDF resume")
+        StudentProfile.objects.filter(pk=self.student.pk).update(resume_file="cv.pdf")
+        self.student.refresh_from_db()
+
+    def test_parse_saves_only_the_parsed_fields(self):
+        stale = StudentProfile.objects.get(pk=self.student.pk)
+        # The student edits their profile while the resume is being parsed
+        StudentProfile.objects.filter(pk=self.student.pk).update(branch="IT", resume_parse_status="running")
+        parsed = dict(EMPTY_PARSE, skills="Python, Django", cgpa=9.1, resume_text="Python Django developer")
+
+        with mock.patch('core.resume_parser.read_resume_text', return_value=ResumeText("text", 1, None)), \
+                mock.patch('core.resume_parser.parse_resume_text', return_value=parsed):
+            parse_resume_for_student(stale)
+
+        profile = StudentProfile.objects.get(pk=self.student.pk)
+        self.assertEqual((profile.branch, profile.resume_parse_status), ("IT", "running"))
+        self.assertEqual((profile.skills, float(profile.cgpa)), ("Python, Django", 9.1))
+        self.assertEqual(sorted(profile.skill_set.values_list('name', flat=True)), ["django", "python"])
+        self.assertGreater(profile.placement_readiness_score, self.student.placement_readiness_score)
+
+    def test_status_is_queued_between_retries_and_failed_after_the_last(self):
+        parse_resume.delay(self.student.pk)
+        Task.objects.update(max_attempts=2)
+
+        with mock.patch('core.tasks.parse_resume_for_student', side_effect=RuntimeError("bad file")):
+            run_task(claim_task("w"), "w")
+            self.student.refresh_from_db()
+            self.assertEqual(self.student.resume_parse_status, "queued")
+
+            Task.objects.update(run_at=timezone.now())
+            run_task(claim_task("w"), "w")
+
+        self.student.refresh_from_db()
+        self.assertEqual(self.student.resume_parse_status, "failed")
+        self.assertEqual(Task.objects.get().status, "failed")
+
+    def test_unsupported_or_unreadable_file_fails_without_retrying(self):
+        with open(f"{MEDIA_ROOT}/cv.txt", "w") as f:
+            f.write("plain text resume")
+        with open(f"{MEDIA_ROOT}/bad.docx", "wb") as f:
+            f.write(b"not a zip archive")
+
+        for name, message in [("cv.txt", "Unsupported file type: .txt"), ("bad.docx", "Could not read bad.docx")]:
+            with self.subTest(file=name):
+                Task.objects.all().delete()
+                StudentProfile.objects.filter(pk=self.student.pk).update(resume_file=name, resume_parse_status="queued")
+                parse_resume.delay(self.student.pk)
+
+                with self.assertLogs('core.tasks', 'WARNING') as logs:
+                    run_task(claim_task("w"), "w")
+
+                self.assertIn(message, logs.output[-1])
+                self.student.refresh_from_db()
+                self.assertEqual((self.student.resume_parse_status, self.student.skills), ("failed", "Java"))
+                self.assertEqual(Task.objects.get().status, "succeeded")
+                self.assertFalse(ResumeParseCache.objects.exists())
+
+
+class ResumeParseCacheTests(StudentTestCase):
+    def student_with_resume(self, username, content=b"%PDF same resume"):
+        student = self.create_student(username)
+        with open(f"{MEDIA_ROOT}/{username}.pdf", "wb") as f:
+            f.write(content)
+        StudentProfile.objects.filter(pk=student.pk).update(resume_file=f"{username}.pdf")
+        student.refresh_from_db()
+        return student
+
+    def parse(self, student, stopped_by=None):
+        parsed = dict(EMPTY_PARSE, skills="Python", resume_text="Python developer")
+        with mock.patch('core.resume_parser.read_resume_text', return_value=ResumeText("text", 1, stopped_by)) as read, \
+                mock.patch('core.resume_parser.parse_resume_text', return_value=parsed):
+            parse_resume_for_student(student)
+        student.refresh_from_db()
+        return read.called
+
+    def test_identical_files_are_parsed_once(self):
+        self.assertTrue(self.parse(self.student_with_resume("s1")))
+        second = self.student_with_resume("s2")
+        self.assertFalse(self.parse(second))
+        self.assertEqual(second.skills, "Python")
+        self.assertEqual(ResumeParseCache.objects.count(), 1)
+        # Different bytes are a different resume
+        self.assertTrue(self.parse(self.student_with_resume("s3", b"%PDF other resume")))
+
+    def test_parser_version_change_misses_the_cache(self):
+        self.parse(self.student_with_resume("s1"))
+        with override_settings(RESUME_MAX_PAGES=2):
+            self.assertTrue(self.parse(self.student_with_resume("s2")))
+        self.assertEqual(ResumeParseCache.objects.count(), 2)
+
+    def test_time_limited_reads_are_not_cached(self):
+        self.parse(self.student_with_resume("s1"), stopped_by='time')
+        self.assertFalse(ResumeParseCache.objects.exists())
+        self.assertTrue(self.parse(self.student_with_resume("s2")))
+
+
+class ResumeExtractionLimitTests(TestCase):
+    def read(self, pieces, path="cv.pdf", **limits):
+        limits = dict({'max_pages': 100, 'max_bytes': 10_000, 'timeout': 60, 'stop_early': False}, **limits)
+        with mock.patch('core.resume_parser.iter_resume_text', return_value=(piece for piece in pieces)):
+            return read_resume_text(path, **limits)
+
+    def test_byte_limit_counts_separators(self):
+        pieces = ["a" * 4, "b" * 4, "c" * 4]
+        for max_bytes in range(0, 16):
+            with self.subTest(max_bytes=max_bytes):
+                result = self.read(pieces, max_bytes=max_bytes)
+                self.assertLessEqual(len(result.text.encode('utf-8')), max_bytes)
+                self.assertEqual(result.stopped_by, None if max_bytes >= 14 else 'bytes')
+        self.assertEqual(self.read(pieces, max_bytes=9).text, "aaaa\nbbbb")
+        self.assertEqual(self.read(pieces, max_bytes=11).text, "aaaa\nbbbb\nc")
+
+    def test_byte_limit_does_not_split_characters(self):
+        result = self.read(["é" * 3], max_bytes=5)
+        self.assertEqual((result.text, result.stopped_by), ("éé", 'bytes'))
+
+    def test_page_limit_applies_to_pdf_pages_only(self):
+        pages = ["page one", "page two", "page three"]
+        result = self.read(pages, max_pages=2)
+        self.assertEqual((result.text, result.pages, result.stopped_by), ("page one\npage two", 2, 'pages'))
+        result = self.read(pages, path="cv.docx", max_pages=2)
+        self.assertEqual((result.pages, result.stopped_by), (3, None))
+
+    def test_time_limit_is_checked_between_pages(self):
+        clock = iter([0.0, 1.0, 6.0, 7.0])
+        with mock.patch('core.resume_parser.time.monotonic', side_effect=lambda: next(clock)):
+            result = self.read(["one", "two", "three"], timeout=5)
+        self.assertEqual((result.text, result.stopped_by), ("one\ntwo", 'time'))
+
+    def test_decoding_error_is_logged_and_reported(self):
+        def pieces():
+            yield "page one"
+            raise ValueError("broken xref table")
+
+        with mock.patch('core.resume_parser.iter_resume_text', return_value=pieces()), \
+                self.assertLogs('core.resume_parser', 'WARNING') as logs:
+            result = read_resume_text("cv.pdf", max_pages=10, max_bytes=1000, timeout=60, stop_early=False)
+        self.assertEqual((result.text, result.stopped_by, result.cacheable), ("page one", 'error', False))
+        self.assertIn("cv.pdf", logs.output[0])
+        self.assertIn("broken xref table", logs.output[0])
+
+
+class SkillIndexTests(StudentTestCase):
+    def skill_names(self, student):
+        return sorted(student.skill_set.values_list('name', flat=True))
+
+    def test_skill_links_follow_the_skills_text(self):
+        student = self.create_student("s1", skills="Python,  Machine   Learning;python\nSQL")
+        self.assertEqual(self.skill_names(student), ["machine learning", "python", "sql"])
+
+        student.skills = "SQL | Django"
+        student.save()
+        self.assertEqual(self.skill_names(student), ["django", "sql"])
+        # Skills are shared rows, not one per student
+        self.create_student("s2", skills="django")
+        self.assertEqual(Skill.objects.filter(name="django").count(), 1)
+
+    def test_students_with_all_or_any_skills(self):
+        both = self.create_student("s1", skills="Python, SQL")
+        python = self.create_student("s2", skills="Python, Java")
+        self.create_student("s3", skills="PythonAnywhere, mysql")
+
+        def matching(names, match_all):
+            ids = students_with_skills(names, match_all=match_all)
+            return sorted(StudentProfile.objects.filter(pk__in=ids).values_list('roll_number', flat=True))
+
+        self.assertEqual(matching(["python", "sql"], True), [both.roll_number])
+        self.assertEqual(matching(["python", "sql"], False), [both.roll_number, python.roll_number])
+        # Repeated names don't raise the number of skills required
+        self.assertEqual(matching(["sql", "sql"], True), [both.roll_number])
+
+
+class ReadinessScoreTests(StudentTestCase):
+    def test_score_is_kept_current_by_save(self):
+        student = self.create_student("s1", cgpa=8.0, backlogs=0)
+        self.assertEqual(float(student.placement_readiness_score), 54.0)
+        inputs = (8.0, 0, False, False, False)
+        self.assertEqual(student.readiness_fingerprint, readiness_fingerprint(inputs))
+
+        # Fields the score doesn't depend on don't trigger a recompute
+        with mock.patch('core.models.compute_readiness_score') as compute:
+            student.phone_number = "9876543210"
+            student.save()
+        compute.assert_not_called()
+
+        student.backlogs = 1
+        student.skills = "Python"
+        student.save()
+        student.refresh_from_db()
+        self.assertEqual(float(student.placement_readiness_score), 59.0)
+
+    def test_student_pages_do_not_write_on_get(self):
+        self.create_student("s1", cgpa=7.5, skills="SQL", experience="Intern")
+        self.client.login(username="s1", password="pw")
+
+        for name in ('student_dashboard', 'student_profile_view'):
+            with self.subTest(page=name), CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.client.get(reverse(name)).status_code, 200)
+            writes = [q['sql'] for q in queries if q['sql'].split()[0] in ('INSERT', 'UPDATE', 'DELETE')]
+            self.assertEqual(writes, [])
+
+
+class RecomputeReadinessTests(StudentTestCase):
+    def setUp(self):
+        self.cse = [self.create_student(f"c{i}", branch="CSE", cgpa=6.0 + i, backlogs=i) for i in range(3)]
+        self.it = self.create_student("i1", branch="IT", cgpa=7.0)
+        # A bulk import that bypasses save() leaves the stored scores stale
+        StudentProfile.objects.update(cgpa=9.5, skills="Python")
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('recompute_readiness', *args, stdout=out)
+        return out.getvalue()
+
+    def test_only_stale_matching_rows_are_rewritten(self):
+        output = self.run_command('--branch', 'cse', '--chunk-size', '2')
+        self.assertIn("Scanned 3 profiles, updated 3", output)
+
+        for student in StudentProfile.objects.all():
+            inputs = readiness_inputs(student)
+            fresh = student.branch == "CSE"
+            self.assertEqual(student.readiness_fingerprint == readiness_fingerprint(inputs), fresh)
+            if fresh:
+                self.assertEqual(float(student.placement_readiness_score), compute_readiness_score(*inputs))
+
+        self.assertIn("Scanned 4 profiles, updated 1", self.run_command())
+        self.assertIn("Scanned 4 profiles, updated 0", self.run_command())
+
+
+class StudentClusteringTests(StudentTestCase):
+    def setUp(self):
+        self.strong = [
+            self.create_student(f"strong{i}", cgpa=9.0 + i / 10, backlogs=0, skills="Python, SQL", experience="Intern")
+            for i in range(4)
+        ]
+        self.weak = [self.create_student(f"weak{i}", cgpa=5.0 + i / 10, backlogs=3) for i in range(4)]
+
+    def labels(self, students):
+        return {StudentProfile.objects.get(pk=student.pk).cluster_id for student in students}
+
+    def test_refit_labels_cohorts_strongest_first(self):
+        self.assertEqual(self.labels(self.strong + self.weak), {UNCLASSIFIED})
+
+        cluster_model = refit_clusters(n_clusters=2, iterations=10, seed=0)
+
+        self.assertEqual(self.labels(self.strong), {"C1"})
+        self.assertEqual(self.labels(self.weak), {"C2"})
+        self.assertEqual((cluster_model.n_samples, cluster_model.vocabulary), (8, ["python", "sql"]))
+
+    def test_new_and_changed_profiles_join_the_nearest_cluster_without_refit(self):
+        cluster_model = refit_clusters(n_clusters=2, iterations=10, seed=0)
+
+        newcomer = self.create_student("new", cgpa=9.5, backlogs=0, skills="python", experience="Projects")
+        self.assertEqual(newcomer.cluster_id, "C1")
+        newcomer.cgpa = 5.2
+        newcomer.backlogs = 4
+        newcomer.skills = ""
+        newcomer.experience = ""
+        newcomer.save()
+        self.assertEqual(self.labels([newcomer]), {"C2"})
+
+        cluster_model.refresh_from_db()
+        self.assertEqual(StudentClusterModel.objects.count(), 1)
+        self.assertEqual(cluster_model.n_samples, 8)
+
+    def test_incremental_refit_labels_unclassified_students(self):
+        cluster_model = refit_clusters(n_clusters=2, iterations=10, seed=0)
+        StudentProfile.objects.filter(pk=self.weak[0].pk).update(cluster_id=UNCLASSIFIED)
+
+        call_command('refit_student_clusters', '--incremental', stdout=StringIO())
+
+        self.assertEqual(self.labels(self.weak), {"C2"})
+        cluster_model.refresh_from_db()
+        self.assertEqual(cluster_model.n_samples, 9)
+
+
+class SkillMatcherTests(SimpleTestCase):
+    matcher = SkillMatcher([
+        ("AI", ["AI", "artificial intelligence"]),
+        ("AI/ML", ["AI/ML", "ai ml"]),
+        ("API", ["API"]),
+        ("Kubernetes", ["Kubernetes", "k8s"]),
+        ("C++", ["C++", "cpp"]),
+        ("C#", ["C#"]),
+        ("Node.js", ["Node.js", "nodejs"]),
+        ("Machine Learning", ["Machine Learning", "ml"]),
+        ("ML Duplicate", ["ml"]),
+    ])
+
+    def test_tokens_keep_skill_punctuation(self):
+        self.assertEqual(tokenize("C++/C#, Node.js & .NET-Core."), ["c++", "c#", "node.js", ".net", "core"])
+
+    def test_synonyms_map_to_the_display_name_in_first_mention_order(self):
+        found = self.matcher.find("Deployed nodejs on K8S; wrote cpp, then more Kubernetes and C#")
+        self.assertEqual(found, ["Node.js", "Kubernetes", "C++", "C#"])
+
+    def test_longest_phrase_wins_and_words_are_whole(self):
+        self.assertEqual(self.matcher.find("AI/ML and rapid APIs"), ["AI/ML"])
+        self.assertEqual(self.matcher.find("AI, then ML, then an API"), ["AI", "Machine Learning", "API"])
+
+    def test_bundled_dictionary(self):
+        found = extract_skills("Built REST APIs in Python with Django, deployed on k8s, and designed PCBs in KiCad.")
+        self.assertEqual(found[:3], ["REST API", "Python", "Django"])
+        self.assertIn("Kubernetes", found)
+        self.assertIn("KiCad", found)
+        self.assertEqual(extract_skills("rapid iteration"), [])
+
+    def test_bundled_dictionary_ignores_names_places_and_prose(self):
+        for text in (
+            "Julia Roberts",
+            "hr@company.com",
+            "Referees: Ruby Swift (Sales) and Dr. Julia Research, Chennai, Tamil Nadu",
+            "Teaching kids with creativity gave me a solid, safe grounding.",
+        ):
+            with self.subTest(text=text):
+                self.assertEqual(extract_skills(text), [])
+        found = extract_skills("iOS apps in Swift language, a Rust lang CLI, fluent Hindi, b2b sales")
+        self.assertEqual(found, ["iOS", "Swift Programming", "Rust Programming", "Hindi Language", "Sales Management"])
+
+    def test_extra_dictionary_files(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("# site skills\nCampus ERP | cerp\n")
+        self.addCleanup(os.remove, f.name)
+        default_version = skill_dictionary_version()
+
+        with mock.patch.multiple(skill_dictionary, _matcher=None, _matcher_version=None), \
+                override_settings(SKILL_DICTIONARY_FILES=[f.name]):
+            self.assertEqual(extract_skills("Maintained CERP modules in Python"), ["Campus ERP", "Python"])
+            self.assertNotEqual(skill_dictionary_version(), default_version)
+
+
+class ResumeSearchTests(StudentTestCase):
+    def search(self, query):
+        results = search_resumes(StudentProfile.objects.all(), query).order_by('search_rank', 'roll_number')
+        return list(results.values_list('roll_number', flat=True))
+
+    def test_match_query(self):
+        self.assertEqual(build_resume_match_query('Kafka and internship'), '"kafka"* "internship"*')
+        self.assertEqual(build_resume_match_query('"Machine  Learning" OR nlp'), '"machine learning" OR "nlp"*')
+        self.assertEqual(build_resume_match_query('python NOT kafka'), '"python"* NOT "kafka"*')
+        self.assertEqual(build_resume_match_query('title:"x" ^col*'), '"title"* "x" "col"*')
+
+    def test_not_needs_a_term_before_it(self):
+        for query in ('NOT kafka', 'python OR NOT kafka'):
+            with self.subTest(query=query), self.assertRaises(ResumeQueryError):
+                build_resume_match_query(query)
+
+    def test_index_follows_saves_and_deletes(self):
+        kafka = self.create_student("s1", resume_text="Built Kafka pipelines in Python")
+        self.create_student("s2", resume_text="Python and Django developer")
+        self.assertCountEqual(self.search('python'), ["S1", "S2"])
+        self.assertEqual(self.search('python NOT kafka'), ["S2"])
+
+        kafka.resume_text = "Java developer"
+        kafka.save()
+        self.assertEqual(self.search('kafka'), [])
+        self.assertEqual(self.search('java'), ["S1"])
+
+        kafka.user.delete()
+        self.assertEqual(self.search('java'), [])
+        self.assertEqual(rebuild_resume_index(), 1)
+
+    def test_best_matches_first(self):
+        self.create_student("s1", resume_text="Python " + "filler words " * 30)
+        self.create_student("s2", resume_text="Python developer, Python scripting, Python testing")
+        self.assertEqual(self.search('python'), ["S2", "S1"])
+
+    def test_view_reports_a_leading_not(self):
+        self.create_student("s1", resume_text="Kafka streaming")
+        User.objects.create_user("admin", "admin@example.com", "pw", user_type="admin")
+        self.client.login(username="admin", password="pw")
+
+        response = self.client.get(reverse('resume_search_admin'), {'q': 'NOT kafka'})
+
+        self.assertIsNone(response.context['page_obj'])
+        self.assertContains(response, "NOT must follow a search term")
+        response = self.client.get(reverse('resume_search_admin'), {'q': 'kafka'})
+        self.assertEqual([s.roll_number for s in response.context['page_obj']], ["S1"])
+
+
+class LazyImportTests(SimpleTestCase):
+    def test_importing_the_views_does_not_load_spacy_or_the_readers(self):
+        script = (
+            "import sys, django; django.setup()\n"
+            "import core.views, placement.views, core.nlp\n"
+            "print(core.nlp._nlp is None, core.nlp._nlp_loaded, [m for m in ('spacy', 'PyPDF2', 'docx') if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+            env=dict(os.environ, DJANGO_SETTINGS_MODULE="placement_project.settings"),
+        )
+        self.assertEqual(result.stdout.strip(), "True False []")
+
+    @override_settings(SPACY_MODEL="no_such_spacy_model")
+    def test_missing_model_is_logged_once(self):
+        with mock.patch.multiple(nlp, _nlp=None, _nlp_loaded=False):
+            with self.assertLogs('core.nlp', 'ERROR') as logs:
+                self.assertIsNone(nlp.get_nlp())
+            self.assertIn("no_such_spacy_model", logs.output[0])
+            with self.assertNoLogs('core.nlp', 'ERROR'):
+                self.assertIsNone(nlp.get_nlp())
+
+
+class ReparseResumesTests(StudentTestCase):
+    def student_with_docx(self, username, paragraphs, **fields):
+        student = self.create_student(username, **fields)
+        document = docx.Document()
+        for paragraph in paragraphs:
+            document.add_paragraph(paragraph)
+        document.save(f"{MEDIA_ROOT}/{username}.docx")
+        StudentProfile.objects.filter(pk=student.pk).update(resume_file=f"{username}.docx")
+        return student
+
+    def test_parsed_fields_and_derived_state_are_rewritten(self):
+        first = self.student_with_docx(
+            "s1", ["Skills: Python, Django and PostgreSQL", "CGPA 9.2", "Backlogs 0"], cgpa=6.0, backlogs=2,
+        )
+        second = self.student_with_docx("s2", ["Worked on a Kafka project with Java."], skills="Excel")
+        broken = self.create_student("s3", skills="SQL")
+        with open(f"{MEDIA_ROOT}/s3.docx", "wb") as f:
+            f.write(b"not a zip archive")
+        StudentProfile.objects.filter(pk=broken.pk).update(resume_file="s3.docx")
+
+        nlp_pipeline = spacy.blank("en")
+        nlp_pipeline.add_pipe("sentencizer")
+        out = StringIO()
+        with mock.patch('core.resume_parser.get_nlp', return_value=nlp_pipeline):
+            call_command('reparse_resumes', '--processes', '2', '--chunk-size', '2', stdout=out)
+        self.assertIn("Re-parsed 2 resumes", out.getvalue())
+
+        first.refresh_from_db()
+        self.assertEqual(first.skills, "Python, Django, PostgreSQL")
+        self.assertEqual((float(first.cgpa), first.backlogs, first.resume_parse_status), (9.2, 0, "done"))
+        self.assertEqual(sorted(first.skill_set.values_list('name', flat=True)), ["django", "postgresql", "python"])
+        self.assertEqual(first.readiness_fingerprint, readiness_fingerprint(readiness_inputs(first)))
+        self.assertEqual(float(first.placement_readiness_score), compute_readiness_score(*readiness_inputs(first)))
+
+        second.refresh_from_db()
+        self.assertEqual(second.skills, "Kafka, Java")
+        self.assertIn("Kafka project", second.experience)
+        self.assertEqual(sorted(second.skill_set.values_list('name', flat=True)), ["java", "kafka"])
+        self.assertEqual(
+            list(search_resumes(StudentProfile.objects.all(), "kafka").values_list('roll_number', flat=True)), ["S2"],
+        )
+
+        # The unreadable file is skipped and keeps its profile data
+        broken.refresh_from_db()
+        self.assertEqual((broken.skills, broken.resume_parse_status), ("SQL", "idle"))
@@ -9,6 +9,8 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
 from .forms import StudentSignUpForm, AdminSignUpForm, LoginForm, StudentProfileForm
 from .models import StudentProfile, User
+from .search import ResumeQueryError, search_resumes
+from .tasks import queue_resume_parse, recompute_readiness
 from placement.models import Job, Application # Ensure Job model is imported
 from django.db.models import Q # For complex queries
 from django.contrib import messages
@@ -16,11 +18,11 @@ from django.contrib.auth import logout
 from django.contrib.messages import get_messages 
 from placement.models import Job, Application # Ensure Job model is imported
 from django.db.models import Q, Count 
-import spacy
-from docx import Document
-import PyPDF2
 # --- NEW IMPORTS FOR EXCEL/CSV EXPORT ---
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
+from django.core.paginator import Paginator
+from django.urls import reverse
+from urllib.parse import urlencode
 import csv
 # ----------------------------------------
 # --- NEW IMPORT FOR ML SERVICE ---
@@ -35,60 +37,6 @@ def is_student(user):
 def is_admin(user):
     return user.is_authenticated and user.user_type == 'admin'
 
-# --- READINESS SCORING LOGIC (Cleaned) ---
-def calculate_readiness_score(student_profile):
-    """Calculates a simple readiness score (0-100) based on profile completeness and metrics."""
-    score = 0
-    max_score = 100
-    
-    # Weights for different factors
-    weights = {
-        'cgpa': 30,
-        'backlogs': 30,
-        'skills': 20,
-        'resume_file': 10,
-        'experience': 10
-    }
-    
-    # 1. CGPA Score (Max 30)
-    if student_profile.cgpa is not None:
-        # Assuming max CGPA is 10.0, scale to 30. Example: CGPA 9.0 -> 27/30
-        cgpa_score = min(float(student_profile.cgpa) / 10.0 * weights['cgpa'], weights['cgpa'])
-        score += cgpa_score
-
-    # 2. Backlogs Score (Max 30) - Inverse correlation
-    if student_profile.backlogs is not None:
-        if student_profile.backlogs == 0:
-            score += weights['backlogs']  # Perfect score for 0 backlogs
-        elif student_profile.backlogs == 1:
-            score += weights['backlogs'] * 0.5  # 50% penalty for 1 backlog
-        else:
-            score += weights['backlogs'] * 0.1  # Heavy penalty for >1 backlog
-
-    # 3. Skills (Max 20) - Simple check for presence
-    if student_profile.skills:
-        # Award full points if skills were auto-parsed or manually added
-        score += weights['skills']
-
-    # 4. Resume File (Max 10)
-    if student_profile.resume_file:
-        score += weights['resume_file']
-        
-    # 5. Experience/Projects (Max 10)
-    if student_profile.experience:
-        score += weights['experience']
-        
-    # Cap score at 100 just in case
-    final_score = round(min(score, max_score), 2)
-    student_profile.placement_readiness_score = final_score
-    
-    # The cluster_id field is explicitly excluded from being saved here
-    student_profile.save(update_fields=['placement_readiness_score'])
-    
-    return final_score
-# --- END CLEANED SCORING LOGIC ---
-
-
 # --- Authentication Views (unchanged) ---
 def student_signup(request):
     if request.method == 'POST':
@@ -166,18 +114,17 @@ def user_logout(request):
 @login_required
 @user_passes_test(is_student)
 def student_dashboard(request):
+    # Read-only: the readiness score is kept current by StudentProfile.save()
     student_profile = get_object_or_404(StudentProfile, user=request.user)
-    
-    # --- ENSURE READINESS SCORE IS CALCULATED/UPDATED HERE ---
-    if student_profile.cgpa is not None and student_profile.backlogs is not None:
-         calculate_readiness_score(student_profile)
-    # ---------------------------------------------------
 
     applications = student_profile.applications.all().order_by('-applied_at')
 
     # Fetch recent jobs (e.g., last 5, similar to admin dashboard)
     recent_jobs = Job.objects.all().order_by('-posted_at')[:5]
 
+    # Jobs this student was notified about as eligible when they were posted
+    job_notifications = student_profile.job_notifications.select_related('job').order_by('-created_at')[:5]
+
     # --- NEW: OVERALL PLACEMENT PREDICTION ---
     placement_chance = get_overall_placement_prediction(student_profile)
     # ----------------------------------------
@@ -186,6 +133,7 @@ def student_dashboard(request):
         'student_profile': student_profile,
         'applications': applications,
         'recent_jobs': recent_jobs,
+        'job_notifications': job_notifications,
         'placement_chance': placement_chance,
     }
     return render(request, 'core/student_dashboard.html', context)
@@ -221,48 +169,54 @@ def admin_dashboard(request):
     return render(request, 'core/admin_dashboard.html', context)
 
 # --- Admin Student List View (CLEANED) ---
+# --- ADMIN STUDENT LIST FILTERS (shared by the list, export and readiness recompute) ---
+def filter_students(students, params):
+    """Applies the admin student list's q/branch/min_cgpa/max_backlogs/cluster filters."""
+    search_query = params.get('q')
+    branch_filter = params.get('branch')
+    min_cgpa = params.get('min_cgpa')
+    max_backlogs = params.get('max_backlogs')
+
+    if search_query:
+        students = students.filter(
+            Q(user__username__icontains=search_query) |
+            Q(user__first_name__icontains=search_query) |
+            Q(user__last_name__icontains=search_query) |
+            Q(roll_number__icontains=search_query)
+        )
+    if branch_filter:
+        students = students.filter(branch__icontains=branch_filter)
+    if min_cgpa:
+        students = students.filter(cgpa__gte=min_cgpa)
+    if max_backlogs:
+        students = students.filter(backlogs__lte=max_backlogs)
+    if params.get('cluster'):
+        students = students.filter(cluster_id=params.get('cluster'))
+    return students
+
+
 @login_required
 @user_passes_test(is_admin)
 def student_list_admin(request):
     
-    # 1. Force update/classification for any student missing a score/cluster but has data
-    # Logic is simplified here to only ensure score is calculated (cluster logic removed)
-    students_to_process = StudentProfile.objects.filter(
-        Q(placement_readiness_score=0.0) | Q(placement_readiness_score__isnull=True), 
-        cgpa__isnull=False, backlogs__isnull=False
-    )
-    for student in students_to_process:
-        # Call the full readiness calculation
-        calculate_readiness_score(student)
-        
     all_students = StudentProfile.objects.all().order_by('roll_number')
 
     search_query = request.GET.get('q')
     branch_filter = request.GET.get('branch')
     min_cgpa = request.GET.get('min_cgpa')
     max_backlogs = request.GET.get('max_backlogs')
-    
-    filtered_students = all_students
 
-    if search_query:
-        filtered_students = filtered_students.filter(
-            Q(user__username__icontains=search_query) |
-            Q(user__first_name__icontains=search_query) |
-            Q(user__last_name__icontains=search_query) |
-            Q(roll_number__icontains=search_query)
-        )
-    if branch_filter:
-        filtered_students = filtered_students.filter(branch__icontains=branch_filter)
-    if min_cgpa:
-        filtered_students = filtered_students.filter(cgpa__gte=min_cgpa)
-    if max_backlogs:
-        filtered_students = filtered_students.filter(backlogs__lte=max_backlogs)
+    filtered_students = filter_students(all_students, request.GET)
 
     available_branches = StudentProfile.objects.values_list('branch', flat=True).distinct().order_by('branch')
+    # Cohort sizes per ML cluster for the cluster filter
+    cluster_counts = StudentProfile.objects.values('cluster_id').annotate(total=Count('pk')).order_by('cluster_id')
 
     context = {
         'students': filtered_students,
         'available_branches': available_branches,
+        'cluster_counts': cluster_counts,
+        'current_cluster': request.GET.get('cluster'),
         'all_students_count': all_students.count(),
         'current_search_query': search_query,
         'current_branch_filter': branch_filter,
@@ -271,6 +225,48 @@ def student_list_admin(request):
     }
     return render(request, 'core/student_list_admin.html', context)
 
+# --- NEW: BACKGROUND READINESS RECOMPUTE ---
+@login_required
+@user_passes_test(is_admin)
+def recompute_readiness_admin(request):
+    """Recomputes readiness for the currently filtered students off the request path."""
+    if request.method != 'POST':
+        return redirect('student_list_admin')
+    filters = {key: request.POST.get(key, '') for key in ('q', 'branch', 'min_cgpa', 'max_backlogs', 'cluster')}
+    recompute_readiness.delay(filters)
+    messages.success(request, "Readiness recomputation queued for the selected students.")
+    params = urlencode(filters)
+    return redirect(f"{reverse('student_list_admin')}?{params}")
+# ----------------------------------------
+
+
+# --- NEW: FULL-TEXT RESUME SEARCH ---
+RESUME_SEARCH_PAGE_SIZE = 25
+
+@login_required
+@user_passes_test(is_admin)
+def resume_search_admin(request):
+    """Searches the stored text of every parsed resume, best BM25 matches first."""
+    search_query = request.GET.get('q', '').strip()
+    page_obj = None
+    if search_query:
+        try:
+            results = search_resumes(StudentProfile.objects.select_related('user'), search_query)
+        except ResumeQueryError as e:
+            messages.error(request, str(e))
+        else:
+            results = results.order_by('search_rank', 'roll_number')
+            page_obj = Paginator(results, RESUME_SEARCH_PAGE_SIZE).get_page(request.GET.get('page'))
+
+    context = {
+        'page_obj': page_obj,
+        'current_search_query': search_query,
+        'indexed_resumes_count': StudentProfile.objects.exclude(resume_text='').count(),
+    }
+    return render(request, 'core/resume_search_admin.html', context)
+# ----------------------------------------
+
+
 # --- NEW: EXPORT VIEW (unchanged) ---
 @login_required
 @user_passes_test(is_admin)
@@ -278,27 +274,10 @@ def export_students_xls(request):
     # 1. Replicate filtering logic from student_list_admin
     all_students = StudentProfile.objects.all().order_by('roll_number')
 
-    search_query = request.GET.get('q')
-    branch_filter = request.GET.get('branch')
-    min_cgpa = request.GET.get('min_cgpa')
-    max_backlogs = request.GET.get('max_backlogs')
-    
     # Use select_related and prefetch_related for efficient querying
     filtered_students = all_students.select_related('user').prefetch_related('applications')
 
-    if search_query:
-        filtered_students = filtered_students.filter(
-            Q(user__username__icontains=search_query) |
-            Q(user__first_name__icontains=search_query) |
-            Q(user__last_name__icontains=search_query) |
-            Q(roll_number__icontains=search_query)
-        )
-    if branch_filter:
-        filtered_students = filtered_students.filter(branch__icontains=branch_filter)
-    if min_cgpa:
-        filtered_students = filtered_students.filter(cgpa__gte=min_cgpa)
-    if max_backlogs:
-        filtered_students = filtered_students.filter(backlogs__lte=max_backlogs)
+    filtered_students = filter_students(filtered_students, request.GET)
 
     # 2. Excel Generation Logic
     response = HttpResponse(content_type='text/csv')
@@ -340,170 +319,34 @@ def student_profile_view(request):
     if request.method == 'POST':
         form = StudentProfileForm(request.POST, request.FILES, instance=student_profile)
         if form.is_valid():
+            # Saving recomputes the readiness score if any of its inputs changed
             form.save()
             if 'resume_file' in request.FILES:
-                parse_resume_for_student(student_profile)
-            
-            # --- CALCULATE READINESS SCORE ---
-            calculate_readiness_score(student_profile)
-            # ---------------------------------
-            
-            messages.success(request, "Profile updated successfully!")
+                # Parsed in the background; the page shows the progress
+                queue_resume_parse(student_profile)
+                messages.success(request, "Profile updated successfully! Your resume is being parsed.")
+            else:
+                messages.success(request, "Profile updated successfully!")
             return redirect('student_profile_view')
         else:
             messages.error(request, "Error updating profile.")
     else:
-        # --- CALCULATE SCORE ON INITIAL VIEW ---
-        if created or student_profile.placement_readiness_score == 0.0:
-            calculate_readiness_score(student_profile)
-        # ---------------------------------------
         form = StudentProfileForm(instance=student_profile)
     return render(request, 'core/student_profile.html', {'form': form, 'student_profile': student_profile})
 
-# --- ML/NLP (Resume Parsing) Integration (unchanged functions) ---
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("SpaCy model 'en_core_web_sm' not found. Please run 'python -m spacy download en_core_web_sm'")
-    nlp = None
-
-
-def extract_text_from_pdf(pdf_path):
-    text = ""
-    try:
-        with open(pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(reader.pages)):
-                text += reader.pages[page_num].extract_text()
-    except Exception as e:
-        print(f"Error extracting text from PDF: {e}")
-    return text
-
-def extract_text_from_docx(docx_path):
-    text = ""
-    try:
-        doc = Document(docx_path)
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-    except Exception as e:
-        print(f"Error extracting text from DOCX: {e}")
-    return text
-
-def parse_resume_text(text):
-    if not nlp:
-        return {'skills': '', 'education': '', 'experience': '', 'phone_number': '', 'cgpa': None, 'backlogs': None}
-
-    doc = nlp(text)
-    
-    skills = []
-    education = []
-    experience = []
-    phone_number = ""
-    cgpa = None
-    backlogs = None
-    
-    # --- CGPA Extraction ---
-    # Looks for 'CGPA' or 'GPA' followed by a number format X.X or X.XX
-    # Use a broad search and extract the first match
-    cgpa_match = re.search(r'(cgpa|gpa|score|percentage)\D*(\d\.\d{1,2}|\d{2,3})', text, re.IGNORECASE)
-    if cgpa_match:
-        try:
-            # Clean and convert the matched number to a float
-            cgpa_str = cgpa_match.group(2).replace(',', '.')
-            if '.' not in cgpa_str and len(cgpa_str) > 2: # Handle 85 (for 8.5/10 or 85%)
-                cgpa_value = float(cgpa_str) / 10.0 # Arbitrary guess for 85 -> 8.5
-            else:
-                cgpa_value = float(cgpa_str)
-            
-            # Simple validation: CGPA should be between 0.00 and 10.00
-            if 0.0 <= cgpa_value <= 10.0:
-                cgpa = round(cgpa_value, 2)
-        except ValueError:
-            pass
-            
-    # --- Backlogs Extraction ---
-    # Looks for 'backlog' or 'arrear' followed by a number (0, 1, 2, etc.)
-    backlogs_match = re.search(r'(backlogs|arrears|backlog|arrear)\D*(\d+)', text, re.IGNORECASE)
-    if backlogs_match:
-        try:
-            backlogs = int(backlogs_match.group(2))
-        except ValueError:
-            pass
-
-    # --- ENHANCED SKILL LIST ---
-    common_skills = [
-        "python", "java", "django", "react", "sql", "data analysis", "machine learning", 
-        "web development", "javascript", "html", "css", "c++", "aws", "git", 
-        "full stack", "node js", "mongodb", "azure", "docker", "kubernetes",
-        "tableau", "power bi", "spring boot", "rest api", "api", "testing", "ai/ml",
-        "neural networks", "devops", "cloud computing", "r programming", "linux", "typescript"
-    ]
-    text_lower = text.lower()
-    for skill in common_skills:
-        if skill in text_lower:
-            skills.append(skill.capitalize())
-    # --------------------------
-
-    for ent in doc.ents:
-        if ent.label_ == "ORG" and ("university" in ent.text.lower() or "college" in ent.text.lower()):
-            education.append(ent.text)
-        elif ent.label_ == "ORG" and re.search(r'\b(b\.?tech|m\.?tech|bachelor|master|ph\.?d)\b', ent.text, re.IGNORECASE):
-             education.append(ent.text)
-
-    for sent in doc.sents:
-        if "experience" in sent.text.lower() or "worked at" in sent.text.lower() or "software engineer" in sent.text.lower() or "project" in sent.text.lower():
-            experience.append(sent.text)
-
-    phone_match = re.search(r'\b(?:\+91[\s-]?)?[6789]\d{9}\b', text)
-    if not phone_match:
-        phone_match = re.search(r'\b(?:\+?\d{1,3}[-. ]?)?\(?\d{3}\)?[-. ]?\d{3}[-. ]?\d{4}\b', text)
-
-    if phone_match:
-        phone_number = phone_match.group(0)
-
-
-    parsed_data = {
-        'skills': ", ".join(list(set(skills))),
-        'education': "\n".join(list(set(education))),
-        'experience': "\n".join(list(set(experience))),
-        'phone_number': phone_number,
-        'cgpa': cgpa,      # NEW FIELD
-        'backlogs': backlogs # NEW FIELD
-    }
-    return parsed_data
 
-def parse_resume_for_student(student_profile):
-    if student_profile.resume_file:
-        file_path = student_profile.resume_file.path
-        file_extension = os.path.splitext(file_path)[1].lower()
-        
-        extracted_text = ""
-        if file_extension == '.pdf':
-            extracted_text = extract_text_from_pdf(file_path)
-        elif file_extension == '.docx':
-            extracted_text = extract_text_from_docx(file_path)
-        else:
-            messages.error(f"Unsupported file type: {file_extension}. Only PDF and DOCX are supported.")
-            return
+@login_required
+@user_passes_test(is_student)
+def resume_parse_status(request):
+    """Polled by the profile page while a resume parse is queued or running."""
+    student_profile = get_object_or_404(StudentProfile, user=request.user)
+    return JsonResponse({
+        'status': student_profile.resume_parse_status,
+        'label': student_profile.get_resume_parse_status_display(),
+    })
 
-        parsed_data = parse_resume_text(extracted_text)
-        
-        student_profile.skills = parsed_data.get('skills', student_profile.skills)
-        student_profile.education = parsed_data.get('education', student_profile.education)
-        student_profile.experience = parsed_data.get('experience', student_profile.experience)
-        student_profile.phone_number = parsed_data.get('phone_number', student_profile.phone_number)
-        
-        # --- UPDATE CGPA/BACKLOGS ONLY IF A VALID VALUE WAS FOUND ---
-        if parsed_data.get('cgpa') is not None:
-            student_profile.cgpa = parsed_data.get('cgpa')
-        if parsed_data.get('backlogs') is not None:
-            student_profile.backlogs = parsed_data.get('backlogs')
-        # -----------------------------------------------------------
-        
-        student_profile.save()
-        print(f"Resume parsed and profile updated for {student_profile.user.username}")
-    else:
-        print(f"No resume file found for {student_profile.user.username}")
+# --- ML/NLP (Resume Parsing) lives in core/resume_parser.py (spaCy is loaded lazily) ---
+from .resume_parser import parse_resume_for_student  # noqa: E402,F401  (re-exported for existing callers)
 
 
 # //////////////
@@ -13,7 +13,7 @@ except Exception:
 # placement/admin.py
 
 from django.contrib import admin
-from .models import Job, Application
+from .models import Job, Application, OutboxEmail
 
 
 @admin.register(Job)
@@ -21,6 +21,7 @@ class JobAdmin(admin.ModelAdmin):
     list_display = ("company_name", "job_role", "application_deadline", "posted_by", "posted_at")
     search_fields = ("company_name", "job_role")
     list_filter = ("company_name", "application_deadline")
+    readonly_fields = ("min_cgpa", "allowed_branches", "max_backlogs", "all_branches")
 
 
 @admin.register(Application)
@@ -31,3 +32,11 @@ class ApplicationAdmin(admin.ModelAdmin):
 
     # Optional: make status and comments editable directly from list view
     list_editable = ("status", "admin_comments")
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "to_email", "kind", "status", "attempts", "send_after", "created_at", "sent_at")
+    list_filter = ("status", "kind")
+    search_fields = ("to_email", "subject")
+    readonly_fields = ("attempts", "locked_until", "locked_by", "last_error", "created_at", "sent_at")
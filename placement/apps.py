@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PlacementConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'placement'
+
+    def ready(self):
+        from . import signals  # noqa: F401  (connects the match table receivers)
@@ -0,0 +1,60 @@
+# placement/batch_scoring.py
+
+import numpy as np
+
+from .eligibility import normalize_branch
+
+
+def float_column(values):
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+
+def branch_token_column(branches):
+    """Delimited branch tokens (see eligibility.branch_token) as a NumPy string array."""
+    return np.array([f",{normalize_branch(b)}," for b in branches], dtype=str)
+
+
+def evaluate_columns(cgpa, backlogs, branch_tokens, min_cgpa, max_backlogs, all_branches, allowed_branches, skip_missing=True):
+    """
+    Vectorized equivalent of eligibility.evaluate_eligibility over whole columns.
+
+    Numeric inputs use NaN for missing values and branches are passed as
+    branch_token_column() output. Returns (match_score,
+    max_possible_match_score, is_hard_eligible) arrays, one entry per row.
+    """
+    allowed = np.asarray(allowed_branches, dtype=str)
+
+    # A. Branch
+    branch_applies = ~np.asarray(all_branches, dtype=bool) & (allowed != "")
+    branch_met = branch_applies & (np.char.find(allowed, branch_tokens) >= 0)
+
+    # B. CGPA (with skip_missing, left out of the score when the student has no CGPA)
+    cgpa_applies = ~np.isnan(min_cgpa)
+    if skip_missing:
+        cgpa_applies &= ~np.isnan(cgpa)
+    with np.errstate(invalid='ignore'):
+        cgpa_met = cgpa_applies & (cgpa >= min_cgpa)
+
+    # C. Backlogs
+    backlogs_applies = ~np.isnan(max_backlogs)
+    if skip_missing:
+        backlogs_applies &= ~np.isnan(backlogs)
+    with np.errstate(invalid='ignore'):
+        backlogs_met = backlogs_applies & (backlogs <= max_backlogs)
+
+    max_score = branch_applies.astype(np.int64) + cgpa_applies + backlogs_applies
+    match_score = branch_met.astype(np.int64) + cgpa_met + backlogs_met
+    return match_score, max_score, match_score == max_score
+
+
+def match_percentage_columns(match_score, max_score):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(max_score == 0, 0.0, np.round(match_score / max_score * 100, 0))
+
+
+def recommendation_columns(match_percentage, max_score):
+    return np.select(
+        [max_score == 0, match_percentage >= 90, match_percentage >= 60],
+        ["No Criteria", "Strong Fit", "Average Match"],
+        default="Low Match",
+    )
@@ -0,0 +1,48 @@
+# placement/bulk_actions.py
+
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Application
+from .outbox import queue_emails
+
+# Ids per UPDATE / SELECT, to stay under the database's query parameter limit
+BULK_CHUNK_SIZE = 500
+
+
+def _changes(status, admin_comments):
+    """Fields to write, and the filter for rows that already have those values."""
+    fields = {'status': status}
+    if admin_comments is not None:
+        fields['admin_comments'] = admin_comments
+    return fields, Q(**fields)
+
+
+def bulk_set_application_status(applications, status, admin_comments=None):
+    """
+    Sets `status` (and `admin_comments`, unless None) on every application
+    in the queryset with set-based UPDATEs, then queues one status email per
+    row that actually changed, in the same transaction.
+
+    Application.save() is bypassed: its per-row "did it change" query is
+    replaced by excluding the rows that already have the new values.
+    Returns (updated, emails_queued).
+    """
+    fields, unchanged = _changes(status, admin_comments)
+    updated = 0
+    emails = []
+    with transaction.atomic():
+        changed_ids = list(
+            applications.exclude(unchanged).select_for_update().order_by('pk').values_list('pk', flat=True)
+        )
+        for start in range(0, len(changed_ids), BULK_CHUNK_SIZE):
+            chunk = changed_ids[start:start + BULK_CHUNK_SIZE]
+            updated += Application.objects.filter(pk__in=chunk).exclude(unchanged).update(**fields)
+            emails.extend(_status_emails(chunk))
+        queue_emails(emails)
+    return updated, len(emails)
+
+
+def _status_emails(application_ids):
+    rows = Application.objects.filter(pk__in=application_ids).select_related('student__user', 'job')
+    return [email for email in (application.status_outbox_email() for application in rows) if email is not None]
@@ -0,0 +1,118 @@
+# placement/eligibility.py
+
+import re
+
+# Branch codes recognised inside free-text eligibility criteria and
+# student branch names, plus the spelled-out names that mean the same code.
+BRANCH_CODES = ("cse", "it", "ece", "eee", "mech", "civil")
+BRANCH_ALIASES = {
+    "computer science": "cse",
+    "information technology": "it",
+    "electronics and communication": "ece",
+    "electrical and electronics": "eee",
+    "mechanical": "mech",
+}
+
+ALL_BRANCHES_RE = re.compile(r'all\s+branches|any\s+branch')
+BRANCH_RE = re.compile(r'\b(' + '|'.join((*BRANCH_ALIASES, *BRANCH_CODES)) + r')\b')
+CGPA_RE = re.compile(r'(?:min(?:imum)?\s*)?cgpa\s*(\d+\.?\d*)')
+NO_BACKLOGS_RE = re.compile(r'no\s+backlogs')
+MAX_BACKLOGS_RE = re.compile(r'max(?:imum)?\s+backlogs\s+(\d+)')
+
+
+def compile_eligibility_criteria(criteria):
+    """
+    Parses free-text eligibility criteria (e.g. "Min CGPA 7.0, CSE/IT branches,
+    No backlogs") into the structured rule stored on a Job.
+    """
+    text = (criteria or "").lower()
+
+    all_branches = bool(ALL_BRANCHES_RE.search(text))
+    branches = []
+    if not all_branches:
+        for name in BRANCH_RE.findall(text):
+            code = BRANCH_ALIASES.get(name, name)
+            if code not in branches:
+                branches.append(code)
+
+    min_cgpa = None
+    cgpa_match = CGPA_RE.search(text)
+    if cgpa_match:
+        min_cgpa = float(cgpa_match.group(1))
+
+    max_backlogs = None
+    if NO_BACKLOGS_RE.search(text):
+        max_backlogs = 0
+    else:
+        backlogs_match = MAX_BACKLOGS_RE.search(text)
+        if backlogs_match:
+            max_backlogs = int(backlogs_match.group(1))
+
+    return {
+        'min_cgpa': min_cgpa,
+        # Stored comma-delimited on both ends so a single branch can be
+        # looked up with `allowed_branches__contains=",cse,"`.
+        'allowed_branches': f",{','.join(branches)}," if branches else "",
+        'max_backlogs': max_backlogs,
+        'all_branches': all_branches,
+    }
+
+
+def normalize_branch(branch):
+    """
+    Reduces a student's branch to the code it names, so "CSE (AI&ML)",
+    "CSE-DS" and "Computer Science" all match criteria listing CSE.
+
+    Codes are whole words, unlike the old substring test, which read the "it"
+    in "with" as the IT branch and let an "E" student match "ECE". A branch
+    naming no known code is compared as its own lower-cased text.
+    """
+    text = (branch or "").strip().lower()
+    match = BRANCH_RE.search(text)
+    if match is None:
+        return text
+    return BRANCH_ALIASES.get(match.group(1), match.group(1))
+
+
+def branch_token(branch):
+    """Returns the delimited token used to look a branch up in Job.allowed_branches."""
+    return f",{normalize_branch(branch)},"
+
+
+def evaluate_eligibility(job, cgpa, backlogs, branch, skip_missing=False):
+    """
+    Evaluates a job's compiled eligibility rule against a student's values.
+
+    Returns (match_score, max_possible_match_score, is_hard_eligible). With
+    skip_missing=True, a criterion the student has no value for is left out
+    of the score instead of counting as a failed (hard-ineligible) criterion.
+    """
+    match_score = 0
+    max_possible_match_score = 0
+    is_hard_eligible = True
+
+    # A. Branch
+    if not job.all_branches and job.allowed_branches:
+        max_possible_match_score += 1
+        if branch_token(branch) in job.allowed_branches:
+            match_score += 1
+        else:
+            is_hard_eligible = False
+
+    # B. CGPA
+    if job.min_cgpa is not None and not (skip_missing and cgpa is None):
+        max_possible_match_score += 1
+        if cgpa is not None and float(cgpa) >= job.min_cgpa:
+            match_score += 1
+        else:
+            is_hard_eligible = False
+
+    # C. Backlogs
+    if job.max_backlogs is not None and not (skip_missing and backlogs is None):
+        max_possible_match_score += 1
+        if backlogs is not None and backlogs <= job.max_backlogs:
+            match_score += 1
+        else:
+            is_hard_eligible = False
+
+    return match_score, max_possible_match_score, is_hard_eligible
@@ -0,0 +1,95 @@
+# placement/emails.py
+
+import threading
+
+from django.template.loader import get_template
+
+# Per-status wording of the student's email; 'applied' has none
+STATUS_EMAILS = {
+    "shortlisted": {
+        "emoji": "🎉",
+        "color": "#28a745",  # Green
+        "greeting": "Good News! {emoji} You've been Shortlisted!",
+        "body": "Your application for the **{job_role}** role at **{company_name}** has been **SHORTLISTED**.",
+        "subject": "🎉 Shortlisted: {job_role} at {company_name}",
+    },
+    "rejected": {
+        "emoji": "😔",
+        "color": "#dc3545",  # Red
+        "greeting": "Important Update {emoji} on Your Application",
+        "body": "Unfortunately, your application for the **{job_role}** role at **{company_name}** has been **REJECTED**.",
+        "subject": "😔 Rejected: {job_role} at {company_name}",
+    },
+    "interview_scheduled": {
+        "emoji": "🗓️",
+        "color": "#007bff",  # Blue
+        "greeting": "Interview Scheduled! {emoji} Get Ready!",
+        "body": "**Heads up!** Your interview for the **{job_role}** role at **{company_name}** has been **SCHEDULED**. Please prepare well!",
+        "subject": "🗓️ Interview Scheduled: {job_role} at {company_name}",
+    },
+    "selected": {
+        "emoji": "🥳",
+        "color": "#ffc107",  # Orange
+        "greeting": "CONGRATULATIONS! YOU'VE BEEN SELECTED! {emoji}",
+        "body": "We are thrilled to inform you that you have been **SELECTED** for the **{job_role}** role at **{company_name}**! This is fantastic news. View your offer details on the portal.",
+        "subject": "🥳 Selected: {job_role} at {company_name}",
+    },
+}
+
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def email_template(name):
+    """The compiled placement/emails/<name> template, loaded once per process."""
+    template = _templates.get(name)
+    if template is None:
+        with _templates_lock:
+            template = _templates.get(name)
+            if template is None:
+                template = _templates[name] = get_template(f"placement/emails/{name}")
+    return template
+
+
+def status_update(job_role, company_name, status, status_display, admin_comments):
+    """
+    Everything the templates show about one status change, or None for a
+    status without an email. Stored as OutboxEmail.payload so a later
+    digest can list the update as it was when it happened.
+    """
+    wording = STATUS_EMAILS.get(status)
+    if wording is None:
+        return None
+    values = {"job_role": job_role, "company_name": company_name, "emoji": wording["emoji"]}
+    return {
+        "job_role": job_role,
+        "company_name": company_name,
+        "status": status,
+        "status_display": status_display,
+        "admin_comments": admin_comments or "",
+        "emoji": wording["emoji"],
+        "color": wording["color"],
+        "greeting": wording["greeting"].format(**values),
+        "body": wording["body"].format(**values),
+        "subject": wording["subject"].format(**values),
+    }
+
+
+def render_status_email(update, first_name, last_name):
+    """(subject, plain text, HTML) for a single status update."""
+    context = {"update": update, "first_name": first_name, "last_name": last_name}
+    return (
+        update["subject"],
+        email_template("status_update.txt").render(context),
+        email_template("status_update.html").render(context),
+    )
+
+
+def render_digest_email(updates, first_name, last_name):
+    """(subject, plain text, HTML) of one email listing several status updates, oldest first."""
+    context = {"updates": updates, "first_name": first_name, "last_name": last_name}
+    return (
+        f"📬 {len(updates)} updates on your applications",
+        email_template("status_digest.txt").render(context),
+        email_template("status_digest.html").render(context),
+    )
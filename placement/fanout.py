@@ -0,0 +1,43 @@
+# placement/fanout.py
+
+import logging
+
+from .models import JobNotification, StudentJobMatch
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_BATCH_SIZE = 1000
+
+
+def eligible_student_ids(job_id):
+    """
+    Ids of students who are hard-eligible for the job, read from the
+    materialized match table (indexed, no per-student scoring).
+    """
+    return StudentJobMatch.objects.filter(job_id=job_id, is_hard_eligible=True).values_list('student_id', flat=True)
+
+
+def fan_out_jobs(job_ids):
+    """
+    Writes a JobNotification for every eligible student of each job, in
+    batches. The jobs' match columns must be current (see
+    tasks.fan_out_job). Returns the number of notifications created;
+    students already notified of a job are skipped and not counted.
+    """
+    created = 0
+    for job_id in job_ids:
+        notifications = JobNotification.objects.filter(job_id=job_id)
+        already_notified = notifications.count()
+        student_ids = eligible_student_ids(job_id).order_by('student_id').iterator(chunk_size=NOTIFICATION_BATCH_SIZE)
+        batch = []
+        for student_id in student_ids:
+            batch.append(JobNotification(student_id=student_id, job_id=job_id))
+            if len(batch) == NOTIFICATION_BATCH_SIZE:
+                JobNotification.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        JobNotification.objects.bulk_create(batch, ignore_conflicts=True)
+        # ignore_conflicts drops duplicates silently, so count what was inserted
+        notified = notifications.count() - already_notified
+        created += notified
+        logger.info("Fanned out job %s to %s eligible students", job_id, notified)
+    return created
@@ -0,0 +1,16 @@
+# placement/management/commands/rebuild_job_search_index.py
+
+from django.core.management.base import BaseCommand
+
+from placement.search import fts_enabled, rebuild_job_index
+
+
+class Command(BaseCommand):
+    help = "Re-populates the FTS5 job search index from the Job table."
+
+    def handle(self, *args, **options):
+        if not fts_enabled():
+            self.stdout.write(self.style.WARNING("Full-text job search needs SQLite FTS5; nothing to rebuild."))
+            return
+        indexed = rebuild_job_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} jobs for search."))
@@ -0,0 +1,13 @@
+# placement/management/commands/rebuild_match_table.py
+
+from django.core.management.base import BaseCommand
+
+from placement.match_table import rebuild_match_table
+
+
+class Command(BaseCommand):
+    help = "Recomputes every row of the StudentJobMatch table (e.g. after a bulk import that bypassed save())."
+
+    def handle(self, *args, **options):
+        written = rebuild_match_table()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} student/job match rows."))
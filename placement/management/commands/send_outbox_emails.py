@@ -0,0 +1,29 @@
+# placement/management/commands/send_outbox_emails.py
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from placement.outbox import dispatch_outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Sends the emails queued in the outbox over one mail connection, in batches, "
+        "with rate limiting and retries. Use --loop to keep polling."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help="Emails claimed per batch.")
+        parser.add_argument('--rate-limit', type=float, default=None, help="Messages per second (0: unlimited).")
+        parser.add_argument('--loop', action='store_true', help="Keep polling the outbox.")
+        parser.add_argument('--interval', type=float, default=5.0, help="Seconds between polls with --loop.")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = dispatch_outbox(batch_size=options['batch_size'], rate_limit=options['rate_limit'])
+            if sent or failed or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(f"Sent {sent} email(s), {failed} failed."))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,33 @@
+# placement/management/commands/train_placement_model.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from placement.training import TrainingError, train_placement_model
+
+
+class Command(BaseCommand):
+    help = (
+        "Trains the placement prediction models from decided applications, streaming rows into an "
+        "on-disk feature matrix, and writes a versioned artifact plus metrics."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output-dir', help="Where to write the artifact (default: next to PLACEMENT_MODEL_PATH).")
+        parser.add_argument(
+            '--no-activate', action='store_true',
+            help="Only write the versioned artifact; do not replace the served model.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            artifact_path, metrics = train_placement_model(
+                output_dir=options['output_dir'], activate=not options['no_activate'],
+            )
+        except ImportError:
+            raise CommandError("joblib is required to write the model artifact (pip install joblib).")
+        except TrainingError as e:
+            raise CommandError(str(e))
+        self.stdout.write(json.dumps(metrics, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {artifact_path}"))
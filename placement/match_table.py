@@ -0,0 +1,161 @@
+# placement/match_table.py
+
+import numpy as np
+from django.db.models import Exists, F, FilteredRelation, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from core.models import StudentProfile
+from .models import Application, Job, StudentJobMatch
+from .batch_scoring import (
+    branch_token_column,
+    evaluate_columns,
+    float_column,
+    match_percentage_columns,
+    recommendation_columns,
+)
+
+STUDENT_COLUMNS = ('pk', 'cgpa', 'backlogs', 'branch')
+JOB_COLUMNS = ('pk', 'min_cgpa', 'max_backlogs', 'all_branches', 'allowed_branches')
+MATCH_UPDATE_FIELDS = ['match_percentage', 'is_hard_eligible', 'shortlist_percentage', 'recommendation', 'updated_at']
+
+# Students scored per NumPy pass against the full job column set
+CHUNK_SIZE = 500
+
+
+def compute_match_rows(students, jobs):
+    """
+    Scores every (student, job) pair of the given value rows (see
+    STUDENT_COLUMNS / JOB_COLUMNS) in one vectorized pass.
+
+    Returns parallel arrays: student ids, job ids, match_percentage,
+    is_hard_eligible, shortlist_percentage and recommendation.
+    """
+    student_ids, cgpa, backlogs, branch = zip(*students)
+    job_ids, min_cgpa, max_backlogs, all_branches, allowed = zip(*jobs)
+    n_jobs = len(job_ids)
+    n_students = len(student_ids)
+
+    # Cross product: each student row repeated once per job
+    columns = (
+        np.repeat(float_column(cgpa), n_jobs),
+        np.repeat(float_column(backlogs), n_jobs),
+        np.repeat(branch_token_column(branch), n_jobs),
+        np.tile(float_column(min_cgpa), n_students),
+        np.tile(float_column(max_backlogs), n_students),
+        np.tile(np.asarray(all_branches, dtype=bool), n_students),
+        np.tile(np.asarray(allowed, dtype=str), n_students),
+    )
+
+    match_score, max_score, is_hard_eligible = evaluate_columns(*columns, skip_missing=False)
+    shortlist_score, shortlist_max, _ = evaluate_columns(*columns, skip_missing=True)
+    shortlist_percentage = match_percentage_columns(shortlist_score, shortlist_max)
+
+    return (
+        np.repeat(np.asarray(student_ids), n_jobs),
+        np.tile(np.asarray(job_ids), n_students),
+        match_percentage_columns(match_score, max_score),
+        is_hard_eligible,
+        shortlist_percentage,
+        recommendation_columns(shortlist_percentage, shortlist_max),
+    )
+
+
+def _upsert(match_model, students, jobs):
+    if not students or not jobs:
+        return 0
+    rows = zip(*(column.tolist() for column in compute_match_rows(students, jobs)))
+    objs = [
+        match_model(
+            student_id=student_id,
+            job_id=job_id,
+            match_percentage=match_percentage,
+            is_hard_eligible=is_hard_eligible,
+            shortlist_percentage=shortlist_percentage,
+            recommendation=recommendation,
+        )
+        for student_id, job_id, match_percentage, is_hard_eligible, shortlist_percentage, recommendation in rows
+    ]
+    match_model.objects.bulk_create(
+        objs,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=['student', 'job'],
+        update_fields=MATCH_UPDATE_FIELDS,
+    )
+    return len(objs)
+
+
+def refresh_matches(students, jobs, match_model=StudentJobMatch):
+    """
+    Recomputes the StudentJobMatch rows for every pair of the given
+    StudentProfile and Job querysets, streaming students in chunks.
+    """
+    job_rows = list(jobs.values_list(*JOB_COLUMNS))
+    if not job_rows:
+        return 0
+
+    written = 0
+    chunk = []
+    for row in students.values_list(*STUDENT_COLUMNS).iterator(chunk_size=CHUNK_SIZE):
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            written += _upsert(match_model, chunk, job_rows)
+            chunk = []
+    written += _upsert(match_model, chunk, job_rows)
+    return written
+
+
+def sync_application_scores(applications):
+    """Copies the stored shortlist percentage onto Application.match_score in one UPDATE."""
+    match = StudentJobMatch.objects.filter(student=OuterRef('student'), job=OuterRef('job'))
+    return applications.filter(Exists(match)).update(
+        match_score=Subquery(match.values('shortlist_percentage')[:1])
+    )
+
+
+def refresh_student_matches(student_ids):
+    """Recomputes the match row of the given students against every job."""
+    written = refresh_matches(StudentProfile.objects.filter(pk__in=student_ids), Job.objects.all())
+    sync_application_scores(Application.objects.filter(student_id__in=student_ids))
+    return written
+
+
+def refresh_job_matches(job_ids):
+    """Recomputes the match column of the given jobs against every student."""
+    written = refresh_matches(StudentProfile.objects.all(), Job.objects.filter(pk__in=job_ids))
+    sync_application_scores(Application.objects.filter(job_id__in=job_ids))
+    return written
+
+
+def rebuild_match_table():
+    written = refresh_matches(StudentProfile.objects.all(), Job.objects.all())
+    sync_application_scores(Application.objects.all())
+    return written
+
+
+def annotate_application_match(applications):
+    """
+    Annotates an Application queryset with its shortlisting `match_percentage`
+    (the indexed Application.match_score) and the stored `recommendation`.
+    """
+    match = StudentJobMatch.objects.filter(student=OuterRef('student'), job=OuterRef('job'))
+    return applications.annotate(
+        match_percentage=F('match_score'),
+        recommendation=Coalesce(Subquery(match.values('recommendation')[:1]), Value("No Criteria")),
+    )
+
+
+def annotate_student_job_match(jobs, student_profile):
+    """
+    Annotates a Job queryset with the student's stored `match_percentage` and
+    `is_hard_eligible` (LEFT JOIN; a job without a match row gets 0% and
+    is not counted as eligible). Read-only: a new or edited job's column is
+    written by the placement.fan_out_job / placement.refresh_job_matches
+    tasks, so it shows 0% (or its old scores) until a worker runs them.
+    """
+    return jobs.annotate(
+        student_match=FilteredRelation('student_matches', condition=Q(student_matches__student=student_profile)),
+    ).annotate(
+        match_percentage=Coalesce(F('student_match__match_percentage'), Value(0.0)),
+        is_hard_eligible=Coalesce(F('student_match__is_hard_eligible'), Value(False)),
+    )
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:09
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of placement.eligibility.compile_eligibility_criteria as it was
+# when this migration was written, so later changes can't alter the backfill.
+BRANCH_CODES = ("cse", "it", "ece", "eee", "mech", "civil")
+ALL_BRANCHES_RE = re.compile(r'all\s+branches|any\s+branch')
+BRANCH_RE = re.compile(r'\b(' + '|'.join(BRANCH_CODES) + r')\b')
+CGPA_RE = re.compile(r'(?:min(?:imum)?\s*)?cgpa\s*(\d+\.?\d*)')
+NO_BACKLOGS_RE = re.compile(r'no\s+backlogs')
+MAX_BACKLOGS_RE = re.compile(r'max(?:imum)?\s+backlogs\s+(\d+)')
+
+
+def compile_eligibility_criteria(criteria):
+    text = (criteria or "").lower()
+
+    all_branches = bool(ALL_BRANCHES_RE.search(text))
+    branches = []
+    if not all_branches:
+        for code in BRANCH_RE.findall(text):
+            if code not in branches:
+                branches.append(code)
+
+    cgpa_match = CGPA_RE.search(text)
+    min_cgpa = float(cgpa_match.group(1)) if cgpa_match else None
+
+    max_backlogs = None
+    if NO_BACKLOGS_RE.search(text):
+        max_backlogs = 0
+    else:
+        backlogs_match = MAX_BACKLOGS_RE.search(text)
+        if backlogs_match:
+            max_backlogs = int(backlogs_match.group(1))
+
+    return {
+        'min_cgpa': min_cgpa,
+        'allowed_branches': f",{','.join(branches)}," if branches else "",
+        'max_backlogs': max_backlogs,
+        'all_branches': all_branches,
+    }
+
+
+def compile_existing_jobs(apps, schema_editor):
+    Job = apps.get_model('placement', 'Job')
+    jobs = list(Job.objects.only('id', 'eligibility_criteria'))
+    for job in jobs:
+        for field, value in compile_eligibility_criteria(job.eligibility_criteria).items():
+            setattr(job, field, value)
+    Job.objects.bulk_update(
+        jobs, ['min_cgpa', 'allowed_branches', 'max_backlogs', 'all_branches'], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placement', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='all_branches',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='allowed_branches',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='max_backlogs',
+            field=models.IntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='min_cgpa',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='status',
+            field=models.CharField(choices=[('applied', 'Applied'), ('shortlisted', 'Shortlisted'), ('rejected', 'Rejected'), ('interview_scheduled', 'Interview Scheduled'), ('selected', 'Selected')], default='applied', max_length=20),
+        ),
+        migrations.RunPython(compile_existing_jobs, migrations.RunPython.noop),
+    ]
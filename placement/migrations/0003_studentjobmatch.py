@@ -0,0 +1,93 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def evaluate(job, cgpa, backlogs, branch, skip_missing):
+    """Frozen copy of placement.eligibility.evaluate_eligibility over value rows."""
+    _, min_cgpa, max_backlogs, all_branches, allowed_branches = job
+    match_score = max_score = 0
+    if not all_branches and allowed_branches:
+        max_score += 1
+        match_score += f",{(branch or '').strip().lower()}," in allowed_branches
+    if min_cgpa is not None and not (skip_missing and cgpa is None):
+        max_score += 1
+        match_score += cgpa is not None and float(cgpa) >= min_cgpa
+    if max_backlogs is not None and not (skip_missing and backlogs is None):
+        max_score += 1
+        match_score += backlogs is not None and backlogs <= max_backlogs
+    return match_score, max_score
+
+
+def percentage(match_score, max_score):
+    return float(round(match_score / max_score * 100)) if max_score else 0.0
+
+
+def recommendation(match_percentage, max_score):
+    if max_score == 0:
+        return "No Criteria"
+    if match_percentage >= 90:
+        return "Strong Fit"
+    if match_percentage >= 60:
+        return "Average Match"
+    return "Low Match"
+
+
+def build_match_table(apps, schema_editor):
+    # The table was just created and is empty, so rows are plain inserts
+    # (its unique index on SQLite only exists once this migration commits)
+    StudentProfile = apps.get_model('core', 'StudentProfile')
+    Job = apps.get_model('placement', 'Job')
+    StudentJobMatch = apps.get_model('placement', 'StudentJobMatch')
+    jobs = list(Job.objects.values_list('pk', 'min_cgpa', 'max_backlogs', 'all_branches', 'allowed_branches'))
+    if not jobs:
+        return
+    students = StudentProfile.objects.values_list('pk', 'cgpa', 'backlogs', 'branch')
+    batch = []
+    for student_id, cgpa, backlogs, branch in students.iterator(chunk_size=500):
+        for job in jobs:
+            match_score, max_score = evaluate(job, cgpa, backlogs, branch, skip_missing=False)
+            shortlist_score, shortlist_max = evaluate(job, cgpa, backlogs, branch, skip_missing=True)
+            shortlist_percentage = percentage(shortlist_score, shortlist_max)
+            batch.append(StudentJobMatch(
+                student_id=student_id,
+                job_id=job[0],
+                match_percentage=percentage(match_score, max_score),
+                is_hard_eligible=match_score == max_score,
+                shortlist_percentage=shortlist_percentage,
+                recommendation=recommendation(shortlist_percentage, shortlist_max),
+            ))
+        if len(batch) >= 1000:
+            StudentJobMatch.objects.bulk_create(batch)
+            batch = []
+    StudentJobMatch.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_studentprofile_cluster_id'),
+        ('placement', '0002_job_compiled_eligibility'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentJobMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('match_percentage', models.FloatField(default=0.0)),
+                ('is_hard_eligible', models.BooleanField(default=False)),
+                ('shortlist_percentage', models.FloatField(default=0.0)),
+                ('recommendation', models.CharField(default='No Criteria', max_length=20)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_matches', to='placement.job')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_matches', to='core.studentprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', 'is_hard_eligible', '-match_percentage'], name='placement_s_student_105621_idx'), models.Index(fields=['job', '-shortlist_percentage'], name='placement_s_job_id_b795a6_idx')],
+                'unique_together': {('student', 'job')},
+            },
+        ),
+        migrations.RunPython(build_match_table, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:16
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Subquery
+
+
+def copy_match_scores(apps, schema_editor):
+    Application = apps.get_model('placement', 'Application')
+    StudentJobMatch = apps.get_model('placement', 'StudentJobMatch')
+    match = StudentJobMatch.objects.filter(student=OuterRef('student'), job=OuterRef('job'))
+    Application.objects.filter(Exists(match)).update(
+        match_score=Subquery(match.values('shortlist_percentage')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placement', '0003_studentjobmatch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='match_score',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', '-match_score', '-applied_at', '-id'], name='placement_a_job_id_2e3b29_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-match_score', '-applied_at', '-id'], name='placement_a_match_s_8fbb3f_idx'),
+        ),
+        migrations.RunPython(copy_match_scores, migrations.RunPython.noop),
+    ]
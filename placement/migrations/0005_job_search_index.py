@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+def create_job_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS placement_job_fts USING fts5("
+        "company_name, job_role, description, eligibility_criteria, tokenize='unicode61')"
+    )
+    schema_editor.execute(
+        "INSERT INTO placement_job_fts (rowid, company_name, job_role, description, eligibility_criteria) "
+        "SELECT id, COALESCE(company_name, ''), COALESCE(job_role, ''), "
+        "COALESCE(description, ''), COALESCE(eligibility_criteria, '') FROM placement_job"
+    )
+
+
+def drop_job_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS placement_job_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placement', '0004_application_match_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_job_fts, drop_job_fts),
+    ]
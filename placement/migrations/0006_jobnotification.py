@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_skill_index'),
+        ('placement', '0005_job_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='placement.job')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_notifications', to='core.studentprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', '-created_at'], name='placement_j_student_633f96_idx')],
+                'unique_together': {('student', 'job')},
+            },
+        ),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:05
+
+import re
+
+from django.db import migrations
+from django.db.models import Exists, OuterRef, Subquery
+
+# Frozen copy of the branch parsing in placement.eligibility as it was when
+# this migration was written: spelled-out names map to their code, and a
+# student's branch is reduced to the code it names.
+BRANCH_CODES = ("cse", "it", "ece", "eee", "mech", "civil")
+BRANCH_ALIASES = {
+    "computer science": "cse",
+    "information technology": "it",
+    "electronics and communication": "ece",
+    "electrical and electronics": "eee",
+    "mechanical": "mech",
+}
+BRANCH_RE = re.compile(r'\b(' + '|'.join((*BRANCH_ALIASES, *BRANCH_CODES)) + r')\b')
+
+
+def allowed_branches(criteria):
+    branches = []
+    for name in BRANCH_RE.findall((criteria or "").lower()):
+        code = BRANCH_ALIASES.get(name, name)
+        if code not in branches:
+            branches.append(code)
+    return f",{','.join(branches)}," if branches else ""
+
+
+def branch_token(branch):
+    text = (branch or "").strip().lower()
+    match = BRANCH_RE.search(text)
+    if match is not None:
+        text = BRANCH_ALIASES.get(match.group(1), match.group(1))
+    return f",{text},"
+
+
+def evaluate(job, cgpa, backlogs, branch, skip_missing):
+    """Frozen copy of placement.eligibility.evaluate_eligibility over value rows."""
+    _, min_cgpa, max_backlogs, all_branches, allowed = job
+    match_score = max_score = 0
+    if not all_branches and allowed:
+        max_score += 1
+        match_score += branch_token(branch) in allowed
+    if min_cgpa is not None and not (skip_missing and cgpa is None):
+        max_score += 1
+        match_score += cgpa is not None and float(cgpa) >= min_cgpa
+    if max_backlogs is not None and not (skip_missing and backlogs is None):
+        max_score += 1
+        match_score += backlogs is not None and backlogs <= max_backlogs
+    return match_score, max_score
+
+
+def percentage(match_score, max_score):
+    return float(round(match_score / max_score * 100)) if max_score else 0.0
+
+
+def recommendation(match_percentage, max_score):
+    if max_score == 0:
+        return "No Criteria"
+    if match_percentage >= 90:
+        return "Strong Fit"
+    if match_percentage >= 60:
+        return "Average Match"
+    return "Low Match"
+
+
+def recompute_branch_matches(apps, schema_editor):
+    StudentProfile = apps.get_model('core', 'StudentProfile')
+    Job = apps.get_model('placement', 'Job')
+    StudentJobMatch = apps.get_model('placement', 'StudentJobMatch')
+    Application = apps.get_model('placement', 'Application')
+
+    jobs = list(Job.objects.filter(all_branches=False).only('id', 'eligibility_criteria'))
+    for job in jobs:
+        job.allowed_branches = allowed_branches(job.eligibility_criteria)
+    Job.objects.bulk_update(jobs, ['allowed_branches'], batch_size=500)
+
+    jobs = list(Job.objects.values_list('pk', 'min_cgpa', 'max_backlogs', 'all_branches', 'allowed_branches'))
+    StudentJobMatch.objects.all().delete()
+    if not jobs:
+        return
+    students = StudentProfile.objects.values_list('pk', 'cgpa', 'backlogs', 'branch')
+    batch = []
+    for student_id, cgpa, backlogs, branch in students.iterator(chunk_size=500):
+        for job in jobs:
+            match_score, max_score = evaluate(job, cgpa, backlogs, branch, skip_missing=False)
+            shortlist_score, shortlist_max = evaluate(job, cgpa, backlogs, branch, skip_missing=True)
+            shortlist_percentage = percentage(shortlist_score, shortlist_max)
+            batch.append(StudentJobMatch(
+                student_id=student_id,
+                job_id=job[0],
+                match_percentage=percentage(match_score, max_score),
+                is_hard_eligible=match_score == max_score,
+                shortlist_percentage=shortlist_percentage,
+                recommendation=recommendation(shortlist_percentage, shortlist_max),
+            ))
+        if len(batch) >= 1000:
+            StudentJobMatch.objects.bulk_create(batch)
+            batch = []
+    StudentJobMatch.objects.bulk_create(batch)
+
+    match = StudentJobMatch.objects.filter(student=OuterRef('student'), job=OuterRef('job'))
+    Application.objects.filter(Exists(match)).update(
+        match_score=Subquery(match.values('shortlist_percentage')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_studentprofile_cluster_id'),
+        ('placement', '0008_outbox_digests'),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_branch_matches, migrations.RunPython.noop),
+    ]
@@ -1,36 +1,225 @@
 # placement/ml_service.py
 
-# NOTE: In a real project, this file would handle loading a trained model:
-# import joblib
-# MODEL = joblib.load('path/to/your/model.joblib')
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+
+from core.readiness import readiness_score_columns
+from .prediction_cache import cached_predictions
+
+logger = logging.getLogger(__name__)
+
+# Model inputs, in column order. The job-specific model also sees the
+# student's match percentage for the job.
+OVERALL_FEATURES = ('cgpa', 'backlogs', 'has_skills', 'has_resume', 'has_experience')
+JOB_FEATURES = OVERALL_FEATURES + ('match_percentage',)
+
+# How often (seconds) a running process checks the artifact for a new deploy
+MODEL_CHECK_INTERVAL = 60
+
+
+def default_model_path():
+    return getattr(
+        settings, 'PLACEMENT_MODEL_PATH',
+        os.path.join(settings.BASE_DIR, 'ml_models', 'placement_model.joblib'),
+    )
+
+
+# --- FEATURE EXTRACTION ---
+def student_feature_rows(student_profiles):
+    """One OVERALL_FEATURES tuple per StudentProfile (CGPA is None when missing)."""
+    return [
+        (
+            None if profile.cgpa is None else float(profile.cgpa),
+            profile.backlogs,
+            bool(profile.skills),
+            bool(profile.resume_file),
+            bool(profile.experience),
+        )
+        for profile in student_profiles
+    ]
+
+
+def feature_matrix(rows):
+    """Float matrix of feature rows, with NaN for missing values."""
+    if not rows:
+        return np.empty((0, 0), dtype=float)
+    return np.array([[np.nan if value is None else value for value in row] for row in rows], dtype=float)
+
+
+def round_predictions(values):
+    """Rounds to 2 decimals the way round() does (np.round differs on ties)."""
+    return [round(value, 2) for value in np.asarray(values, dtype=float).tolist()]
+
+
+# --- MODELS ---
+class HeuristicPlacementModel:
+    """
+    Fallback used when no trained artifact is deployed: the overall
+    prediction scales the readiness score and the job-specific prediction
+    is a piecewise function of the match percentage.
+    """
+    version = 'heuristic-1'
+
+    def predict_overall(self, X):
+        readiness = readiness_score_columns(
+            X[:, 0], X[:, 1], X[:, 2].astype(bool), X[:, 3].astype(bool), X[:, 4].astype(bool),
+        )
+        # Scale readiness (max 100) to a prediction (max 95) to reflect uncertainty
+        readiness = np.array(round_predictions(readiness))
+        return np.minimum(readiness * 0.95, 100.0)
+
+    def predict_job(self, X):
+        match = np.nan_to_num(X[:, -1])
+        return np.select(
+            [match >= 100, match >= 75, match >= 50],
+            [98.0, match * 0.90 + 10, match * 0.70 + 10],
+            default=match * 0.50,
+        )
+
+
+class LogisticPlacementModel:
+    """
+    Logistic regression loaded from a joblib artifact: a dict with a
+    `version` string and, for each of `overall` and `job`, a dict holding
+    `features`, `mean`, `scale`, `coef` (arrays) and `intercept`.
+    """
+
+    def __init__(self, artifact):
+        self.version = str(artifact['version'])
+        self.overall = artifact['overall']
+        self.job = artifact['job']
+        if tuple(self.overall['features']) != OVERALL_FEATURES or tuple(self.job['features']) != JOB_FEATURES:
+            raise ValueError("Model artifact was trained on a different feature set")
+
+    @staticmethod
+    def _predict(params, X):
+        # Missing values are imputed with the training mean, i.e. 0 after scaling
+        z = (X - params['mean']) / params['scale']
+        z = np.nan_to_num(z) @ params['coef'] + float(params['intercept'])
+        return 100.0 / (1.0 + np.exp(-z))
+
+    def predict_overall(self, X):
+        return self._predict(self.overall, X)
+
+    def predict_job(self, X):
+        return self._predict(self.job, X)
+
+
+# --- PROCESS-WIDE MODEL HANDLE ---
+_model = None
+_model_mtime = None
+_model_checked_at = 0.0
+_model_lock = threading.Lock()
+
+
+def load_model(path=None):
+    """
+    Loads the artifact at `path` with its arrays memory-mapped read-only, so
+    forked workers share the pages. Falls back to the heuristic model if the
+    artifact (or joblib) is missing or unreadable.
+    """
+    path = path or default_model_path()
+    if not os.path.exists(path):
+        return HeuristicPlacementModel()
+    try:
+        import joblib
+        return LogisticPlacementModel(joblib.load(path, mmap_mode='r'))
+    except Exception:
+        logger.exception("Could not load placement model from %s; using the heuristic model", path)
+        return HeuristicPlacementModel()
+
+
+def _artifact_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def get_model():
+    """
+    The model for this process, loaded lazily on first use. The artifact's
+    mtime is re-checked every MODEL_CHECK_INTERVAL seconds so a newly
+    deployed model is picked up without a restart.
+    """
+    global _model, _model_mtime, _model_checked_at
+    now = time.monotonic()
+    if _model is not None and now - _model_checked_at < MODEL_CHECK_INTERVAL:
+        return _model
+
+    with _model_lock:
+        if _model is not None and now - _model_checked_at < MODEL_CHECK_INTERVAL:
+            return _model
+        path = default_model_path()
+        mtime = _artifact_mtime(path)
+        if _model is None or mtime != _model_mtime:
+            _model = load_model(path)
+            _model_mtime = mtime
+            logger.info("Loaded placement model %s", _model.version)
+        _model_checked_at = now
+        return _model
+
+
+def reset_model():
+    """Drops the loaded model so the next call reloads it (e.g. after training)."""
+    global _model, _model_mtime
+    with _model_lock:
+        _model = None
+        _model_mtime = None
+
+
+# --- BATCH PREDICTION API ---
+def get_overall_placement_predictions(student_profiles):
+    """
+    Overall placement probability (0-100%) for each student. Cached rows are
+    served from the prediction cache; the rest are scored in one vectorized call.
+    """
+    rows = student_feature_rows(student_profiles)
+    if not rows:
+        return []
+    model = get_model()
+    return cached_predictions(
+        'overall', model.version, rows,
+        lambda missing: round_predictions(model.predict_overall(feature_matrix(missing))),
+    )
+
+
+def get_job_specific_predictions(student_profiles, match_percentages):
+    """
+    Job-specific placement probability (0-100%) for each (student, job) pair,
+    given the student profiles and their match percentages for the jobs as
+    parallel sequences.
+    """
+    rows = [
+        features + (float(match or 0.0),)
+        for features, match in zip(student_feature_rows(student_profiles), match_percentages)
+    ]
+    if not rows:
+        return []
+    model = get_model()
+    return cached_predictions(
+        'job', model.version, rows,
+        lambda missing: round_predictions(model.predict_job(feature_matrix(missing))),
+    )
+
 
 def get_overall_placement_prediction(student_profile):
+    """Overall placement probability (0-100%) across the entire job market."""
+    return get_overall_placement_predictions([student_profile])[0]
+
+
+def get_job_specific_prediction(job_match_percentage, student_profile=None):
+    """
+    Job-specific placement probability (0-100%) for one student and job.
+    Without a profile only the match percentage is known, so the heuristic
+    model is used.
     """
-    Mocks an overall placement prediction probability (0-100%)
-    by scaling the existing Placement Readiness Score.
-    
-    This is what a real ML model would provide, but across the entire job market.
-    """
-    if student_profile.placement_readiness_score is None:
-        return 0.0
-        
-    # Example: Scale readiness score (max 100) to prediction (max 95) 
-    # to simulate a slight uncertainty in prediction.
-    prediction = float(student_profile.placement_readiness_score) * 0.95
-    return round(min(prediction, 100.0), 2)
-
-def get_job_specific_prediction(job_match_percentage):
-    """
-    Generates a job-specific prediction (0-100%) based on the Match Score.
-    
-    This simulates a dedicated classification model that uses Job Match Score
-    as its primary input.
-    """
-    if job_match_percentage >= 100:
-        return 98.0
-    elif job_match_percentage >= 75:
-        return round(job_match_percentage * 0.90 + 10, 2)
-    elif job_match_percentage >= 50:
-        return round(job_match_percentage * 0.70 + 10, 2)
-    else:
-        return round(job_match_percentage * 0.50, 2)
\ No newline at end of file
+    if student_profile is None:
+        X = feature_matrix([(None, None, False, False, False, float(job_match_percentage or 0.0))])
+        return round_predictions(HeuristicPlacementModel().predict_job(X))[0]
+    return get_job_specific_predictions([student_profile], [job_match_percentage])[0]
@@ -1,10 +1,15 @@
 # placement/models.py
 
-from django.db import models
-from core.models import User, StudentProfile  # Import your custom User and StudentProfile
-from django.core.mail import send_mail
+from django.db import models, transaction
+from django.utils import timezone
+from core.models import User, StudentProfile, TrackedFieldsMixin  # Import your custom User and StudentProfile
+from .eligibility import compile_eligibility_criteria
+
+class Job(TrackedFieldsMixin, models.Model):
+    # Columns mirrored into the placement_job_fts search index
+    SEARCH_FIELDS = ('company_name', 'job_role', 'description', 'eligibility_criteria')
+    tracked_fields = SEARCH_FIELDS
 
-class Job(models.Model):
     company_name = models.CharField(max_length=100)
     job_role = models.CharField(max_length=100)
     description = models.TextField()
@@ -22,9 +27,73 @@ class Job(models.Model):
     )
     posted_at = models.DateTimeField(auto_now_add=True)
 
+    # --- Compiled eligibility rule (parsed from eligibility_criteria on save) ---
+    min_cgpa = models.FloatField(null=True, blank=True, db_index=True, editable=False)
+    allowed_branches = models.CharField(max_length=100, blank=True, default="", db_index=True, editable=False)
+    max_backlogs = models.IntegerField(null=True, blank=True, db_index=True, editable=False)
+    all_branches = models.BooleanField(default=False, editable=False)
+    # ---------------------------------------------------------------------------
+
     def __str__(self):
         return f"{self.job_role} at {self.company_name}"
 
+    def compile_eligibility(self):
+        """Parses eligibility_criteria into the structured rule fields."""
+        for field, value in compile_eligibility_criteria(self.eligibility_criteria).items():
+            setattr(self, field, value)
+
+    def save(self, *args, **kwargs):
+        self.compile_eligibility()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'eligibility_criteria' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'min_cgpa', 'allowed_branches', 'max_backlogs', 'all_branches'}
+        super().save(*args, **kwargs)
+
+
+class StudentJobMatch(models.Model):
+    """
+    Materialized (student, job) match matrix. Rows are recomputed by
+    placement.match_table when a student's cgpa/backlogs/branch or a job's
+    eligibility criteria change (see placement/signals.py).
+    """
+    student = models.ForeignKey(
+        StudentProfile, on_delete=models.CASCADE, related_name="job_matches"
+    )
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="student_matches")
+    # Job board semantics: a criterion the student has no value for counts as failed
+    match_percentage = models.FloatField(default=0.0)
+    is_hard_eligible = models.BooleanField(default=False)
+    # Admin shortlisting semantics: such criteria are left out of the score
+    shortlist_percentage = models.FloatField(default=0.0)
+    recommendation = models.CharField(max_length=20, default="No Criteria")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("student", "job")
+        indexes = [
+            models.Index(fields=["student", "is_hard_eligible", "-match_percentage"]),
+            models.Index(fields=["job", "-shortlist_percentage"]),
+        ]
+
+    def __str__(self):
+        return f"{self.student_id} x {self.job_id}: {self.match_percentage}%"
+
+
+class JobNotification(models.Model):
+    """In-app "new job you are eligible for" notice, written by placement.fanout."""
+    student = models.ForeignKey(
+        StudentProfile, on_delete=models.CASCADE, related_name="job_notifications"
+    )
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="notifications")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("student", "job")
+        indexes = [models.Index(fields=["student", "-created_at"])]
+
+    def __str__(self):
+        return f"{self.student_id} notified of {self.job_id}"
+
 
 class Application(models.Model):
     APPLICATION_STATUS_CHOICES = (
@@ -43,102 +112,133 @@ class Application(models.Model):
         max_length=20, choices=APPLICATION_STATUS_CHOICES, default="applied"
     )
     admin_comments = models.TextField(blank=True, null=True)
+    # Copy of StudentJobMatch.shortlist_percentage so admin lists can be
+    # ordered and keyset-paginated on an index (kept in sync by match_table)
+    match_score = models.FloatField(default=0.0)
 
     class Meta:
         unique_together = (
             "student",
             "job",
         )  # A student can apply for a job only once
+        indexes = [
+            models.Index(fields=["job", "-match_score", "-applied_at", "-id"]),
+            models.Index(fields=["-match_score", "-applied_at", "-id"]),
+        ]
 
     def __str__(self):
         return f"{self.student.user.username} applied for {self.job.job_role} at {self.job.company_name} - Status: {self.status}"
 
     def save(self, *args, **kwargs):
+        if self._state.adding:
+            match = StudentJobMatch.objects.filter(student_id=self.student_id, job_id=self.job_id).first()
+            if match is not None:
+                self.match_score = match.shortlist_percentage
         # Check if status or admin_comments changed
+        notify = False
         if self.pk:  # only if this is an update, not a new record
-            old = Application.objects.get(pk=self.pk)
-            if old.status != self.status or old.admin_comments != self.admin_comments:
-                self.send_status_email()
-        super().save(*args, **kwargs)
+            old = Application.objects.filter(pk=self.pk).values('status', 'admin_comments').first()
+            notify = old is not None and (old['status'] != self.status or old['admin_comments'] != self.admin_comments)
+        # The notification is an outbox row committed with the change; it is
+        # sent later by placement.outbox, never inside the admin's request
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if notify:
+                self.queue_status_email()
+
+    def queue_status_email(self):
+        """Queues the status email (if this status has one) in the outbox."""
+        from .outbox import queue_emails
+
+        email = self.status_outbox_email()
+        if email is None:
+            return None
+        return queue_emails([email])[0]
+
+    def status_outbox_email(self):
+        """Unsaved OutboxEmail for the current status, or None if there is nothing to send."""
+        from .emails import render_status_email
+
+        update = self.status_update()
+        if update is None or not self.student.user.email:
+            return None
+        subject, text_body, html_body = render_status_email(
+            update, self.student.user.first_name, self.student.user.last_name,
+        )
+        return OutboxEmail(
+            to_email=self.student.user.email, subject=subject, body=text_body, html_body=html_body,
+            student=self.student, application=self, payload=update,
+        )
+
+    def status_update(self):
+        """The current status as a placement.emails update dict, or None if it has no email."""
+        from .emails import status_update
+
+        return status_update(
+            self.job.job_role, self.job.company_name, self.status, self.get_status_display(), self.admin_comments,
+        )
+
+    def status_email_content(self):
+        """(subject, plain text, HTML) of the student's email for the current status, or None."""
+        from .emails import render_status_email
+
+        update = self.status_update()
+        if update is None:
+            return None # Don't send email for 'applied' status
+        return render_status_email(update, self.student.user.first_name, self.student.user.last_name)
+
+
+class OutboxEmail(models.Model):
+    """
+    An email waiting to be sent. Rows are written in the same transaction as
+    the change they report and delivered by placement.outbox.dispatch_outbox.
+    """
+    STATUS_CHOICES = (
+        ("queued", "Queued"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+        # Sent as part of a digest email instead (see placement.outbox.coalesce_digests)
+        ("merged", "Merged into Digest"),
+    )
+    KIND_CHOICES = (
+        ("application_status", "Application Status"),
+        ("status_digest", "Status Digest"),
+    )
 
-    def send_status_email(self):
-        """Send email notification to student when status changes or comments added with HTML formatting."""
-        
-        job_role = self.job.job_role
-        company_name = self.job.company_name
-        
-        # --- 1. Define Content based on Status ---
-        if self.status == "shortlisted":
-            emoji = "🎉"
-            color = "#28a745" # Green
-            greeting = f"Good News! {emoji} You've been Shortlisted!"
-            body = f"Your application for the **{job_role}** role at **{company_name}** has been **SHORTLISTED**."
-            subject = f"🎉 Shortlisted: {job_role} at {company_name}"
-
-        elif self.status == "rejected":
-            emoji = "😔"
-            color = "#dc3545" # Red
-            greeting = f"Important Update {emoji} on Your Application"
-            body = f"Unfortunately, your application for the **{job_role}** role at **{company_name}** has been **REJECTED**."
-            subject = f"😔 Rejected: {job_role} at {company_name}"
-
-        elif self.status == "interview_scheduled":
-            emoji = "🗓️"
-            color = "#007bff" # Blue
-            greeting = f"Interview Scheduled! {emoji} Get Ready!"
-            body = f"**Heads up!** Your interview for the **{job_role}** role at **{company_name}** has been **SCHEDULED**. Please prepare well!"
-            subject = f"🗓️ Interview Scheduled: {job_role} at {company_name}"
-
-        elif self.status == "selected": # CONDITION IS NOW "selected"
-            emoji = "🥳"
-            color = "#ffc107" # Orange
-            greeting = f"CONGRATULATIONS! YOU'VE BEEN SELECTED! {emoji}" # TEXT is changed
-            body = f"We are thrilled to inform you that you have been **SELECTED** for the **{job_role}** role at **{company_name}**! This is fantastic news. View your offer details on the portal." # TEXT is changed
-            subject = f"🥳 Selected: {job_role} at {company_name}" # SUBJECT is changed
-        else:
-            return # Don't send email for 'applied' status
-
-        # --- 2. Construct HTML Message ---
-        comments_html = ""
-        if self.admin_comments:
-            comments_html = f"""
-            <div style="background-color: #f8f9fa; border-left: 4px solid {color}; padding: 15px; border-radius: 6px; margin-top: 20px;">
-                <p style="margin: 0; font-weight: 600; font-size: 16px; color: #333;">Admin Comments / Reason:</p>
-                <p style="margin: 5px 0 0; font-size: 15px; color: #555;">{self.admin_comments}</p>
-            </div>
-            """
-            
-        html_message = f"""
-        <div style="font-family: 'Inter', Arial, sans-serif; font-size: 18px; color: #343a40; line-height: 1.6; max-width: 600px; margin: auto; padding: 25px; border: 1px solid #eee; border-radius: 12px; box-shadow: 0 4px 12px rgba(0,0,0,0.05);">
-            <h2 style="color: {color}; margin-bottom: 25px; font-size: 28px; font-weight: 700;">{greeting}</h2>
-
-            <p style="font-size: 18px; margin-bottom: 20px;">
-                Dear {self.student.user.first_name} {self.student.user.last_name},
-            </p>
-
-            <p style="font-size: 20px; margin-bottom: 20px;">
-                {body}
-            </p>
-
-            {comments_html}
-
-            <p style="font-size: 16px; color: #777; margin-top: 30px; padding-top: 15px; border-top: 1px solid #f0f0f0;">
-                Please log into the CampusRecruit portal for complete details regarding your application status, interview schedules, or final offers.
-            </p>
-            <p style="font-size: 16px; color: #777; margin: 5px 0 0;">
-                Best regards,<br>
-                The CampusRecruit Team
-            </p>
-        </div>
-        """
-        
-        # --- 3. Send Email ---
-        send_mail(
-            subject,
-            # Fallback plain text version (required for send_mail if html_message is provided)
-            f"Update on your Application for {job_role} at {company_name}. Status: {self.status}. \n\n{body}\n\nReason/Comments: {self.admin_comments or 'N/A'}",
-            "no-reply@smartrecruitment.com",  # From email
-            [self.student.user.email],       # To student's registered email
-            fail_silently=False,
-            html_message=html_message, # Pass the HTML version
-        )
\ No newline at end of file
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES, default="application_status")
+    student = models.ForeignKey(
+        StudentProfile, on_delete=models.CASCADE, null=True, blank=True, related_name="outbox_emails"
+    )
+    application = models.ForeignKey(
+        Application, on_delete=models.SET_NULL, null=True, blank=True, related_name="outbox_emails"
+    )
+    to_email = models.EmailField()
+    from_email = models.CharField(max_length=254)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True, default="")
+    # What the email reports (for application_status: placement.emails.status_update)
+    payload = models.JSONField(default=dict, blank=True)
+    # The digest this email was merged into
+    digest = models.ForeignKey(
+        "self", on_delete=models.SET_NULL, null=True, blank=True, related_name="merged_emails"
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="queued")
+    attempts = models.PositiveIntegerField(default=0)
+    # Not sent before this time (used for retry backoff)
+    send_after = models.DateTimeField(default=timezone.now)
+    # A row stuck in "sending" past its lock (crashed dispatcher) is sent again
+    locked_until = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True, default="")
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "send_after"], name="outbox_claim_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to_email} ({self.status})"
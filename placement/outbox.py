@@ -0,0 +1,275 @@
+# placement/outbox.py
+
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, Q
+from django.utils import timezone
+
+from .emails import render_digest_email
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FROM_ADDRESS = "no-reply@smartrecruitment.com"
+
+# Defaults for the EMAIL_OUTBOX_* settings
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 5
+# Messages per second over the shared connection; 0 disables the limit
+DEFAULT_RATE_LIMIT = 5.0
+# Seconds a claimed batch stays invisible to other dispatchers
+DEFAULT_LOCK_TIMEOUT = 300
+DEFAULT_RETRY_BASE_DELAY = 60
+DEFAULT_RETRY_MAX_DELAY = 3600
+# Seconds a student's status emails are held so later changes join one
+# digest email; 0 sends every change on its own
+DEFAULT_DIGEST_WINDOW = 0
+# Students per query when opening or coalescing digest windows
+DIGEST_CHUNK_SIZE = 500
+
+
+def _setting(name, default):
+    return getattr(settings, f'EMAIL_OUTBOX_{name}', default)
+
+
+# --- WRITING TO THE OUTBOX ---
+def queue_emails(emails):
+    """
+    Inserts unsaved OutboxEmail rows in one statement. Inside a transaction
+    they only become visible (and the dispatcher is only woken) on commit,
+    and a rollback discards them with the change they describe.
+    """
+    for email in emails:
+        email.from_email = email.from_email or DEFAULT_FROM_ADDRESS
+    _hold_for_digests(emails)
+    created = OutboxEmail.objects.bulk_create(emails)
+    if created:
+        due_at = min(email.send_after for email in created)
+        transaction.on_commit(lambda: schedule_dispatch(run_at=due_at if due_at > timezone.now() else None))
+    return created
+
+
+def _hold_for_digests(emails):
+    """
+    In digest mode, delays status emails until the student's digest window
+    closes: the window opened by their earliest still-queued status email,
+    or a new one starting now.
+    """
+    window = _setting('DIGEST_WINDOW', DEFAULT_DIGEST_WINDOW)
+    held = [email for email in emails if email.kind == "application_status" and email.student_id]
+    if not window or not held:
+        return
+    now = timezone.now()
+    student_ids = list({email.student_id for email in held})
+    closes_at = {}
+    for start in range(0, len(student_ids), DIGEST_CHUNK_SIZE):
+        closes_at.update(
+            OutboxEmail.objects.filter(
+                kind="application_status", status="queued", send_after__gt=now,
+                student_id__in=student_ids[start:start + DIGEST_CHUNK_SIZE],
+            ).values('student_id').annotate(closes_at=Max('send_after')).values_list('student_id', 'closes_at')
+        )
+    new_window = now + timedelta(seconds=window)
+    for email in held:
+        email.send_after = closes_at.setdefault(email.student_id, new_window)
+
+
+def queue_email(to_email, subject, body, html_body='', **fields):
+    return queue_emails([
+        OutboxEmail(to_email=to_email, subject=subject, body=body, html_body=html_body, **fields)
+    ])[0]
+
+
+def schedule_dispatch(run_at=None):
+    """Enqueues a dispatcher run on the task queue."""
+    from .tasks import dispatch_email_outbox
+
+    dispatch_email_outbox.enqueue(run_at=run_at)
+
+
+# --- DISPATCHER ---
+class RateLimiter:
+    """Spaces calls to wait() at least 1 / rate seconds apart."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if now < self._next:
+            time.sleep(self._next - now)
+            now = self._next
+        self._next = now + self.interval
+
+
+def retry_delay(attempt):
+    """Exponential backoff with jitter: base * 2^(attempt-1), capped."""
+    base = _setting('RETRY_BASE_DELAY', DEFAULT_RETRY_BASE_DELAY)
+    cap = _setting('RETRY_MAX_DELAY', DEFAULT_RETRY_MAX_DELAY)
+    return min(base * 2 ** (attempt - 1), cap) * random.uniform(1.0, 1.25)
+
+
+class _DigestContended(Exception):
+    pass
+
+
+def coalesce_digests():
+    """
+    Replaces each student's due status emails, when there are several, with
+    one digest email listing every update in order. The originals are
+    marked "merged" and point at the digest. Returns the digests created.
+    """
+    now = timezone.now()
+    due = OutboxEmail.objects.filter(
+        kind="application_status", status="queued", send_after__lte=now, student__isnull=False,
+    ).exclude(payload={})
+    student_ids = list(
+        due.values('student_id').annotate(pending=Count('pk')).filter(pending__gt=1).values_list('student_id', flat=True)
+    )
+    created = 0
+    for start in range(0, len(student_ids), DIGEST_CHUNK_SIZE):
+        rows = (
+            due.filter(student_id__in=student_ids[start:start + DIGEST_CHUNK_SIZE])
+            .select_related('student__user').order_by('student_id', 'created_at', 'pk')
+        )
+        for _, group in groupby(rows, key=attrgetter('student_id')):
+            group = list(group)
+            user = group[0].student.user
+            subject, text_body, html_body = render_digest_email(
+                [email.payload for email in group], user.first_name, user.last_name,
+            )
+            try:
+                with transaction.atomic():
+                    digest = OutboxEmail.objects.create(
+                        kind="status_digest", student_id=group[0].student_id,
+                        to_email=group[-1].to_email, from_email=group[-1].from_email,
+                        subject=subject, body=text_body, html_body=html_body,
+                        payload={"updates": len(group)}, send_after=now,
+                    )
+                    merged = OutboxEmail.objects.filter(pk__in=[email.pk for email in group], status="queued").update(
+                        status="merged", digest=digest,
+                    )
+                    # Another dispatcher claimed some of these rows first
+                    if merged != len(group):
+                        raise _DigestContended
+            except _DigestContended:
+                continue
+            created += 1
+    return created
+
+
+def _claimable(now):
+    # Queued and due, or "sending" but abandoned (its lock expired)
+    return Q(status="queued", send_after__lte=now) | Q(status="sending", locked_until__lt=now)
+
+
+def claim_batch(dispatcher_id, batch_size, lock_timeout=None):
+    """
+    Marks up to `batch_size` due emails as sending for this dispatcher with
+    one conditional UPDATE and returns them; rows another dispatcher claimed
+    first are simply not returned.
+    """
+    now = timezone.now()
+    lock_timeout = _setting('LOCK_TIMEOUT', DEFAULT_LOCK_TIMEOUT) if lock_timeout is None else lock_timeout
+    candidates = list(
+        OutboxEmail.objects.filter(_claimable(now)).order_by('send_after', 'pk').values_list('pk', flat=True)[:batch_size]
+    )
+    if not candidates:
+        return []
+    OutboxEmail.objects.filter(_claimable(now), pk__in=candidates).update(
+        status="sending",
+        locked_by=dispatcher_id,
+        locked_until=now + timedelta(seconds=lock_timeout),
+        attempts=F('attempts') + 1,
+    )
+    return list(OutboxEmail.objects.filter(pk__in=candidates, locked_by=dispatcher_id, status="sending").order_by('pk'))
+
+
+def build_message(email, connection):
+    message = EmailMultiAlternatives(
+        email.subject, email.body, email.from_email, [email.to_email], connection=connection,
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, "text/html")
+    return message
+
+
+def _record_failure(email, dispatcher_id, error, max_attempts):
+    fields = {'locked_until': None, 'last_error': f"{type(error).__name__}: {error}"}
+    if email.attempts >= max_attempts:
+        fields.update(status="failed")
+    else:
+        fields.update(status="queued", send_after=timezone.now() + timedelta(seconds=retry_delay(email.attempts)))
+    OutboxEmail.objects.filter(pk=email.pk, locked_by=dispatcher_id, status="sending").update(**fields)
+    logger.warning("Email %s to %s failed (attempt %s): %s", email.pk, email.to_email, email.attempts, error)
+
+
+def dispatch_outbox(batch_size=None, max_batches=None, rate_limit=None, max_attempts=None, connection=None):
+    """
+    Sends due outbox emails over one reused mail connection, a claimed batch
+    at a time, until the outbox has nothing due (or `max_batches` batches).
+    Each message is sent separately so one bad address only retries that
+    row; a dropped connection is reopened for the next message. Failed rows
+    are retried with backoff and marked failed after `max_attempts`.
+
+    Returns (sent, failed) counts, failed including rows scheduled for retry.
+    """
+    batch_size = batch_size or _setting('BATCH_SIZE', DEFAULT_BATCH_SIZE)
+    max_attempts = max_attempts or _setting('MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)
+    limiter = RateLimiter(_setting('RATE_LIMIT', DEFAULT_RATE_LIMIT) if rate_limit is None else rate_limit)
+    dispatcher_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    connection = connection or get_connection(fail_silently=False)
+
+    if _setting('DIGEST_WINDOW', DEFAULT_DIGEST_WINDOW):
+        coalesce_digests()
+
+    sent = failed = batches = 0
+    try:
+        while max_batches is None or batches < max_batches:
+            batch = claim_batch(dispatcher_id, batch_size)
+            if not batch:
+                break
+            batches += 1
+            delivered = []
+            for email in batch:
+                limiter.wait()
+                try:
+                    # No-op while the connection is open; reconnects after a failure.
+                    # Opening it here also keeps send_messages from closing it
+                    connection.open()
+                    connection.send_messages([build_message(email, connection)])
+                except Exception as error:
+                    _record_failure(email, dispatcher_id, error, max_attempts)
+                    failed += 1
+                    # Start the next message on a fresh connection
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+                else:
+                    delivered.append(email.pk)
+            sent += OutboxEmail.objects.filter(pk__in=delivered, locked_by=dispatcher_id, status="sending").update(
+                status="sent", sent_at=timezone.now(), locked_until=None, last_error="",
+            )
+    finally:
+        connection.close()
+    return sent, failed
+
+
+def next_retry_at():
+    """When the earliest queued email becomes due, or None."""
+    return OutboxEmail.objects.filter(status="queued").aggregate(next_at=Min('send_after'))['next_at']
@@ -0,0 +1,52 @@
+# placement/pagination.py
+
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+# Admin application lists are ordered best candidates first
+APPLICATION_KEYSET_ORDERING = ('-match_score', '-applied_at', '-id')
+
+
+def encode_cursor(application):
+    payload = [application.match_score, application.applied_at.isoformat(), application.id]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Returns (match_score, applied_at, id), or None for a missing or malformed cursor."""
+    if not cursor:
+        return None
+    try:
+        match_score, applied_at, app_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        applied_at = parse_datetime(applied_at)
+        if applied_at is None:
+            return None
+        return float(match_score), applied_at, int(app_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def keyset_page(applications, cursor=None, page_size=50):
+    """
+    Returns (rows, next_cursor) for the page of `applications` that follows
+    `cursor` in (match_score, applied_at, id) descending order.
+
+    Each page is a single indexed range scan with LIMIT, so its cost does not
+    grow with how deep the admin has paged.
+    """
+    applications = applications.order_by(*APPLICATION_KEYSET_ORDERING)
+    position = decode_cursor(cursor)
+    if position is not None:
+        match_score, applied_at, app_id = position
+        applications = applications.filter(
+            Q(match_score__lt=match_score)
+            | Q(match_score=match_score, applied_at__lt=applied_at)
+            | Q(match_score=match_score, applied_at=applied_at, id__lt=app_id)
+        )
+
+    rows = list(applications[:page_size + 1])
+    next_cursor = encode_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+    return rows[:page_size], next_cursor
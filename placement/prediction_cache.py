@@ -0,0 +1,106 @@
+# placement/prediction_cache.py
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+DEFAULT_CACHE_SIZE = 10000
+DEFAULT_CACHE_TTL = 60 * 60
+
+
+def prediction_key(kind, model_version, features):
+    """
+    Cache key for one prediction: a hash of the model version and the exact
+    feature values. A changed profile or a newly deployed model produces a
+    new key, so stale entries are never read and simply age out.
+    """
+    digest = hashlib.sha256(repr((kind, model_version, tuple(features))).encode()).hexdigest()
+    return f'placement-prediction:{digest}'
+
+
+class LRUTTLCache:
+    """Thread-safe in-process LRU cache whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+        return found
+
+    def set_many(self, values):
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+local_cache = LRUTTLCache(
+    maxsize=getattr(settings, 'PLACEMENT_PREDICTION_CACHE_SIZE', DEFAULT_CACHE_SIZE),
+    ttl=getattr(settings, 'PLACEMENT_PREDICTION_CACHE_TTL', DEFAULT_CACHE_TTL),
+)
+
+
+def _shared_cache():
+    """The Django cache named by PLACEMENT_PREDICTION_CACHE_ALIAS, if one is configured."""
+    alias = getattr(settings, 'PLACEMENT_PREDICTION_CACHE_ALIAS', None)
+    return caches[alias] if alias else None
+
+
+def cached_predictions(kind, model_version, feature_rows, predict):
+    """
+    Returns one prediction per feature row, calling `predict(rows)` (a batch
+    function) only for the rows missing from the in-process cache and the
+    optional shared cache.
+    """
+    keys = [prediction_key(kind, model_version, row) for row in feature_rows]
+    found = local_cache.get_many(keys)
+
+    shared = _shared_cache()
+    missing = [key for key in dict.fromkeys(keys) if key not in found]
+    if shared is not None and missing:
+        from_shared = shared.get_many(missing)
+        local_cache.set_many(from_shared)
+        found.update(from_shared)
+
+    missing_rows = {}
+    for key, row in zip(keys, feature_rows):
+        if key not in found:
+            missing_rows.setdefault(key, row)
+    if missing_rows:
+        computed = dict(zip(missing_rows, predict(list(missing_rows.values()))))
+        local_cache.set_many(computed)
+        if shared is not None:
+            shared.set_many(computed, timeout=local_cache.ttl)
+        found.update(computed)
+
+    return [found[key] for key in keys]
@@ -0,0 +1,87 @@
+# placement/search.py
+
+import re
+
+from django.db import connection
+from django.db.models import Q, Value
+from django.db.models.expressions import RawSQL
+
+from .models import Job
+
+JOB_FTS_TABLE = 'placement_job_fts'
+JOB_SEARCH_FIELDS = Job.SEARCH_FIELDS
+
+_TERM_RE = re.compile(r'\w+')
+
+
+def fts_enabled():
+    """FTS5 search is only available on SQLite, where the migration creates the index."""
+    return connection.vendor == 'sqlite'
+
+
+def build_match_query(search_query):
+    """
+    Turns free text into an FTS5 MATCH expression: every word must appear
+    (as a word prefix) in any of the indexed columns. Quoting each term keeps
+    user input from being parsed as FTS5 syntax.
+    """
+    return ' '.join(f'"{term}"*' for term in _TERM_RE.findall(search_query.lower()))
+
+
+def index_job(job):
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {JOB_FTS_TABLE} WHERE rowid = %s', [job.pk])
+        cursor.execute(
+            f'INSERT INTO {JOB_FTS_TABLE} (rowid, {", ".join(JOB_SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s, %s)',
+            [job.pk] + [getattr(job, field) or '' for field in JOB_SEARCH_FIELDS],
+        )
+
+
+def unindex_job(job_id):
+    if not fts_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {JOB_FTS_TABLE} WHERE rowid = %s', [job_id])
+
+
+def rebuild_job_index():
+    """Re-populates the FTS table from placement_job in one statement."""
+    if not fts_enabled():
+        return 0
+    fields = ', '.join(JOB_SEARCH_FIELDS)
+    values = ', '.join(f"COALESCE({field}, '')" for field in JOB_SEARCH_FIELDS)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {JOB_FTS_TABLE}')
+        cursor.execute(f'INSERT INTO {JOB_FTS_TABLE} (rowid, {fields}) SELECT id, {values} FROM placement_job')
+        return cursor.rowcount
+
+
+def search_jobs(jobs, search_query):
+    """
+    Restricts a Job queryset to rows matching `search_query` and annotates
+    them with `search_rank` (BM25, lower is more relevant).
+
+    The candidate set comes straight from the FTS5 index. Without FTS5 this
+    falls back to icontains over the same fields with a constant rank.
+    """
+    match_query = build_match_query(search_query)
+    if not match_query:
+        return jobs.annotate(search_rank=Value(0.0))
+
+    if not fts_enabled():
+        text_filter = Q()
+        for field in JOB_SEARCH_FIELDS:
+            text_filter |= Q(**{f'{field}__icontains': search_query})
+        return jobs.filter(text_filter).annotate(search_rank=Value(0.0))
+
+    return jobs.filter(
+        id__in=RawSQL(f'SELECT rowid FROM {JOB_FTS_TABLE} WHERE {JOB_FTS_TABLE} MATCH %s', [match_query])
+    ).annotate(
+        search_rank=RawSQL(
+            f'SELECT bm25({JOB_FTS_TABLE}) FROM {JOB_FTS_TABLE} '
+            f'WHERE {JOB_FTS_TABLE} MATCH %s AND rowid = placement_job.id',
+            [match_query],
+        )
+    )
@@ -0,0 +1,48 @@
+# placement/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import StudentProfile
+from .models import Job
+from .match_table import refresh_student_matches
+from .search import index_job, unindex_job
+from .tasks import fan_out_job, refresh_job_match_column
+
+
+@receiver(post_save, sender=StudentProfile)
+def refresh_matches_for_student(sender, instance, created, raw=False, **kwargs):
+    """Recomputes the student's row of the match table when its inputs change."""
+    if raw:
+        return
+    if created or instance.changed_fields() & set(StudentProfile.MATCH_INPUT_FIELDS):
+        refresh_student_matches([instance.pk])
+
+
+@receiver(post_save, sender=Job)
+def refresh_matches_for_job(sender, instance, created, raw=False, **kwargs):
+    """
+    Queues a recompute of the job's column of the match table when its
+    criteria change; scoring every student is too slow for the request.
+    A new job's task also notifies the students it finds eligible.
+    """
+    if raw:
+        return
+    if created:
+        fan_out_job.delay(instance.pk)
+    elif 'eligibility_criteria' in instance.changed_fields():
+        refresh_job_match_column.delay(instance.pk)
+
+
+@receiver(post_save, sender=Job)
+def index_job_for_search(sender, instance, created, raw=False, **kwargs):
+    """Keeps the job's row in the FTS5 search index in sync with its text fields."""
+    if raw:
+        return
+    if created or instance.changed_fields() & set(Job.SEARCH_FIELDS):
+        index_job(instance)
+
+
+@receiver(post_delete, sender=Job)
+def unindex_deleted_job(sender, instance, **kwargs):
+    unindex_job(instance.pk)
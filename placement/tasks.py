@@ -0,0 +1,31 @@
+# placement/tasks.py
+
+from taskqueue.registry import task
+
+from .fanout import fan_out_jobs
+from .match_table import refresh_job_matches
+
+
+@task(name='placement.refresh_job_matches')
+def refresh_job_match_column(job_id):
+    """Recomputes the job's column of the match table after its criteria changed."""
+    refresh_job_matches([job_id])
+
+
+@task(name='placement.fan_out_job')
+def fan_out_job(job_id):
+    """Scores a newly posted job against every student, then notifies the eligible ones."""
+    refresh_job_matches([job_id])
+    fan_out_jobs([job_id])
+
+
+@task(name='placement.dispatch_email_outbox', priority=5)
+def dispatch_email_outbox():
+    """Sends the queued outbox emails; schedules one more run if some are waiting to be retried."""
+    from .outbox import dispatch_outbox, next_retry_at, schedule_dispatch
+
+    _, failed = dispatch_outbox()
+    if failed:
+        retry_at = next_retry_at()
+        if retry_at is not None:
+            schedule_dispatch(run_at=retry_at)
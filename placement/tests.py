@@ -1,3 +1,1018 @@
-from django.test import TestCase
+import glob
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from smtplib import SMTPRecipientsRefused
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.core import mail
+from django.core.management import CommandError, call_command
+from django.core.mail import get_connection
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+import joblib
+import numpy as np
+
+from core.models import StudentProfile, User
+from taskqueue.models import Task
+from taskqueue.worker import claim_task, run_task
+from . import ml_service
+from .batch_scoring import (
+    branch_token_column,
+    evaluate_columns,
+    float_column,
+    match_percentage_columns,
+    recommendation_columns,
+)
+from .bulk_actions import bulk_set_application_status
+from .eligibility import evaluate_eligibility
+from .fanout import fan_out_jobs
+from .match_table import annotate_student_job_match, compute_match_rows
+from .models import Application, Job, JobNotification, OutboxEmail, StudentJobMatch
+from .outbox import RateLimiter, claim_batch, dispatch_outbox
+from .pagination import decode_cursor, encode_cursor, keyset_page
+from .prediction_cache import LRUTTLCache, cached_predictions, local_cache
+from .search import JOB_FTS_TABLE, rebuild_job_index, search_jobs
+
+
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    EMAIL_OUTBOX_RATE_LIMIT=0,
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
+class ApplicationTestCase(TestCase):
+    def setUp(self):
+        self.job = Job.objects.create(
+            company_name="Acme", job_role="Backend Engineer", description="APIs",
+            eligibility_criteria="Min CGPA 6.0", application_deadline=date.today() + timedelta(days=10),
+        )
+        self.applications = []
+        for i in range(3):
+            user = User.objects.create_user(f"student{i}", f"student{i}@example.com", "pw", first_name=f"S{i}")
+            student = StudentProfile.objects.create(user=user, roll_number=f"R{i}", branch="CSE", cgpa=8.0)
+            self.applications.append(Application.objects.create(student=student, job=self.job))
+
+    def set_status(self, application, status):
+        application.status = status
+        application.save()
+
+
+class EmailOutboxTests(ApplicationTestCase):
+    def test_status_change_writes_outbox_row_without_sending(self):
+        self.set_status(self.applications[0], "shortlisted")
+
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.to_email, "student0@example.com")
+        self.assertEqual(email.status, "queued")
+        self.assertIn("Shortlisted", email.subject)
+        self.assertIn("Backend Engineer", email.html_body)
+        self.assertEqual(email.application, self.applications[0])
+        self.assertEqual(mail.outbox, [])
+
+    def test_unchanged_or_applied_status_queues_nothing(self):
+        self.applications[0].save()
+        self.set_status(self.applications[1], "applied")
+        self.assertFalse(OutboxEmail.objects.exists())
+
+    def test_rolled_back_status_change_leaves_no_email(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.set_status(self.applications[0], "rejected")
+                raise RuntimeError("admin request failed")
+
+        self.assertFalse(OutboxEmail.objects.exists())
+        self.assertEqual(Application.objects.get(pk=self.applications[0].pk).status, "applied")
+
+    def test_dispatch_sends_batches_over_one_connection(self):
+        for application in self.applications:
+            self.set_status(application, "selected")
+        connection = get_connection()
+
+        with mock.patch.object(connection, 'close', wraps=connection.close) as closed:
+            sent, failed = dispatch_outbox(batch_size=2, connection=connection)
+
+        self.assertEqual((sent, failed), (3, 0))
+        self.assertEqual(len(mail.outbox), 3)
+        # Two batches, one connection closed once at the end
+        self.assertEqual(closed.call_count, 1)
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+        self.assertEqual(set(OutboxEmail.objects.values_list('status', flat=True)), {"sent"})
+        # Nothing left to send
+        self.assertEqual(dispatch_outbox(connection=connection), (0, 0))
+
+    def test_failed_message_is_retried_with_backoff_then_marked_failed(self):
+        self.set_status(self.applications[0], "rejected")
+        self.set_status(self.applications[1], "rejected")
+        bad_address = "student0@example.com"
+        connection = get_connection()
+        send = connection.send_messages
+
+        def send_messages(messages):
+            if messages[0].to == [bad_address]:
+                raise SMTPRecipientsRefused({bad_address: (550, b"No such user")})
+            return send(messages)
+
+        with mock.patch.object(connection, 'send_messages', side_effect=send_messages):
+            self.assertEqual(dispatch_outbox(max_attempts=2, connection=connection), (1, 1))
+            retry = OutboxEmail.objects.get(to_email=bad_address)
+            self.assertEqual((retry.status, retry.attempts), ("queued", 1))
+            self.assertGreater(retry.send_after, timezone.now())
+            self.assertIn("SMTPRecipientsRefused", retry.last_error)
+
+            # Not due yet, so nothing is claimed
+            self.assertEqual(dispatch_outbox(max_attempts=2, connection=connection), (0, 0))
+
+            OutboxEmail.objects.filter(pk=retry.pk).update(send_after=timezone.now())
+            self.assertEqual(dispatch_outbox(max_attempts=2, connection=connection), (0, 1))
+
+        retry.refresh_from_db()
+        self.assertEqual((retry.status, retry.attempts), ("failed", 2))
+        self.assertEqual([message.to for message in mail.outbox], [["student1@example.com"]])
+
+    def test_claimed_rows_are_invisible_until_their_lock_expires(self):
+        self.set_status(self.applications[0], "shortlisted")
+
+        self.assertEqual(len(claim_batch("dispatcher-a", 10)), 1)
+        self.assertEqual(claim_batch("dispatcher-b", 10), [])
+
+        OutboxEmail.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(len(claim_batch("dispatcher-b", 10)), 1)
+
+    def test_rate_limiter_spaces_messages(self):
+        clock = [100.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(round(seconds, 3))
+            clock[0] += seconds
+
+        with mock.patch('placement.outbox.time.monotonic', side_effect=lambda: clock[0]), \
+                mock.patch('placement.outbox.time.sleep', side_effect=sleep):
+            limiter = RateLimiter(4)
+            for _ in range(3):
+                limiter.wait()
+
+        self.assertEqual(sleeps, [0.25, 0.25])
+
+
+class BulkStatusUpdateTests(ApplicationTestCase):
+    def test_updates_rows_in_one_statement_and_notifies_changed_rows_only(self):
+        self.set_status(self.applications[0], "shortlisted")
+        OutboxEmail.objects.all().delete()
+
+        # Select ids, one UPDATE, one SELECT for the email content, one INSERT (plus the savepoint pair)
+        with self.assertNumQueries(6):
+            updated, notified = bulk_set_application_status(
+                Application.objects.filter(job=self.job), "shortlisted",
+            )
+
+        self.assertEqual((updated, notified), (2, 2))
+        self.assertEqual(
+            sorted(OutboxEmail.objects.values_list('to_email', flat=True)),
+            ["student1@example.com", "student2@example.com"],
+        )
+        self.assertEqual(set(Application.objects.values_list('status', flat=True)), {"shortlisted"})
+
+    def test_comment_change_counts_as_a_change_and_blank_keeps_comments(self):
+        bulk_set_application_status(Application.objects.filter(pk=self.applications[0].pk), "rejected", "Low CGPA")
+        OutboxEmail.objects.all().delete()
+
+        self.assertEqual(bulk_set_application_status(Application.objects.all(), "rejected", None), (2, 2))
+        self.assertEqual(Application.objects.get(pk=self.applications[0].pk).admin_comments, "Low CGPA")
+        self.assertEqual(bulk_set_application_status(Application.objects.all(), "rejected", "Closed"), (3, 3))
+
+    def test_match_score_rule(self):
+        Application.objects.filter(pk=self.applications[0].pk).update(match_score=95.0)
+        Application.objects.filter(pk=self.applications[1].pk).update(match_score=90.0)
+        Application.objects.filter(pk=self.applications[2].pk).update(match_score=89.9)
+
+        updated, _ = bulk_set_application_status(
+            Application.objects.filter(job=self.job, match_score__gte=90), "interview_scheduled",
+        )
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(Application.objects.get(pk=self.applications[2].pk).status, "applied")
+
+
+class ApplicationStatusViewTests(ApplicationTestCase):
+    def test_invalid_status_is_logged_and_reported(self):
+        User.objects.create_user("admin", "admin@example.com", "pw", user_type="admin")
+        self.client.login(username="admin", password="pw")
+        url = reverse('update_application_status', args=[self.applications[0].pk])
+
+        with self.assertLogs('placement.views', 'WARNING') as logs:
+            response = self.client.post(url, {'status': "hired"}, follow=True)
+
+        self.assertIn(f"application {self.applications[0].pk}", logs.output[0])
+        self.assertContains(response, "Error updating application status")
+        self.assertEqual(Application.objects.get(pk=self.applications[0].pk).status, "applied")
+
+@override_settings(EMAIL_OUTBOX_DIGEST_WINDOW=600)
+class StatusDigestTests(ApplicationTestCase):
+    def setUp(self):
+        super().setUp()
+        other_job = Job.objects.create(
+            company_name="Globex", job_role="Data Analyst", description="Reports",
+            eligibility_criteria="Min CGPA 6.0", application_deadline=date.today() + timedelta(days=10),
+        )
+        self.other_application = Application.objects.create(student=self.applications[0].student, job=other_job)
+
+    def test_changes_within_the_window_are_sent_as_one_digest(self):
+        self.set_status(self.applications[0], "shortlisted")
+        self.set_status(self.other_application, "rejected")
+        self.set_status(self.applications[0], "interview_scheduled")
+        self.set_status(self.applications[1], "selected")
+
+        queued = OutboxEmail.objects.filter(student=self.applications[0].student)
+        self.assertEqual(len({email.send_after for email in queued}), 1)
+        self.assertGreater(queued[0].send_after, timezone.now())
+        # Nothing is due until the window closes
+        self.assertEqual(dispatch_outbox(), (0, 0))
+
+        OutboxEmail.objects.update(send_after=timezone.now())
+        self.assertEqual(dispatch_outbox(), (2, 0))
+
+        self.assertEqual(len(mail.outbox), 2)
+        digest = next(message for message in mail.outbox if message.to == ["student0@example.com"])
+        self.assertIn("3 updates", digest.subject)
+        for text in ("Shortlisted", "Interview Scheduled", "Data Analyst at Globex"):
+            self.assertIn(text, digest.alternatives[0][0])
+        self.assertEqual(queued.filter(status="merged").count(), 3)
+        self.assertEqual(OutboxEmail.objects.get(kind="status_digest").merged_emails.count(), 3)
+        single = next(message for message in mail.outbox if message.to == ["student1@example.com"])
+        self.assertIn("Selected: Backend Engineer", single.subject)
+
+    def test_templates_are_compiled_once(self):
+        from . import emails
+
+        emails._templates.clear()
+        with mock.patch('placement.emails.get_template', wraps=emails.get_template) as loaded:
+            self.set_status(self.applications[0], "shortlisted")
+            self.set_status(self.applications[1], "shortlisted")
+        self.assertEqual(loaded.call_count, 2)  # the .txt and .html templates
+
+
+class MatchTableTests(ApplicationTestCase):
+    def test_job_without_match_rows_is_kept_until_its_task_runs(self):
+        new_job = Job.objects.create(
+            company_name="Initech", job_role="QA Engineer", description="Tests",
+            eligibility_criteria="Min CGPA 7.5, CSE branch", application_deadline=date.today() + timedelta(days=5),
+        )
+        student = self.applications[0].student
+        # The job's column is refreshed by a queued task that hasn't run yet
+        self.assertFalse(StudentJobMatch.objects.filter(job=new_job).exists())
+
+        jobs = annotate_student_job_match(Job.objects.all(), student)
+        self.assertEqual(
+            sorted(jobs.values_list('pk', 'match_percentage', 'is_hard_eligible')),
+            [(self.job.pk, 100.0, True), (new_job.pk, 0.0, False)],
+        )
+
+        while (claimed := claim_task("w")) is not None:
+            run_task(claimed, "w")
+        job = annotate_student_job_match(Job.objects.filter(pk=new_job.pk), student).get()
+        self.assertEqual((job.match_percentage, job.is_hard_eligible), (100.0, True))
+
+    def test_job_board_lists_newly_posted_job_without_writing(self):
+        Job.objects.create(
+            company_name="Initech", job_role="QA Engineer", description="Tests",
+            eligibility_criteria="Min CGPA 9.0", application_deadline=date.today() + timedelta(days=5),
+        )
+        self.client.login(username="student0", password="pw")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('student_job_list'))
+
+        self.assertContains(response, "QA Engineer")
+        self.assertContains(response, "Backend Engineer")
+        match_writes = [q['sql'] for q in queries if 'studentjobmatch' in q['sql'].lower() and not q['sql'].startswith('SELECT')]
+        self.assertEqual(match_writes, [])
+
+
+@override_settings(TASKS_RUN_EAGERLY=True)
+class JobFanOutTests(ApplicationTestCase):
+    def test_new_job_notifies_hard_eligible_students_from_the_match_table(self):
+        user = User.objects.create_user("student9", "student9@example.com", "pw")
+        StudentProfile.objects.create(user=user, roll_number="R9", branch="IT", cgpa=9.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job = Job.objects.create(
+                company_name="Initech", job_role="QA Engineer", description="Tests",
+                eligibility_criteria="Min CGPA 7.5, CSE branch", application_deadline=date.today() + timedelta(days=5),
+            )
+
+        self.assertEqual(StudentJobMatch.objects.filter(job=job).count(), 4)
+        self.assertEqual(
+            sorted(JobNotification.objects.filter(job=job).values_list('student__roll_number', flat=True)),
+            ["R0", "R1", "R2"],
+        )
+        # Running it again doesn't notify anyone twice, and says so
+        JobNotification.objects.filter(job=job, student__roll_number="R2").delete()
+        self.assertEqual(fan_out_jobs([job.pk]), 1)
+        self.assertEqual(fan_out_jobs([job.pk]), 0)
+        self.assertEqual(JobNotification.objects.filter(job=job).count(), 3)
+
+    def test_criteria_change_refreshes_the_column_without_notifying(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.eligibility_criteria = "Min CGPA 8.5"
+            self.job.save()
+
+        self.assertFalse(StudentJobMatch.objects.filter(job=self.job, is_hard_eligible=True).exists())
+        self.assertFalse(JobNotification.objects.exists())
+
+
+class BatchScoringParityTests(SimpleTestCase):
+    """The vectorized scorer must agree with eligibility.evaluate_eligibility row for row."""
+
+    CRITERIA = [
+        "Min CGPA 7.0, CSE/IT branches, No backlogs",
+        "All branches, cgpa 6.5",
+        "ECE/EEE branches",
+        "CSE-DS, Mechanical",
+        "Maximum backlogs 1",
+        "Any branch, max backlogs 2, minimum cgpa 8",
+        "Open to everyone",
+    ]
+    STUDENTS = [
+        (cgpa, backlogs, branch)
+        for cgpa in (None, 6.5, 7.0, 8.0, 9.99)
+        for backlogs in (None, 0, 1, 3)
+        # "EE"/"E"/"T" overlap the codes above as substrings but are not allowed branches
+        for branch in ("CSE", " it ", "Ece", "EE", "E", "T", "mech", "CSE (AI&ML)", "Mechanical", "", None)
+    ]
+
+    def setUp(self):
+        self.jobs = []
+        for pk, criteria in enumerate(self.CRITERIA, 1):
+            job = Job(pk=pk, eligibility_criteria=criteria)
+            job.compile_eligibility()
+            self.jobs.append(job)
+
+    def columns(self):
+        pairs = [(student, job) for student in self.STUDENTS for job in self.jobs]
+        return pairs, (
+            float_column([student[0] for student, _ in pairs]),
+            float_column([student[1] for student, _ in pairs]),
+            branch_token_column([student[2] for student, _ in pairs]),
+            float_column([job.min_cgpa for _, job in pairs]),
+            float_column([job.max_backlogs for _, job in pairs]),
+            [job.all_branches for _, job in pairs],
+            [job.allowed_branches for _, job in pairs],
+        )
+
+    def test_evaluate_columns_matches_evaluate_eligibility(self):
+        pairs, columns = self.columns()
+        for skip_missing in (False, True):
+            match_score, max_score, eligible = evaluate_columns(*columns, skip_missing=skip_missing)
+            vectorized = list(zip(match_score.tolist(), max_score.tolist(), eligible.tolist()))
+            expected = [
+                evaluate_eligibility(job, cgpa, backlogs, branch, skip_missing=skip_missing)
+                for (cgpa, backlogs, branch), job in pairs
+            ]
+            self.assertEqual(vectorized, expected, f"skip_missing={skip_missing}")
+
+    def test_match_rows_match_per_row_scoring(self):
+        students = [(pk, *student) for pk, student in enumerate(self.STUDENTS, 1)]
+        jobs = [(job.pk, job.min_cgpa, job.max_backlogs, job.all_branches, job.allowed_branches) for job in self.jobs]
+        rows = zip(*(column.tolist() for column in compute_match_rows(students, jobs)))
+        students_by_pk = {student[0]: student[1:] for student in students}
+        jobs_by_pk = {job.pk: job for job in self.jobs}
+
+        for student_id, job_id, match_percentage, is_hard_eligible, shortlist_percentage, recommendation in rows:
+            cgpa, backlogs, branch = students_by_pk[student_id]
+            job = jobs_by_pk[job_id]
+            score, max_score, eligible = evaluate_eligibility(job, cgpa, backlogs, branch)
+            shortlist, shortlist_max, _ = evaluate_eligibility(job, cgpa, backlogs, branch, skip_missing=True)
+            with self.subTest(student=(cgpa, backlogs, branch), criteria=job.eligibility_criteria):
+                self.assertEqual(is_hard_eligible, eligible)
+                self.assertEqual(match_percentage, round(score / max_score * 100) if max_score else 0.0)
+                self.assertEqual(shortlist_percentage, round(shortlist / shortlist_max * 100) if shortlist_max else 0.0)
+                if shortlist_max == 0:
+                    self.assertEqual(recommendation, "No Criteria")
+                elif shortlist_percentage >= 90:
+                    self.assertEqual(recommendation, "Strong Fit")
+                elif shortlist_percentage >= 60:
+                    self.assertEqual(recommendation, "Average Match")
+                else:
+                    self.assertEqual(recommendation, "Low Match")
+
+    def test_all_branches_ignores_listed_branches(self):
+        job = Job(eligibility_criteria="All branches except CSE")
+        job.compile_eligibility()
+        self.assertEqual((job.all_branches, job.allowed_branches), (True, ""))
+        self.assertEqual(evaluate_eligibility(job, 5.0, 4, "CSE"), (0, 0, True))
+
+
+def baseline_score_application(application):
+    """Frozen copy of the per-row scorer the batch scorer replaced (placement/views.py at the baseline)."""
+    job = application.job
+    student_profile = application.student
+
+    match_score = 0
+    max_possible_match_score = 0
+    job_eligibility_lower = job.eligibility_criteria.lower()
+    student_branch_lower = student_profile.branch.lower()
+
+    # A. Branch Check
+    branch_criteria_explicit = False
+    if not ("all branches" in job_eligibility_lower or "any branch" in job_eligibility_lower):
+        for b in ["cse", "it", "ece", "eee", "mech", "civil"]:
+            if b in job_eligibility_lower:
+                branch_criteria_explicit = True
+                break
+
+    if branch_criteria_explicit:
+        max_possible_match_score += 1
+        if student_branch_lower in job_eligibility_lower:
+            match_score += 1
+
+    # B. CGPA Check
+    cgpa_match_regex = re.search(r'(?:min(?:imum)?\s*)?cgpa\s*(\d+\.?\d*)', job_eligibility_lower)
+    if cgpa_match_regex and student_profile.cgpa is not None:
+        max_possible_match_score += 1
+        try:
+            required_cgpa = float(cgpa_match_regex.group(1))
+            student_cgpa_value = float(student_profile.cgpa)
+            if student_cgpa_value >= required_cgpa:
+                match_score += 1
+        except ValueError:
+            max_possible_match_score -= 1
+
+    # C. Backlogs Check
+    backlogs_criteria_found = re.search(r'(no\s+backlogs|max(?:imum)?\s+backlogs\s+(\d+))', job_eligibility_lower)
+    if backlogs_criteria_found and student_profile.backlogs is not None:
+        max_possible_match_score += 1
+        is_backlog_match = True
+
+        if re.search(r'no\s+backlogs', job_eligibility_lower):
+            if student_profile.backlogs > 0:
+                is_backlog_match = False
+        elif re.search(r'max(?:imum)?\s+backlogs\s+(\d+)', job_eligibility_lower):
+            try:
+                allowed_backlogs = int(re.search(r'max(?:imum)?\s+backlogs\s+(\d+)', job_eligibility_lower).group(1))
+                if student_profile.backlogs > allowed_backlogs:
+                    is_backlog_match = False
+            except ValueError:
+                max_possible_match_score -= 1
+                is_backlog_match = True
+
+        if is_backlog_match:
+            match_score += 1
+
+    # D. Calculate Percentage and Tag (FIXED LOGIC HERE)
+    if max_possible_match_score == 0:
+        match_percentage = 0
+        recommendation = "No Criteria" # <--- CLEAR TAG FOR ADMINS
+    else:
+        match_percentage = round((match_score / max_possible_match_score) * 100, 0)
+
+        # Assign Recommendation Tag
+        if match_percentage >= 90:
+            recommendation = "Strong Fit"
+        elif match_percentage >= 60:
+            recommendation = "Average Match"
+        else:
+            recommendation = "Low Match"
+
+    # Attach properties to the application object dynamically
+    application.match_percentage = match_percentage
+    application.recommendation = recommendation
+    return application
+
+
+class BaselineScoringParityTests(SimpleTestCase):
+    """The batch scorer must reproduce the baseline per-row scorer on these rows."""
+
+    # The branch rule intentionally differs where the baseline's substring
+    # test misfired (see test_branch_rule_differs_only_where_substrings_misfired),
+    # so these rows avoid criteria with a stray "it" and partial branch names.
+    CRITERIA = [
+        "Min CGPA 7.0, CSE/IT branches, No backlogs",
+        "All branches, cgpa 6.5",
+        "ECE/EEE branches",
+        "Maximum backlogs 1",
+        "Any branch, max backlogs 2, minimum cgpa 8",
+        "CGPA 7.5, Mech or Civil, max backlogs 0",
+        "Open to everyone",
+    ]
+    STUDENTS = [
+        (cgpa, backlogs, branch)
+        for cgpa in (None, 6.5, 7.0, 7.49, 8.0, 9.99)
+        for backlogs in (None, 0, 1, 2, 3)
+        for branch in ("CSE", "IT", "ece", "EEE", "Mech", "Civil")
+    ]
+
+    def baseline(self, criteria, student):
+        cgpa, backlogs, branch = student
+        application = SimpleNamespace(
+            job=SimpleNamespace(eligibility_criteria=criteria),
+            student=SimpleNamespace(cgpa=cgpa, backlogs=backlogs, branch=branch),
+        )
+        scored = baseline_score_application(application)
+        return float(scored.match_percentage), scored.recommendation
+
+    def batch(self, pairs):
+        jobs = []
+        for _, criteria in pairs:
+            job = Job(eligibility_criteria=criteria)
+            job.compile_eligibility()
+            jobs.append(job)
+        match_score, max_score, _ = evaluate_columns(
+            float_column([student[0] for student, _ in pairs]),
+            float_column([student[1] for student, _ in pairs]),
+            branch_token_column([student[2] for student, _ in pairs]),
+            float_column([job.min_cgpa for job in jobs]),
+            float_column([job.max_backlogs for job in jobs]),
+            [job.all_branches for job in jobs],
+            [job.allowed_branches for job in jobs],
+        )
+        percentage = match_percentage_columns(match_score, max_score)
+        return list(zip(percentage.tolist(), recommendation_columns(percentage, max_score).tolist()))
+
+    def test_evaluate_columns_matches_baseline_score_application(self):
+        pairs = [(student, criteria) for student in self.STUDENTS for criteria in self.CRITERIA]
+        expected = [self.baseline(criteria, student) for student, criteria in pairs]
+        self.assertEqual(self.batch(pairs), expected)
+
+    def test_branch_rule_differs_only_where_substrings_misfired(self):
+        # (criteria, branch): baseline percentage -> batch percentage
+        cases = {
+            # "it" inside "with" made IT an explicit branch rule
+            ("Min CGPA 7.0 with no backlogs", "IT"): (100.0, 100.0),
+            ("Min CGPA 7.0 with no backlogs", "CSE"): (67.0, 100.0),
+            # A partial branch name was a substring of the listed one
+            ("ECE branch", "E"): (100.0, 0.0),
+            # A specialisation was not a substring of its branch code
+            ("CSE/IT branches", "CSE (AI&ML)"): (0.0, 100.0),
+        }
+        for (criteria, branch), (baseline, batch) in cases.items():
+            with self.subTest(criteria=criteria, branch=branch):
+                student = (8.0, 0, branch)
+                self.assertEqual(self.baseline(criteria, student)[0], baseline)
+                self.assertEqual(self.batch([(student, criteria)])[0][0], batch)
+
+
+class EligibilityRuleTests(TestCase):
+    def test_criteria_text_is_compiled_on_save(self):
+        job = Job.objects.create(
+            company_name="Acme", job_role="SRE", description="Ops",
+            eligibility_criteria="Minimum CGPA 7.25, CSE / IT / Mechanical branches, no backlogs",
+            application_deadline=date.today(),
+        )
+        job.refresh_from_db()
+        # "Mechanical" is spelled out, but still the "mech" code
+        self.assertEqual(
+            (job.min_cgpa, job.allowed_branches, job.max_backlogs, job.all_branches),
+            (7.25, ",cse,it,mech,", 0, False),
+        )
+        self.assertEqual(Job.objects.filter(allowed_branches__contains=",it,").count(), 1)
+
+        job.eligibility_criteria = "Any branch, maximum backlogs 2"
+        job.save(update_fields=['eligibility_criteria'])
+        job.refresh_from_db()
+        self.assertEqual(
+            (job.min_cgpa, job.allowed_branches, job.max_backlogs, job.all_branches),
+            (None, "", 2, True),
+        )
+
+    def test_evaluate_eligibility(self):
+        job = Job(eligibility_criteria="CGPA 7.0, ECE branch, Max backlogs 1")
+        job.compile_eligibility()
+        self.assertEqual(evaluate_eligibility(job, 7.0, 1, " ece "), (3, 3, True))
+        self.assertEqual(evaluate_eligibility(job, 6.9, 1, "EEE"), (1, 3, False))
+        # A missing CGPA fails the rule, unless it is skipped
+        self.assertEqual(evaluate_eligibility(job, None, 0, "ECE"), (2, 3, False))
+        self.assertEqual(evaluate_eligibility(job, None, 0, "ECE", skip_missing=True), (2, 2, True))
+
+    def test_branches_match_by_code(self):
+        def branch_matches(criteria, branch):
+            job = Job(eligibility_criteria=criteria)
+            job.compile_eligibility()
+            return evaluate_eligibility(job, None, None, branch, skip_missing=True)[0] == 1
+
+        # Specialisations and spelled-out names count as their branch code,
+        # in the criteria as well as on the student
+        self.assertTrue(branch_matches("CSE branch", "CSE (AI&ML)"))
+        self.assertTrue(branch_matches("CSE (AI&ML) only", "CSE (AI&ML)"))
+        self.assertTrue(branch_matches("CSE-DS students", "CSE-DS"))
+        self.assertTrue(branch_matches("CSE-DS students", "CSE"))
+        self.assertTrue(branch_matches("EEE/ECE", "ECE"))
+        self.assertTrue(branch_matches("EEE/ECE", "eee"))
+        self.assertTrue(branch_matches("Mechanical or Civil", "Mechanical Engineering"))
+        self.assertTrue(branch_matches("Computer Science branch", "CSE"))
+        self.assertFalse(branch_matches("EEE/ECE", "CSE (AI&ML)"))
+        self.assertFalse(branch_matches("ECE branch", "E"))
+        # Codes are whole words: the "it" in "with" is not the IT branch
+        job = Job(eligibility_criteria="Min CGPA 7.0 with no backlogs")
+        job.compile_eligibility()
+        self.assertEqual(job.allowed_branches, "")
+
+
+class StudentJobBoardTests(ApplicationTestCase):
+    def setUp(self):
+        super().setUp()
+        for role, criteria, days in [
+            ("Data Scientist", "Min CGPA 9.0, CSE branch", 5),
+            ("Embedded Engineer", "ECE branch", 5),
+            ("Old Posting", "All branches", -1),
+        ]:
+            Job.objects.create(
+                company_name="Acme", job_role=role, description="Role", eligibility_criteria=criteria,
+                application_deadline=date.today() + timedelta(days=days),
+            )
+        # What the worker does for the newly posted jobs
+        while (claimed := claim_task("w")) is not None:
+            run_task(claimed, "w")
+        self.client.login(username="student0", password="pw")
+
+    def job_roles(self, **params):
+        response = self.client.get(reverse('student_job_list'), params)
+        return [job.job_role for job in response.context['jobs']], response.context['page_obj']
+
+    def test_open_jobs_are_ranked_by_match_percentage(self):
+        roles, _ = self.job_roles()
+        self.assertEqual(roles, ["Backend Engineer", "Data Scientist", "Embedded Engineer"])
+
+    def test_eligible_filter(self):
+        roles, _ = self.job_roles(filter="eligible")
+        self.assertEqual(roles, ["Backend Engineer"])
+
+    def test_paging(self):
+        with mock.patch('placement.views.JOB_BOARD_PAGE_SIZE', 2):
+            roles, page = self.job_roles(page=2)
+        self.assertEqual(roles, ["Embedded Engineer"])
+        self.assertEqual((page.number, page.paginator.num_pages), (2, 2))
+
+    def test_an_unparsed_resume_is_queued_for_parsing(self):
+        student = StudentProfile.objects.get(roll_number="R0")
+        StudentProfile.objects.filter(pk=student.pk).update(resume_file="cv.pdf", resume_text="Parsed before")
+        self.client.get(reverse('student_job_list'))
+        self.assertFalse(Task.objects.filter(name='core.parse_resume').exists())
+
+        StudentProfile.objects.filter(pk=student.pk).update(resume_text="")
+        self.client.get(reverse('student_job_list'))
+        self.client.get(reverse('student_job_list'))
+        self.assertEqual(Task.objects.filter(name='core.parse_resume').count(), 1)
+        self.assertEqual(StudentProfile.objects.get(pk=student.pk).resume_parse_status, "queued")
+
+    def test_each_job_shows_a_cached_selection_chance(self):
+        local_cache.clear()
+        self.addCleanup(local_cache.clear)
+
+        class FakeModel:
+            def __init__(self, version, chance):
+                self.version = version
+                self.chance = chance
+                self.rows = 0
+
+            def predict_job(self, X):
+                self.rows += len(X)
+                return np.full(len(X), self.chance)
+
+        v1 = FakeModel('v1', 40.0)
+        with mock.patch('placement.ml_service.get_model', return_value=v1):
+            response = self.client.get(reverse('student_job_list'))
+            self.assertEqual([job.selection_probability for job in response.context['jobs']], [40.0] * 3)
+            self.assertContains(response, "Selection Chance")
+            self.assertEqual(v1.rows, 3)
+            # A repeat page load is served from the cache
+            self.client.get(reverse('student_job_list'))
+            self.assertEqual(v1.rows, 3)
+
+        # A new model version misses the cached entries
+        v2 = FakeModel('v2', 80.0)
+        with mock.patch('placement.ml_service.get_model', return_value=v2):
+            response = self.client.get(reverse('student_job_list'))
+        self.assertEqual([job.selection_probability for job in response.context['jobs']], [80.0] * 3)
+        self.assertEqual(v2.rows, 3)
+
+
+class KeysetPaginationTests(ApplicationTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(3, 8):
+            user = User.objects.create_user(f"student{i}", f"student{i}@example.com", "pw")
+            student = StudentProfile.objects.create(user=user, roll_number=f"R{i}", branch="CSE", cgpa=8.0)
+            self.applications.append(Application.objects.create(student=student, job=self.job))
+        # Ties on the score, and on the score and timestamp together
+        applied_at = timezone.now()
+        for application, score in zip(self.applications, [90, 90, 90, 75, 75, 60, 60, 60]):
+            Application.objects.filter(pk=application.pk).update(match_score=score, applied_at=applied_at)
+        Application.objects.filter(pk=self.applications[0].pk).update(applied_at=applied_at - timedelta(hours=1))
+
+    def test_pages_cover_every_row_once_in_order(self):
+        expected = list(
+            Application.objects.order_by('-match_score', '-applied_at', '-id').values_list('pk', flat=True)
+        )
+        seen = []
+        cursor = None
+        for _ in range(4):
+            rows, cursor = keyset_page(Application.objects.all(), cursor, page_size=3)
+            seen.extend(row.pk for row in rows)
+            if cursor is None:
+                break
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(seen), 8)
+        # The hour-older row comes last among the 90s
+        self.assertEqual(seen[2], self.applications[0].pk)
+
+    def test_last_full_page_has_no_next_cursor(self):
+        rows, cursor = keyset_page(Application.objects.all(), page_size=8)
+        self.assertEqual((len(rows), cursor), (8, None))
+
+    def test_tampered_cursor_starts_from_the_first_page(self):
+        first_page, _ = keyset_page(Application.objects.all(), page_size=3)
+        for cursor in ["not-base64!", "bm90IGpzb24=", encode_cursor(first_page[0])[:-4], "WzEsMl0="]:
+            with self.subTest(cursor=cursor):
+                self.assertIsNone(decode_cursor(cursor))
+                rows, _ = keyset_page(Application.objects.all(), cursor, page_size=3)
+                self.assertEqual(rows, first_page)
+
+
+class JobSearchTests(TestCase):
+    def create_job(self, job_role, description):
+        return Job.objects.create(
+            company_name="Acme", job_role=job_role, description=description,
+            eligibility_criteria="All branches", application_deadline=date.today(),
+        )
+
+    def search(self, query):
+        return list(search_jobs(Job.objects.all(), query).order_by('search_rank').values_list('job_role', flat=True))
+
+    def indexed_ids(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT rowid FROM {JOB_FTS_TABLE} ORDER BY rowid')
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_index_follows_saves_and_deletes(self):
+        job = self.create_job("Backend Engineer", "Kafka pipelines")
+        self.assertEqual(self.search("kaf"), ["Backend Engineer"])
+
+        job.description = "Postgres tuning"
+        job.save()
+        self.assertEqual(self.search("kafka"), [])
+        self.assertEqual(self.search("postgres backend"), ["Backend Engineer"])
+
+        job.delete()
+        self.assertEqual(self.indexed_ids(), [])
+
+    def test_results_are_ranked_by_relevance(self):
+        self.create_job("Data Analyst", "Reports, some python")
+        self.create_job("Python Developer", "Python services, Python tooling")
+        self.create_job("Designer", "Figma")
+        self.assertEqual(self.search("python"), ["Python Developer", "Data Analyst"])
+
+    def test_query_syntax_is_treated_as_text(self):
+        self.create_job("Backend Engineer", "C++ and SQL")
+        self.assertEqual(self.search('sql OR "figma" NEAR('), [])
+        self.assertEqual(self.search('c++ sql'), ["Backend Engineer"])
+
+    def test_rebuild(self):
+        jobs = [self.create_job("A", "x"), self.create_job("B", "y")]
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {JOB_FTS_TABLE}')
+        self.assertEqual(rebuild_job_index(), 2)
+        self.assertEqual(self.indexed_ids(), [job.pk for job in jobs])
+
+
+class ApplicationSkillFilterTests(ApplicationTestCase):
+    def setUp(self):
+        super().setUp()
+        for application, skills in zip(self.applications, ["Python, SQL", "python", "Java"]):
+            application.student.skills = skills
+            application.student.save()
+        User.objects.create_user("admin", "admin@example.com", "pw", user_type="admin")
+        self.client.login(username="admin", password="pw")
+
+    def roll_numbers(self, **params):
+        response = self.client.get(reverse('applications_for_job', args=[self.job.pk]), params)
+        return sorted(application.student.roll_number for application in response.context['applications'])
+
+    def test_skills_filter_matches_all_by_default_or_any(self):
+        self.assertEqual(self.roll_numbers(skills="SQL, python"), ["R0"])
+        self.assertEqual(self.roll_numbers(skills="SQL, python", skills_mode="any"), ["R0", "R1"])
+        self.assertEqual(self.roll_numbers(skills="java"), ["R2"])
+        self.assertEqual(self.roll_numbers(skills=" , "), ["R0", "R1", "R2"])
+
+    def test_filter_form_offers_and_keeps_the_skills_mode(self):
+        url = reverse('applications_for_job', args=[self.job.pk])
+        response = self.client.get(url)
+        self.assertContains(response, '<select name="skills_mode"')
+        self.assertContains(response, '<option value="all" selected>All of these</option>', html=True)
+
+        response = self.client.get(url, {'skills': 'SQL, python', 'skills_mode': 'all'})
+        self.assertContains(response, '<option value="all" selected>All of these</option>', html=True)
+        self.assertContains(response, '<option value="any">Any of these</option>', html=True)
+        self.assertEqual(len(response.context['applications']), 1)
+
+        response = self.client.get(url, {'skills': 'SQL, python', 'skills_mode': 'any'})
+        self.assertContains(response, '<option value="any" selected>Any of these</option>', html=True)
+        self.assertContains(response, '<option value="all">All of these</option>', html=True)
+        self.assertContains(response, 'value="SQL, python"')
+        self.assertEqual(len(response.context['applications']), 2)
+
+
+
+def write_model_artifact(path, version, coef=1.0):
+    """A small logistic artifact in the layout ml_service loads."""
+    def params(features):
+        n = len(features)
+        return {
+            'features': list(features), 'mean': np.full(n, 0.5), 'scale': np.ones(n),
+            'coef': np.linspace(-coef, coef, n), 'intercept': 0.25,
+        }
+    joblib.dump(
+        {'version': version, 'overall': params(ml_service.OVERALL_FEATURES), 'job': params(ml_service.JOB_FEATURES)},
+        path,
+    )
+
+
+class PlacementModelTests(SimpleTestCase):
+    def setUp(self):
+        workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, workdir, ignore_errors=True)
+        self.path = os.path.join(workdir, 'placement_model.joblib')
+        settings_override = override_settings(PLACEMENT_MODEL_PATH=self.path)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        ml_service.reset_model()
+        self.addCleanup(ml_service.reset_model)
+        local_cache.clear()
+
+    def test_artifact_is_memory_mapped(self):
+        write_model_artifact(self.path, 'lr-1')
+        model = ml_service.load_model()
+        self.assertIsInstance(model, ml_service.LogisticPlacementModel)
+        self.assertEqual(model.version, 'lr-1')
+        self.assertIsInstance(model.overall['coef'], np.memmap)
+
+    def test_missing_or_corrupt_artifact_falls_back_to_the_heuristic(self):
+        self.assertIsInstance(ml_service.load_model(), ml_service.HeuristicPlacementModel)
+        with open(self.path, 'wb') as f:
+            f.write(b"not a joblib file")
+        with self.assertLogs('placement.ml_service', 'ERROR'):
+            self.assertIsInstance(ml_service.load_model(), ml_service.HeuristicPlacementModel)
+
+    def test_new_artifact_is_picked_up_after_the_check_interval(self):
+        clock = [1000.0]
+        with mock.patch('placement.ml_service.time.monotonic', side_effect=lambda: clock[0]):
+            write_model_artifact(self.path, 'lr-1')
+            self.assertEqual(ml_service.get_model().version, 'lr-1')
+
+            write_model_artifact(self.path, 'lr-2')
+            mtime = os.stat(self.path).st_mtime + 10
+            os.utime(self.path, (mtime, mtime))
+            clock[0] += ml_service.MODEL_CHECK_INTERVAL - 1
+            self.assertEqual(ml_service.get_model().version, 'lr-1')
+
+            clock[0] += 1
+            self.assertEqual(ml_service.get_model().version, 'lr-2')
+
+    def test_batch_and_single_predictions_agree(self):
+        write_model_artifact(self.path, 'lr-parity')
+        students = [
+            StudentProfile(cgpa=cgpa, backlogs=backlogs, skills=skills, experience=experience)
+            for cgpa, backlogs, skills, experience in [
+                (9.1, 0, "Python", "Intern"), (6.2, 3, "", ""), (None, None, "SQL", ""), (7.5, 1, "", "Projects"),
+            ]
+        ]
+        matches = [100.0, 42.5, None, 75.0]
+
+        overall = ml_service.get_overall_placement_predictions(students)
+        job = ml_service.get_job_specific_predictions(students, matches)
+
+        model = ml_service.get_model()
+        X = ml_service.feature_matrix(ml_service.student_feature_rows(students))
+        self.assertEqual(overall, ml_service.round_predictions(model.predict_overall(X)))
+        for i, student in enumerate(students):
+            self.assertEqual(ml_service.get_overall_placement_prediction(student), overall[i])
+            self.assertEqual(ml_service.get_job_specific_prediction(matches[i], student), job[i])
+            self.assertTrue(0 <= overall[i] <= 100 and 0 <= job[i] <= 100)
+
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class TrainPlacementModelTests(TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir, ignore_errors=True)
+        self.addCleanup(ml_service.reset_model)
+        job = Job.objects.create(
+            company_name="Acme", job_role="Engineer", description="APIs",
+            eligibility_criteria="Open to all", application_deadline=date.today() + timedelta(days=10),
+        )
+        # Higher CGPA and fewer backlogs mostly get selected, with some noise
+        for i in range(30):
+            user = User.objects.create_user(f"student{i}", f"student{i}@example.com", "pw")
+            student = StudentProfile.objects.create(
+                user=user, roll_number=f"R{i}", branch="CSE", cgpa=5.0 + i / 6, backlogs=3 - i // 10,
+                skills="Python" if i % 2 else "",
+            )
+            selected = (i >= 12) != (i in (5, 20))
+            Application.objects.create(student=student, job=job, status="selected" if selected else "rejected")
+
+    def test_command_writes_an_artifact_that_serving_loads(self):
+        serving_path = os.path.join(self.workdir, 'serving', 'placement_model.joblib')
+        output_dir = os.path.join(self.workdir, 'models')
+        out = StringIO()
+        with override_settings(PLACEMENT_MODEL_PATH=serving_path):
+            call_command('train_placement_model', '--output-dir', output_dir, stdout=out)
+
+            [metrics_path] = glob.glob(os.path.join(output_dir, '*.metrics.json'))
+            with open(metrics_path) as f:
+                metrics = json.load(f)
+            for name in ('overall', 'job'):
+                self.assertEqual(metrics[name]['rows'], 30)
+                self.assertEqual(metrics[name]['validation_rows'], 6)
+                for key in ('positive_rate', 'log_loss', 'accuracy', 'roc_auc'):
+                    self.assertIn(key, metrics[name])
+            self.assertIn(metrics['version'], out.getvalue())
+            self.assertEqual(len(glob.glob(os.path.join(output_dir, '*.joblib'))), 1)
+
+            ml_service.reset_model()
+            model = ml_service.get_model()
+            self.assertEqual(model.version, metrics['version'])
+            predictions = ml_service.get_overall_placement_predictions(StudentProfile.objects.order_by('cgpa'))
+            predictions += ml_service.get_job_specific_predictions(StudentProfile.objects.all(), [80.0] * 30)
+        self.assertTrue(all(0 <= p <= 100 for p in predictions))
+        self.assertGreater(predictions[29], predictions[0])
+
+    def test_no_activate_leaves_the_served_model_alone(self):
+        serving_path = os.path.join(self.workdir, 'placement_model.joblib')
+        with override_settings(PLACEMENT_MODEL_PATH=serving_path):
+            call_command('train_placement_model', '--no-activate', stdout=StringIO())
+        self.assertFalse(os.path.exists(serving_path))
+        self.assertEqual(len(glob.glob(os.path.join(self.workdir, 'placement_model-*.joblib'))), 1)
+
+    def test_too_few_outcomes_is_a_command_error(self):
+        Application.objects.filter(status="selected").update(status="applied")
+        with override_settings(PLACEMENT_MODEL_PATH=os.path.join(self.workdir, 'placement_model.joblib')):
+            with self.assertRaisesMessage(CommandError, "Not enough outcomes"):
+                call_command('train_placement_model', stdout=StringIO())
+
+
+
+class PredictionCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = [1000.0]
+        patcher = mock.patch('placement.prediction_cache.time.monotonic', side_effect=lambda: self.clock[0])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        local_cache.clear()
+        self.addCleanup(local_cache.clear)
+        self.predicted = []
+
+    def predict(self, rows):
+        self.predicted.append(rows)
+        return [sum(row) for row in rows]
+
+    def test_only_missing_rows_are_predicted(self):
+        rows = [(8.0, 0, 1), (6.0, 2, 0), (8.0, 0, 1)]
+        self.assertEqual(cached_predictions('overall', 'v1', rows, self.predict), [9.0, 8.0, 9.0])
+        # Duplicate rows are predicted once
+        self.assertEqual(self.predicted, [[(8.0, 0, 1), (6.0, 2, 0)]])
+
+        self.assertEqual(cached_predictions('overall', 'v1', rows + [(7.0, 1, 1)], self.predict), [9.0, 8.0, 9.0, 9.0])
+        self.assertEqual(self.predicted[1:], [[(7.0, 1, 1)]])
+
+    def test_changed_profile_or_model_version_misses(self):
+        cached_predictions('overall', 'v1', [(8.0, 0, 1)], self.predict)
+        cached_predictions('overall', 'v1', [(8.5, 0, 1)], self.predict)
+        cached_predictions('overall', 'v2', [(8.0, 0, 1)], self.predict)
+        cached_predictions('job', 'v1', [(8.0, 0, 1)], self.predict)
+        self.assertEqual(len(self.predicted), 4)
+
+    def test_entries_expire_after_the_ttl(self):
+        cache = LRUTTLCache(maxsize=10, ttl=60)
+        cache.set_many({'a': 1})
+        self.clock[0] += 59
+        self.assertEqual(cache.get_many(['a']), {'a': 1})
+        self.clock[0] += 1
+        self.assertEqual(cache.get_many(['a']), {})
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUTTLCache(maxsize=2, ttl=60)
+        cache.set_many({'a': 1, 'b': 2})
+        cache.get_many(['a'])
+        cache.set_many({'c': 3})
+        self.assertEqual(cache.get_many(['a', 'b', 'c']), {'a': 1, 'c': 3})
+
+    @override_settings(
+        CACHES={'predictions': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'predictions'}},
+        PLACEMENT_PREDICTION_CACHE_ALIAS='predictions',
+    )
+    def test_shared_cache_serves_other_processes(self):
+        cached_predictions('overall', 'v1', [(8.0, 0, 1)], self.predict)
+        # Another process starts with an empty in-process cache
+        local_cache.clear()
+        self.assertEqual(cached_predictions('overall', 'v1', [(8.0, 0, 1)], self.predict), [9.0])
+        self.assertEqual(len(self.predicted), 1)
@@ -0,0 +1,234 @@
+# placement/training.py
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from django.db.models import Exists, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.models import StudentProfile
+from .ml_service import JOB_FEATURES, OVERALL_FEATURES, default_model_path, feature_matrix
+from .models import Application, StudentJobMatch
+
+# Only decided applications are outcomes; pending ones are not negatives
+POSITIVE_STATUSES = ('selected',)
+DECIDED_STATUSES = ('selected', 'rejected')
+
+STREAM_CHUNK_SIZE = 2000
+# Every VALIDATION_EVERY-th row is held out for the metrics
+VALIDATION_EVERY = 5
+IRLS_ITERATIONS = 25
+L2_PENALTY = 1.0
+
+
+class TrainingError(Exception):
+    pass
+
+
+# --- STREAMING FEATURE EXTRACTION ---
+def _profile_features(cgpa, backlogs, skills, resume_file, experience):
+    return (
+        None if cgpa is None else float(cgpa),
+        backlogs,
+        bool(skills),
+        bool(resume_file),
+        bool(experience),
+    )
+
+
+def student_outcome_rows():
+    """(count, iterator of (features, label)) per student with a decided application."""
+    decided = Application.objects.filter(student=OuterRef('pk'), status__in=DECIDED_STATUSES)
+    placed = Application.objects.filter(student=OuterRef('pk'), status__in=POSITIVE_STATUSES)
+    students = StudentProfile.objects.filter(Exists(decided)).annotate(placed=Exists(placed))
+    rows = students.values_list('cgpa', 'backlogs', 'skills', 'resume_file', 'experience', 'placed')
+    return students.count(), (
+        (_profile_features(*row[:5]), row[5])
+        for row in rows.iterator(chunk_size=STREAM_CHUNK_SIZE)
+    )
+
+
+def application_outcome_rows():
+    """(count, iterator of (features, label)) per decided application."""
+    match = StudentJobMatch.objects.filter(student=OuterRef('student'), job=OuterRef('job'))
+    applications = Application.objects.filter(status__in=DECIDED_STATUSES).annotate(
+        job_match=Coalesce(Subquery(match.values('match_percentage')[:1]), F('match_score')),
+    )
+    rows = applications.values_list(
+        'student__cgpa', 'student__backlogs', 'student__skills', 'student__resume_file',
+        'student__experience', 'job_match', 'status',
+    )
+    return applications.count(), (
+        (_profile_features(*row[:5]) + (float(row[5] or 0.0),), row[6] in POSITIVE_STATUSES)
+        for row in rows.iterator(chunk_size=STREAM_CHUNK_SIZE)
+    )
+
+
+def write_feature_memmap(path, n_rows, n_features, rows):
+    """
+    Streams (features, label) rows into an on-disk float32 matrix with the
+    label in the last column, one chunk at a time. Returns the memmap.
+    """
+    data = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=(n_rows, n_features + 1))
+    written = 0
+    chunk = []
+    for features, label in rows:
+        chunk.append(features + (1.0 if label else 0.0,))
+        if len(chunk) == STREAM_CHUNK_SIZE:
+            data[written:written + len(chunk)] = feature_matrix(chunk)
+            written += len(chunk)
+            chunk = []
+    if chunk:
+        data[written:written + len(chunk)] = feature_matrix(chunk)
+        written += len(chunk)
+    data.flush()
+    # Rows deleted between count() and the stream leave a short matrix
+    return data[:written]
+
+
+# --- CHUNKED LOGISTIC REGRESSION ---
+def _chunks(data, split):
+    """(X, y) chunks of the train (split='train') or validation rows."""
+    for start in range(0, len(data), STREAM_CHUNK_SIZE):
+        block = np.asarray(data[start:start + STREAM_CHUNK_SIZE], dtype=float)
+        holdout = (np.arange(start, start + len(block)) % VALIDATION_EVERY) == 0
+        block = block[holdout if split == 'validation' else ~holdout]
+        if len(block):
+            yield block[:, :-1], block[:, -1]
+
+
+def _standardization(data):
+    """Per-column mean and standard deviation of the training rows, ignoring missing values."""
+    n = total = total_sq = 0.0
+    for X, _ in _chunks(data, 'train'):
+        present = ~np.isnan(X)
+        X = np.where(present, X, 0.0)
+        n = n + present.sum(axis=0)
+        total = total + X.sum(axis=0)
+        total_sq = total_sq + (X * X).sum(axis=0)
+    n = np.maximum(n, 1)
+    mean = total / n
+    scale = np.sqrt(np.maximum(total_sq / n - mean * mean, 0.0))
+    return mean, np.where(scale > 0, scale, 1.0)
+
+
+def _design(X, mean, scale):
+    # Same imputation as serving: missing values become the mean (0 once scaled)
+    Z = np.nan_to_num((X - mean) / scale)
+    return np.hstack([np.ones((len(Z), 1)), Z])
+
+
+def fit_logistic_regression(data):
+    """
+    L2-regularized logistic regression fitted by IRLS (Newton's method).
+    Each iteration is one pass over the memmap accumulating the gradient
+    and the (features x features) Hessian, so memory does not grow with
+    the number of rows.
+    """
+    mean, scale = _standardization(data)
+    d = data.shape[1]  # features + intercept
+    w = np.zeros(d)
+    penalty = np.full(d, L2_PENALTY)
+    penalty[0] = 0.0  # no penalty on the intercept
+
+    for _ in range(IRLS_ITERATIONS):
+        gradient = -penalty * w
+        hessian = np.diag(penalty)
+        for X, y in _chunks(data, 'train'):
+            A = _design(X, mean, scale)
+            p = 1.0 / (1.0 + np.exp(-(A @ w)))
+            gradient += A.T @ (y - p)
+            hessian += (A * (p * (1 - p))[:, None]).T @ A
+        step = np.linalg.solve(hessian + 1e-9 * np.eye(d), gradient)
+        w += step
+        if np.abs(step).max() < 1e-6:
+            break
+
+    return {'mean': mean, 'scale': scale, 'coef': w[1:], 'intercept': float(w[0])}
+
+
+def evaluate(data, params):
+    """Log loss, accuracy and ROC AUC on the held-out rows."""
+    scores, labels = [], []
+    for X, y in _chunks(data, 'validation'):
+        z = np.nan_to_num((X - params['mean']) / params['scale']) @ params['coef'] + params['intercept']
+        scores.append(1.0 / (1.0 + np.exp(-z)))
+        labels.append(y)
+    if not scores:
+        return {'validation_rows': 0}
+    p = np.concatenate(scores)
+    y = np.concatenate(labels)
+    eps = 1e-12
+    metrics = {
+        'validation_rows': int(len(y)),
+        'log_loss': float(-np.mean(y * np.log(p + eps) + (1 - y) * np.log(1 - p + eps))),
+        'accuracy': float(np.mean((p >= 0.5) == (y == 1))),
+    }
+    positives, negatives = int(y.sum()), int(len(y) - y.sum())
+    if positives and negatives:
+        # Mann-Whitney U statistic over the ranks of the scores
+        ranks = np.empty(len(p))
+        ranks[np.argsort(p, kind='stable')] = np.arange(1, len(p) + 1)
+        metrics['roc_auc'] = float((ranks[y == 1].sum() - positives * (positives + 1) / 2) / (positives * negatives))
+    return metrics
+
+
+def _train_one(workdir, name, n_features, outcome_rows):
+    n_rows, rows = outcome_rows()
+    data = write_feature_memmap(os.path.join(workdir, f'{name}.npy'), n_rows, n_features, rows)
+    labels = np.asarray(data[:, -1])
+    positives = int(labels.sum())
+    if len(data) < VALIDATION_EVERY * 2 or positives in (0, len(data)):
+        raise TrainingError(
+            f"Not enough outcomes to train the {name} model "
+            f"({len(data)} rows, {positives} positive)."
+        )
+    params = fit_logistic_regression(data)
+    metrics = {'rows': int(len(data)), 'positive_rate': positives / len(data)}
+    metrics.update(evaluate(data, params))
+    return params, metrics
+
+
+def train_placement_model(output_dir=None, activate=True):
+    """
+    Trains the overall and job-specific models from decided applications and
+    writes a versioned artifact plus a metrics file. With `activate` the
+    artifact is also copied over PLACEMENT_MODEL_PATH (atomically), where
+    ml_service picks it up.
+
+    Returns (artifact_path, metrics).
+    """
+    import joblib
+
+    serving_path = default_model_path()
+    output_dir = output_dir or os.path.dirname(serving_path)
+    os.makedirs(output_dir, exist_ok=True)
+    version = 'lr-' + timezone.now().strftime('%Y%m%d%H%M%S')
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as workdir:
+        overall, overall_metrics = _train_one(workdir, 'overall', len(OVERALL_FEATURES), student_outcome_rows)
+        job, job_metrics = _train_one(workdir, 'job', len(JOB_FEATURES), application_outcome_rows)
+
+    artifact = {
+        'version': version,
+        'overall': dict(overall, features=list(OVERALL_FEATURES)),
+        'job': dict(job, features=list(JOB_FEATURES)),
+    }
+    metrics = {'version': version, 'trained_at': timezone.now().isoformat(), 'overall': overall_metrics, 'job': job_metrics}
+
+    artifact_path = os.path.join(output_dir, f'placement_model-{version}.joblib')
+    # Uncompressed so ml_service can memory-map the arrays
+    joblib.dump(artifact, artifact_path)
+    with open(os.path.join(output_dir, f'placement_model-{version}.metrics.json'), 'w') as f:
+        json.dump(metrics, f, indent=2)
+
+    if activate:
+        os.makedirs(os.path.dirname(serving_path), exist_ok=True)
+        staging = serving_path + '.tmp'
+        shutil.copyfile(artifact_path, staging)
+        os.replace(staging, serving_path)
+    return artifact_path, metrics
@@ -1,96 +1,40 @@
 # placement/views.py
 
+import logging
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
-from core.views import is_admin, is_student, calculate_readiness_score 
+from core.views import is_admin, is_student
 from core.models import StudentProfile, User
+from core.skills import parse_skill_names, students_with_skills
 from .models import Job, Application
+from .bulk_actions import bulk_set_application_status
 from .forms import JobForm, ApplicationStatusForm
+from .eligibility import evaluate_eligibility
+from .match_table import annotate_application_match, annotate_student_job_match
+from .pagination import keyset_page
+from .search import search_jobs
 from django.db.models import Q # For complex queries
-import re 
 from django.utils import timezone
 from datetime import date
-from placement.ml_service import get_job_specific_prediction 
+from placement.ml_service import get_job_specific_predictions
 from django.http import JsonResponse # <-- NEW IMPORT
+from django.core.paginator import Paginator
 
-# --- HELPER FUNCTION: Score Application for Admin Shortlisting (MODIFIED) ---
-def score_application(application):
-    job = application.job
-    student_profile = application.student
-    
-    match_score = 0
-    max_possible_match_score = 0 
-    job_eligibility_lower = job.eligibility_criteria.lower()
-    student_branch_lower = student_profile.branch.lower()
-
-    # A. Branch Check
-    branch_criteria_explicit = False
-    if not ("all branches" in job_eligibility_lower or "any branch" in job_eligibility_lower):
-        for b in ["cse", "it", "ece", "eee", "mech", "civil"]:
-            if b in job_eligibility_lower:
-                branch_criteria_explicit = True
-                break
-    
-    if branch_criteria_explicit:
-        max_possible_match_score += 1
-        if student_branch_lower in job_eligibility_lower:
-            match_score += 1
-
-    # B. CGPA Check
-    cgpa_match_regex = re.search(r'(?:min(?:imum)?\s*)?cgpa\s*(\d+\.?\d*)', job_eligibility_lower)
-    if cgpa_match_regex and student_profile.cgpa is not None:
-        max_possible_match_score += 1
-        try:
-            required_cgpa = float(cgpa_match_regex.group(1)) 
-            student_cgpa_value = float(student_profile.cgpa) 
-            if student_cgpa_value >= required_cgpa:
-                match_score += 1
-        except ValueError:
-            max_possible_match_score -= 1 
+logger = logging.getLogger(__name__)
 
-    # C. Backlogs Check
-    backlogs_criteria_found = re.search(r'(no\s+backlogs|max(?:imum)?\s+backlogs\s+(\d+))', job_eligibility_lower)
-    if backlogs_criteria_found and student_profile.backlogs is not None:
-        max_possible_match_score += 1
-        is_backlog_match = True
-        
-        if re.search(r'no\s+backlogs', job_eligibility_lower):
-            if student_profile.backlogs > 0:
-                is_backlog_match = False
-        elif re.search(r'max(?:imum)?\s+backlogs\s+(\d+)', job_eligibility_lower):
-            try:
-                allowed_backlogs = int(re.search(r'max(?:imum)?\s+backlogs\s+(\d+)', job_eligibility_lower).group(1))
-                if student_profile.backlogs > allowed_backlogs:
-                    is_backlog_match = False
-            except ValueError:
-                max_possible_match_score -= 1
-                is_backlog_match = True 
-        
-        if is_backlog_match:
-            match_score += 1
-
-    # D. Calculate Percentage and Tag (FIXED LOGIC HERE)
-    if max_possible_match_score == 0:
-        match_percentage = 0
-        recommendation = "No Criteria" # <--- CLEAR TAG FOR ADMINS
-    else:
-        match_percentage = round((match_score / max_possible_match_score) * 100, 0)
-        
-        # Assign Recommendation Tag
-        if match_percentage >= 90:
-            recommendation = "Strong Fit"
-        elif match_percentage >= 60:
-            recommendation = "Average Match"
-        else:
-            recommendation = "Low Match"
+JOB_BOARD_PAGE_SIZE = 20
+APPLICATIONS_PAGE_SIZE = 50
 
-    # Attach properties to the application object dynamically
-    application.match_percentage = match_percentage
-    application.recommendation = recommendation
-    return application
-# -----------------------------------------------------------------------------
 
+def _page_url(request, cursor):
+    """Current query string (filters included) pointing at the page after `cursor`."""
+    query = request.GET.copy()
+    query.pop('cursor', None)
+    if cursor:
+        query['cursor'] = cursor
+    return f"?{query.urlencode()}"
 
 # --- Admin Job Management (unchanged) ---
 @login_required
@@ -162,6 +106,7 @@ def applications_for_job(request, job_id):
     branch = request.GET.get('branch')
     max_backlogs = request.GET.get('max_backlogs')
     skills = request.GET.get('skills')
+    skills_mode = request.GET.get('skills_mode', 'all')
     status = request.GET.get('status')
 
     # Prefetch student data for scoring efficiency
@@ -176,18 +121,19 @@ def applications_for_job(request, job_id):
     if max_backlogs:
         filtered_applications = filtered_applications.filter(student__backlogs__lte=max_backlogs)
     if skills:
-        for skill_item in skills.split(','):
-            filtered_applications = filtered_applications.filter(student__skills__icontains=skill_item.strip())
+        # Indexed skill lookup: every listed skill by default, any of them with skills_mode=any
+        skill_names = parse_skill_names(skills)
+        if skill_names:
+            filtered_applications = filtered_applications.filter(
+                student__in=students_with_skills(skill_names, match_all=skills_mode != 'any')
+            )
     if status:
         filtered_applications = filtered_applications.filter(status=status)
     
-    # --- NEW: Apply Scoring and Sorting (Feature A) ---
-    scored_applications = []
-    for app in filtered_applications:
-        scored_applications.append(score_application(app))
-    
-    # Sort by descending match percentage (best candidates first)
-    scored_applications.sort(key=lambda x: x.match_percentage, reverse=True)
+    # --- NEW: Stored scores, best candidates first, one keyset page at a time (Feature A) ---
+    scored_applications, next_cursor = keyset_page(
+        annotate_application_match(filtered_applications), request.GET.get('cursor'), APPLICATIONS_PAGE_SIZE
+    )
     # -----------------------------------------------------
 
     available_branches = StudentProfile.objects.values_list('branch', flat=True).distinct().order_by('branch')
@@ -196,7 +142,9 @@ def applications_for_job(request, job_id):
 
     context = {
         'job': job,
-        'applications': scored_applications, # Pass the scored, sorted list
+        'applications': scored_applications, # Pass the scored, sorted page
+        'next_page_url': _page_url(request, next_cursor) if next_cursor else None,
+        'first_page_url': _page_url(request, None) if request.GET.get('cursor') else None,
         'all_applications_count': applications.count(),
         'available_branches': available_branches,
         'application_statuses': application_statuses,
@@ -204,6 +152,7 @@ def applications_for_job(request, job_id):
         'current_branch': branch,
         'current_max_backlogs': max_backlogs,
         'current_skills': skills,
+        'current_skills_mode': skills_mode,
         'current_status': status,
     }
     return render(request, 'placement/admin_job_applications.html', context)
@@ -219,10 +168,47 @@ def update_application_status(request, application_id):
             messages.success(request, "Application status updated successfully!")
             return redirect('applications_for_job', job_id=application.job.id)
         else:
-            print(f"Form validation errors for application {application_id}: {form.errors}")
+            logger.warning("Invalid status update for application %s: %s", application_id, form.errors.as_json())
             messages.error(request, "Error updating application status. Please check inputs and try again.")
     return redirect('applications_for_job', job_id=application.job.id)
 
+# --- NEW: Bulk status update (selected applications, or every application above a match score) ---
+@login_required
+@user_passes_test(is_admin)
+def bulk_update_application_status(request, job_id):
+    job = get_object_or_404(Job, pk=job_id)
+    if request.method != 'POST':
+        return redirect('applications_for_job', job_id=job.id)
+
+    status = request.POST.get('status')
+    if status not in dict(Application.APPLICATION_STATUS_CHOICES):
+        messages.error(request, "Choose a valid status for the bulk update.")
+        return redirect('applications_for_job', job_id=job.id)
+    # Blank comments leave each application's existing comments untouched
+    admin_comments = request.POST.get('admin_comments', '').strip() or None
+
+    applications = Application.objects.filter(job=job)
+    if request.POST.get('scope') == 'rule':
+        try:
+            min_match = float(request.POST.get('min_match', ''))
+        except ValueError:
+            messages.error(request, "Enter the minimum match score for the rule.")
+            return redirect('applications_for_job', job_id=job.id)
+        applications = applications.filter(match_score__gte=min_match)
+        if request.POST.get('only_status'):
+            applications = applications.filter(status=request.POST['only_status'])
+    else:
+        selected_ids = [pk for pk in request.POST.getlist('application_ids') if pk.isdigit()]
+        if not selected_ids:
+            messages.error(request, "Select at least one application.")
+            return redirect('applications_for_job', job_id=job.id)
+        applications = applications.filter(pk__in=selected_ids)
+
+    updated, notified = bulk_set_application_status(applications, status, admin_comments)
+    messages.success(request, f"Updated {updated} application(s); {notified} notification email(s) queued.")
+    return redirect('applications_for_job', job_id=job.id)
+# ---------------------------------------------------------
+
 # --- All Applications List (MODIFIED to include scoring) ---
 @login_required
 @user_passes_test(is_admin)
@@ -230,24 +216,16 @@ def all_applications_list(request):
     # Retrieve all applications, and prefetch related data needed for scoring
     applications = Application.objects.select_related('student__user', 'job').order_by('-applied_at')
     
-    # --- FIX: Apply Scoring to ALL applications ---
-    scored_applications = []
-    for app in applications:
-        # Check if the job object exists before scoring (handles potential data inconsistencies)
-        if app.job and app.student:
-             scored_applications.append(score_application(app))
-        else:
-            # Handle cases where related job/student might be missing
-            app.match_percentage = 0
-            app.recommendation = "Data Missing"
-            scored_applications.append(app)
-
-    # Sort by descending match percentage (best candidates first)
-    scored_applications.sort(key=lambda x: x.match_percentage, reverse=True)
+    # --- Stored scores, best candidates first, one keyset page at a time ---
+    scored_applications, next_cursor = keyset_page(
+        annotate_application_match(applications), request.GET.get('cursor'), APPLICATIONS_PAGE_SIZE
+    )
     # ---------------------------------------------------------
 
     context = {
         'applications': scored_applications,
+        'next_page_url': _page_url(request, next_cursor) if next_cursor else None,
+        'first_page_url': _page_url(request, None) if request.GET.get('cursor') else None,
         'job': None, # Keep job as None as this view is for 'All Jobs'
         'all_applications_count': applications.count(),
     }
@@ -259,127 +237,52 @@ def all_applications_list(request):
 def student_job_list(request):
     # --- Feature B Hiding: Filter out expired jobs ---
     today = timezone.now().date()
-    jobs = Job.objects.filter(application_deadline__gte=today).order_by('-posted_at')
+    jobs = Job.objects.filter(application_deadline__gte=today).select_related('posted_by')
     # -----------------------------------------------
     
     student_profile = get_object_or_404(StudentProfile, user=request.user)
     
-    # ... (rest of the student_job_list logic remains the same) ...
-
-    # Ensure readiness score is calculated before proceeding
-    if student_profile.placement_readiness_score == 0.0:
-        from core.views import parse_resume_for_student
-        parse_resume_for_student(student_profile)
-        calculate_readiness_score(student_profile) 
+    # Parse an uploaded resume that has never been parsed, in the background
+    if student_profile.resume_file and not student_profile.resume_text \
+            and student_profile.resume_parse_status == 'idle':
+        from core.tasks import queue_resume_parse
+        queue_resume_parse(student_profile)
 
     applied_job_ids = student_profile.applications.values_list('job_id', flat=True)
 
-    filtered_jobs_with_scores = []
-    
-    student_cgpa = student_profile.cgpa
-    student_backlogs = student_profile.backlogs
-    student_branch_lower = student_profile.branch.lower()
-    
-    for job in jobs:
-        job_is_hard_eligible = True 
-        match_score = 0     
-        max_possible_match_score = 0 
-
-        job_eligibility_lower = job.eligibility_criteria.lower()
-
-        # --- A. Check and Score Branch Eligibility (Hard Filter & Scoring) ---
-        branch_criteria_explicit = False
-        if not ("all branches" in job_eligibility_lower or "any branch" in job_eligibility_lower):
-            for b in ["cse", "it", "ece", "eee", "mech", "civil"]:
-                if b in job_eligibility_lower:
-                    branch_criteria_explicit = True
-                    break
-        
-        if branch_criteria_explicit:
-            max_possible_match_score += 1
-            if student_branch_lower in job_eligibility_lower:
-                match_score += 1
-            else:
-                job_is_hard_eligible = False # Hard fail
-
-        # --- B. Check and Score CGPA Eligibility (Hard Filter & Scoring) ---
-        cgpa_match_regex = re.search(r'(?:min(?:imum)?\s*)?cgpa\s*(\d+\.?\d*)', job_eligibility_lower)
-
-        if cgpa_match_regex:
-            max_possible_match_score += 1
-            if student_cgpa is None:
-                job_is_hard_eligible = False # Hard fail if required but missing
-            else:
-                try:
-                    required_cgpa = float(cgpa_match_regex.group(1)) 
-                    student_cgpa_value = float(student_cgpa) 
-                    
-                    if student_cgpa_value >= required_cgpa:
-                        match_score += 1
-                    else:
-                        job_is_hard_eligible = False # Hard fail
-                except ValueError:
-                    max_possible_match_score -= 1 # Ignore corrupt criteria
-
-
-        # --- C. Check and Score Backlogs Eligibility (Hard Filter & Scoring) ---
-        backlogs_criteria_found = re.search(r'(no\s+backlogs|max(?:imum)?\s+backlogs\s+(\d+))', job_eligibility_lower)
-        
-        if backlogs_criteria_found:
-            max_possible_match_score += 1
-            
-            if student_backlogs is None:
-                job_is_hard_eligible = False # Hard fail if required but missing
-            else:
-                is_backlog_match = True
-                
-                if re.search(r'no\s+backlogs', job_eligibility_lower):
-                    if student_backlogs > 0:
-                        is_backlog_match = False
-                elif re.search(r'max(?:imum)?\s+backlogs\s+(\d+)', job_eligibility_lower):
-                    try:
-                        allowed_backlogs = int(re.search(r'max(?:imum)?\s+backlogs\s+(\d+)', job_eligibility_lower).group(1))
-                        if student_backlogs > allowed_backlogs:
-                            is_backlog_match = False
-                    except ValueError:
-                        max_possible_match_score -= 1
-                        is_backlog_match = True 
-                
-                if is_backlog_match:
-                    match_score += 1
-                else:
-                    job_is_hard_eligible = False # Hard fail
-        
-        
-        # --- D. Final Scoring & Tagging ---
-        job_match_percentage = round((match_score / max_possible_match_score) * 100, 0) if max_possible_match_score > 0 else 0
-        
-        job.match_percentage = job_match_percentage
-        job.is_hard_eligible = job_is_hard_eligible 
-        
-        filtered_jobs_with_scores.append(job)
+    # 1. Read the student's row of the materialized match table (kept current
+    #    by the placement signals and tasks; this view never writes to it)
+    jobs = annotate_student_job_match(jobs, student_profile)
 
     # 2. Apply Eligibility Filter Logic based on query parameter
     job_filter = request.GET.get('filter', 'all') 
     search_query = request.GET.get('q') 
 
-    if search_query:
-        # Re-apply text filter post-scoring/hiding
-        q_filter = Q(company_name__icontains=search_query) | Q(job_role__icontains=search_query) | Q(description__icontains=search_query) | Q(eligibility_criteria__icontains=search_query)
-        jobs_to_score = [job for job in filtered_jobs_with_scores if q_filter.check(job)]
-    else:
-        jobs_to_score = filtered_jobs_with_scores
-
     if job_filter == 'eligible':
-        final_jobs = [job for job in jobs_to_score if job.is_hard_eligible]
-    else: 
-        final_jobs = jobs_to_score
+        jobs = jobs.filter(is_hard_eligible=True)
 
-    # 3. Sort by match percentage (descending)
-    final_jobs.sort(key=lambda x: x.match_percentage, reverse=True)
+    # 3. Sort by match percentage (descending) and page with LIMIT/OFFSET.
+    #    Searches go through the FTS5 index and rank by relevance first.
+    if search_query:
+        jobs = search_jobs(jobs, search_query).order_by('search_rank', '-match_percentage', '-posted_at', '-id')
+    else:
+        jobs = jobs.order_by('-match_percentage', '-posted_at', '-id')
+    page_obj = Paginator(jobs, JOB_BOARD_PAGE_SIZE).get_page(request.GET.get('page'))
+
+    # 4. Selection probability for every job on the page in one batch call.
+    #    The prediction cache keys on the model inputs (profile features and
+    #    match percentage) plus the model version rather than on (student,
+    #    job), so an edited profile or a new model is never served stale.
+    page_jobs = list(page_obj.object_list)
+    predictions = get_job_specific_predictions(
+        [student_profile] * len(page_jobs), [job.match_percentage for job in page_jobs]
+    )
+    for job, prediction in zip(page_jobs, predictions):
+        job.selection_probability = prediction
 
     context = {
-        'jobs': final_jobs,
+        'jobs': page_jobs,
+        'page_obj': page_obj,
         'student_profile': student_profile,
         'applied_job_ids': list(applied_job_ids),
         'current_filter': job_filter, 
@@ -397,53 +300,9 @@ def apply_for_job(request, job_id):
         messages.warning(request, "You have already applied for this job.")
         return redirect('student_dashboard')
 
-    job_eligible = True 
-    job_eligibility_lower = job.eligibility_criteria.lower()
-    student_branch_lower = student_profile.branch.lower()
-
-    if not ("all branches" in job_eligibility_lower or "any branch" in job_eligibility_lower):
-        branch_criteria_found = False
-        for b in ["cse", "it", "ece", "eee", "mech", "civil"]: 
-            if b in job_eligibility_lower:
-                branch_criteria_found = True
-                break
-        
-        if branch_criteria_found:
-            if student_branch_lower not in job_eligibility_lower:
-                job_eligible = False
-
-    # Check CGPA eligibility (hard filter)
-    cgpa_match = re.search(r'(?:min(?:imum)?\s*)?cgpa\s*(\d+\.?\d*)', job_eligibility_lower)
-    if cgpa_match:
-        if student_profile.cgpa is None:
-            job_eligible = False
-        else:
-            try:
-                required_cgpa = float(cgpa_match.group(1))
-                if float(student_profile.cgpa) < required_cgpa:
-                    job_eligible = False
-            except ValueError:
-                pass
-
-    # Check Backlogs eligibility (hard filter)
-    backlogs_required = re.search(r'(no\s+backlogs|max(?:imum)?\s+backlogs\s+(\d+))', job_eligibility_lower)
-    if backlogs_required:
-        if student_profile.backlogs is None:
-            job_eligible = False
-        else:
-            no_backlogs_match = re.search(r'no\s+backlogs', job_eligibility_lower)
-            max_backlogs_match = re.search(r'max(?:imum)?\s+backlogs\s+(\d+)', job_eligibility_lower)
-            
-            if no_backlogs_match:
-                if student_profile.backlogs > 0:
-                    job_eligible = False
-            elif max_backlogs_match:
-                try:
-                    allowed_backlogs = int(max_backlogs_match.group(1))
-                    if student_profile.backlogs > allowed_backlogs:
-                        job_eligible = False
-                except ValueError:
-                    pass
+    _, _, job_eligible = evaluate_eligibility(
+        job, student_profile.cgpa, student_profile.backlogs, student_profile.branch
+    )
 
     if not job_eligible:
         messages.error(request, "You do not meet the eligibility criteria for this job.")
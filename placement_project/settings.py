@@ -29,6 +29,7 @@ INSTALLED_APPS = [
     'rest_framework', # If you plan to build APIs (recommended for frontend integration)
     'core', # Your custom user app
     'placement', # Your placement logic app
+    'taskqueue', # Background task table and workers (manage.py runworker)
 ]
 
 
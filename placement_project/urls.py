@@ -41,10 +41,13 @@ urlpatterns = [
 
     # Student Profile URLs
     path('student/profile/', login_required(core_views.student_profile_view), name='student_profile_view'),
+    path('student/profile/resume-status/', login_required(core_views.resume_parse_status), name='resume_parse_status'),
     path('admin/students/', login_required(core_views.student_list_admin), name='student_list_admin'),
     
     # --- NEW: EXPORT URL ---
     path('admin/students/export/', login_required(core_views.export_students_xls), name='export_students_xls'),
+    path('admin/students/recompute-readiness/', login_required(core_views.recompute_readiness_admin), name='recompute_readiness_admin'),
+    path('admin/students/resume-search/', login_required(core_views.resume_search_admin), name='resume_search_admin'),
 
     # Admin Job Management URLs
     path('admin/jobs/', login_required(placement_views.job_list_admin), name='admin_job_list'),
@@ -55,6 +58,7 @@ urlpatterns = [
     # Admin Application Management URLs
     path('admin/jobs/<int:job_id>/applications/', login_required(placement_views.applications_for_job), name='applications_for_job'),
     path('admin/applications/<int:application_id>/update_status/', login_required(placement_views.update_application_status), name='update_application_status'),
+    path('admin/jobs/<int:job_id>/applications/bulk-status/', login_required(placement_views.bulk_update_application_status), name='bulk_update_application_status'),
     path('admin/applications/all/', login_required(placement_views.all_applications_list), name='all_applications_list'),
     # from . import views
 
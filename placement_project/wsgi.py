@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'placement_project.settings')
 
 application = get_wsgi_application()
+
+# Optionally load spaCy before serving requests instead of on the first resume parse
+from django.conf import settings  # noqa: E402
+if getattr(settings, 'NLP_WARM_UP', False):
+    from core.nlp import warm_up
+    warm_up()
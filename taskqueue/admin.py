@@ -0,0 +1,11 @@
+# taskqueue/admin.py
+
+from django.contrib import admin
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ("name", "status", "priority", "attempts", "run_at", "locked_by", "created_at", "finished_at")
+    list_filter = ("status", "name")
+    readonly_fields = ("attempts", "locked_until", "locked_by", "last_error", "created_at", "finished_at")
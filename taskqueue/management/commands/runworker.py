@@ -0,0 +1,24 @@
+# taskqueue/management/commands/runworker.py
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from taskqueue.worker import DEFAULT_POLL_INTERVAL, run_pool
+
+
+class Command(BaseCommand):
+    help = "Runs background task workers (a pool of processes polling the task table)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes', type=int, default=getattr(settings, 'TASK_WORKER_PROCESSES', 2),
+            help="Number of worker processes (default: TASK_WORKER_PROCESSES or 2).",
+        )
+        parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL)
+        parser.add_argument('--burst', action='store_true', help="Exit once the queue is empty.")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Starting {options['processes']} worker process(es)...")
+        processed = run_pool(options['processes'], options['poll_interval'], options['burst'])
+        if processed is not None:
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} task(s)."))
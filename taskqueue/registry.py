@@ -0,0 +1,76 @@
+# taskqueue/registry.py
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import Task
+
+DEFAULT_MAX_ATTEMPTS = 3
+# Seconds a claimed task stays invisible to other workers
+DEFAULT_TIMEOUT = 300
+
+_registry = {}
+
+
+class TaskDefinition:
+    def __init__(self, func, name, priority, max_attempts, timeout, on_failure=None):
+        self.func = func
+        self.name = name
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.on_failure = on_failure
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def run_eagerly(self, args, kwargs):
+        try:
+            self.func(*args, **kwargs)
+        except Exception:
+            # Eager tasks get a single attempt
+            if self.on_failure is not None:
+                self.on_failure(*args, **kwargs)
+            raise
+
+    def delay(self, *args, **kwargs):
+        return self.enqueue(args=args, kwargs=kwargs)
+
+    def enqueue(self, args=(), kwargs=None, priority=None, run_at=None):
+        """
+        Inserts a task row. Inside a transaction the row only becomes visible
+        to workers when it commits, so a task never sees uncommitted data.
+        With TASKS_RUN_EAGERLY = True the function runs inline instead
+        (after the surrounding transaction commits).
+        """
+        if getattr(settings, 'TASKS_RUN_EAGERLY', False):
+            transaction.on_commit(lambda: self.run_eagerly(args, kwargs or {}))
+            return None
+        fields = {
+            'name': self.name,
+            'args': list(args),
+            'kwargs': kwargs or {},
+            'priority': self.priority if priority is None else priority,
+            'max_attempts': self.max_attempts,
+        }
+        if run_at is not None:
+            fields['run_at'] = run_at
+        return Task.objects.create(**fields)
+
+
+def task(name=None, priority=0, max_attempts=DEFAULT_MAX_ATTEMPTS, timeout=DEFAULT_TIMEOUT, on_failure=None):
+    """
+    Registers a function as a background task. Arguments must be
+    JSON-serializable; call `.delay(...)` to enqueue it. `on_failure` is
+    called with the task's arguments once its last attempt has failed.
+    """
+    def decorator(func):
+        task_name = name or f"{func.__module__.split('.')[0]}.{func.__name__}"
+        definition = TaskDefinition(func, task_name, priority, max_attempts, timeout, on_failure)
+        _registry[task_name] = definition
+        return definition
+    return decorator
+
+
+def get_task(name):
+    return _registry[name]
@@ -0,0 +1,188 @@
+# taskqueue/worker.py
+
+import logging
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Task
+from .registry import DEFAULT_TIMEOUT, get_task
+
+logger = logging.getLogger(__name__)
+
+# Candidates looked at per claim; several workers racing for the same head
+# of the queue fall through to the next candidate
+CLAIM_CANDIDATES = 10
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def retry_delay(attempt):
+    """Exponential backoff with jitter: base * 2^(attempt-1), capped."""
+    base = getattr(settings, 'TASK_RETRY_BASE_DELAY', 10)
+    cap = getattr(settings, 'TASK_RETRY_MAX_DELAY', 3600)
+    delay = min(base * 2 ** (attempt - 1), cap)
+    return delay * random.uniform(1.0, 1.25)
+
+
+def _claimable(now):
+    # Queued and due, or running but abandoned (its visibility timeout passed)
+    return Q(status="queued", run_at__lte=now) | Q(status="running", locked_until__lt=now)
+
+
+def claim_task(worker_id):
+    """
+    Atomically marks the highest-priority due task as running for this
+    worker. The claim is a conditional UPDATE, so when two workers race for
+    the same row only one sees rowcount == 1.
+    """
+    now = timezone.now()
+    candidates = (
+        Task.objects.filter(_claimable(now))
+        .order_by('-priority', 'run_at', 'pk')
+        .values_list('pk', 'name')[:CLAIM_CANDIDATES]
+    )
+    for pk, name in candidates:
+        try:
+            timeout = get_task(name).timeout
+        except KeyError:
+            timeout = DEFAULT_TIMEOUT
+        claimed = Task.objects.filter(_claimable(now), pk=pk).update(
+            status="running",
+            locked_until=now + timedelta(seconds=timeout),
+            locked_by=worker_id,
+            attempts=F('attempts') + 1,
+        )
+        if claimed:
+            return Task.objects.get(pk=pk)
+    return None
+
+
+def _finish(task, worker_id, **fields):
+    # Only the current lock holder may record the outcome
+    return Task.objects.filter(pk=task.pk, locked_by=worker_id, status="running").update(**fields)
+
+
+def _give_up(definition, task):
+    """Runs the task's on_failure hook after its final attempt."""
+    if definition.on_failure is None:
+        return
+    try:
+        definition.on_failure(*task.args, **task.kwargs)
+    except Exception:
+        logger.exception("on_failure hook of task %s #%s failed", task.name, task.pk)
+
+
+def run_task(task, worker_id):
+    """Runs a claimed task and records success, a scheduled retry or the final failure."""
+    now = timezone.now()
+    try:
+        definition = get_task(task.name)
+    except KeyError:
+        _finish(task, worker_id, status="failed", finished_at=now, locked_until=None,
+                last_error=f"Unknown task {task.name!r}")
+        return False
+    if task.attempts > task.max_attempts:
+        if _finish(task, worker_id, status="failed", finished_at=now, locked_until=None,
+                   last_error=task.last_error or "Visibility timeout exceeded on every attempt"):
+            _give_up(definition, task)
+        return False
+
+    try:
+        definition.func(*task.args, **task.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        if task.attempts < task.max_attempts:
+            delay = retry_delay(task.attempts)
+            logger.warning("Task %s #%s failed (attempt %s), retrying in %.0fs", task.name, task.pk, task.attempts, delay)
+            _finish(task, worker_id, status="queued", locked_until=None, last_error=error,
+                    run_at=timezone.now() + timedelta(seconds=delay))
+        else:
+            logger.error("Task %s #%s failed permanently", task.name, task.pk)
+            if _finish(task, worker_id, status="failed", locked_until=None, last_error=error,
+                       finished_at=timezone.now()):
+                _give_up(definition, task)
+        return False
+
+    return bool(_finish(task, worker_id, status="succeeded", locked_until=None, finished_at=timezone.now()))
+
+
+def work(worker_id, stop_event, poll_interval=DEFAULT_POLL_INTERVAL, burst=False):
+    """
+    Claims and runs tasks until `stop_event` is set. With `burst` the
+    worker exits as soon as the queue is empty. Returns tasks processed.
+    """
+    processed = 0
+    while not stop_event.is_set():
+        close_old_connections()
+        task = claim_task(worker_id)
+        if task is None:
+            if burst:
+                break
+            stop_event.wait(poll_interval)
+            continue
+        run_task(task, worker_id)
+        processed += 1
+    connections.close_all()
+    return processed
+
+
+def _child_main(worker_id, stop_event, poll_interval, burst):
+    # Needed under the "spawn" start method; a no-op after fork
+    import django
+    django.setup()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    work(worker_id, stop_event, poll_interval, burst)
+
+
+def run_pool(processes, poll_interval=DEFAULT_POLL_INTERVAL, burst=False):
+    """
+    Runs `processes` worker processes until SIGINT/SIGTERM (or, with
+    `burst`, until the queue is drained). Crashed workers are restarted.
+    """
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+    if processes <= 1:
+        stop_event = multiprocessing.Event()
+        _install_stop_handlers(stop_event)
+        return work(f"{prefix}-0", stop_event, poll_interval, burst)
+
+    # Children must not inherit this process's database connections
+    connections.close_all()
+    stop_event = multiprocessing.Event()
+    _install_stop_handlers(stop_event)
+
+    def start(i):
+        process = multiprocessing.Process(
+            target=_child_main, args=(f"{prefix}-{i}", stop_event, poll_interval, burst), daemon=True,
+        )
+        process.start()
+        return process
+
+    pool = [start(i) for i in range(processes)]
+    while True:
+        for i, process in enumerate(pool):
+            process.join(timeout=poll_interval / len(pool))
+            if not process.is_alive() and process.exitcode != 0 and not stop_event.is_set():
+                logger.error("Worker %s exited with %s; restarting", i, process.exitcode)
+                pool[i] = start(i)
+        if stop_event.is_set() or all(not process.is_alive() for process in pool):
+            break
+    for process in pool:
+        process.join()
+    return None
+
+
+def _install_stop_handlers(stop_event):
+    def stop(signum, frame):
+        logger.info("Stopping workers after their current task")
+        stop_event.set()
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)